@@ -1,3 +1,19 @@
 from django.contrib import admin
+from .models.analysis import Analysis
 from .models.resume import Resume
-admin.site.register(Resume)
+from .models.search import SearchDocument
+
+
+@admin.register(Resume)
+class ResumeAdmin(admin.ModelAdmin):
+    list_display = ("filename", "uploaded_at", "content_hash")
+    readonly_fields = ("text_preview",)
+    exclude = ("layout",)
+
+    @admin.display(description="Text")
+    def text_preview(self, obj):
+        return obj.text[:2000]
+
+
+admin.site.register(Analysis)
+admin.site.register(SearchDocument)
@@ -0,0 +1,172 @@
+"""Bulk scoring of many resume files, streamed out as NDJSON.
+
+Used by the batch scoring endpoint and the ``score_resumes`` management
+command. Uploads (PDF, DOCX, or zip archives of them) are extracted one by
+one and scored through ``calculate_resume_scores``, which parses the texts
+in batches with spaCy's ``nlp.pipe``. Every input produces one JSON line,
+either its score or the reason it could not be scored; a bad file never
+stops the rest of the batch.
+"""
+import json
+import logging
+import os
+import zipfile
+from collections import deque
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.serializers.json import DjangoJSONEncoder
+
+from App.models.recieve import DOCUMENT_EXTRACTORS, DocumentTooLarge
+from App.utils.context import AnalysisContext
+from App.utils.rating import calculate_resume_scores
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_EXTENSIONS = (".zip",)
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def _extension(name: str) -> str:
+    return os.path.splitext(name)[1].lower()
+
+
+def is_scorable(name: str) -> bool:
+    """Whether ``name`` is a resume or archive the batch scorer accepts."""
+    extension = _extension(name)
+    return extension in DOCUMENT_EXTRACTORS or extension in ARCHIVE_EXTENSIONS
+
+
+def _archive_members(archive_name, archive):
+    """Yield ``(name, file or error)`` for the resumes inside a zip archive."""
+    max_bytes = getattr(settings, "RESUME_MAX_UPLOAD_BYTES", None)
+    with archive:
+        for info in archive.infolist():
+            member = info.filename
+            basename = os.path.basename(member)
+            if info.is_dir() or member.startswith("__MACOSX/") or basename.startswith("."):
+                continue
+            name = f"{archive_name}/{member}"
+            if _extension(member) not in DOCUMENT_EXTRACTORS:
+                yield name, "Unsupported file format."
+            elif max_bytes and info.file_size > max_bytes:
+                # Checked before decompressing anything
+                yield name, f"File is larger than the {max_bytes // (1024 * 1024)} MB upload limit."
+            else:
+                yield name, ContentFile(archive.read(info), name=basename)
+
+
+def iter_resume_files(files, max_files: int = None):
+    """
+    Yield ``(name, file)`` for every resume in ``files``, expanding zip archives.
+
+    Inputs that cannot be scored are yielded as ``(name, error message)``.
+
+    Args:
+        files: Uploaded files (or Django ``File`` objects) of PDFs, DOCXs and zips
+        max_files: Stop after this many resumes (defaults to ``SCORE_BATCH_MAX_FILES``)
+    """
+    if max_files is None:
+        max_files = getattr(settings, "SCORE_BATCH_MAX_FILES", 500)
+    count = 0
+    for file in files:
+        name = file.name
+        extension = _extension(name)
+        if extension in ARCHIVE_EXTENSIONS:
+            try:
+                archive = zipfile.ZipFile(file)
+            except zipfile.BadZipFile:
+                entries = [(name, "Not a valid zip archive.")]
+            else:
+                entries = _archive_members(name, archive)
+        elif extension in DOCUMENT_EXTRACTORS:
+            entries = [(name, file)]
+        else:
+            entries = [(name, "Unsupported file format.")]
+
+        for entry in entries:
+            if max_files and count >= max_files:
+                yield name, f"Batch limit of {max_files} resumes reached; remaining files were not scored."
+                return
+            count += 1
+            yield entry
+
+
+def extract_resumes(files, max_files: int = None):
+    """
+    Yield ``(name, AnalysisContext or error message)`` for every resume in ``files``.
+
+    Text and layout are extracted as on upload, so section detection works
+    the same way as in the single-resume views.
+    """
+    for name, file in iter_resume_files(files, max_files):
+        if isinstance(file, str):
+            yield name, file
+            continue
+        try:
+            document = DOCUMENT_EXTRACTORS[_extension(name)](file)
+        except DocumentTooLarge as exc:
+            yield name, str(exc)
+            continue
+        except Exception as exc:
+            logger.warning("Could not extract %s: %s", name, exc)
+            yield name, "Could not read the file; is it a valid PDF or DOCX?"
+            continue
+        if not document.text.strip():
+            yield name, "No text could be extracted."
+            continue
+        yield name, AnalysisContext(document.text, blocks=document.blocks)
+
+
+def score_files(files, batch_size: int = None, n_process: int = None, max_files: int = None):
+    """
+    Score every resume in ``files``; yields one record dict per resume.
+
+    Scores are yielded as soon as their spaCy batch is parsed. Records of
+    files that could not be extracted are emitted ahead of the next score,
+    so records can arrive slightly out of input order; each carries its
+    file name.
+
+    Args:
+        files: Uploaded files (or Django ``File`` objects) of PDFs, DOCXs and zips
+        batch_size: Texts per spaCy batch (defaults to ``SCORE_BATCH_SIZE``)
+        n_process: spaCy parsing processes (defaults to ``SCORE_N_PROCESS``)
+        max_files: Maximum number of resumes (defaults to ``SCORE_BATCH_MAX_FILES``)
+    """
+    if batch_size is None:
+        batch_size = getattr(settings, "SCORE_BATCH_SIZE", 32)
+    if n_process is None:
+        n_process = getattr(settings, "SCORE_N_PROCESS", 1)
+    failures = deque()
+
+    def contexts():
+        for name, resume in extract_resumes(files, max_files):
+            if isinstance(resume, str):
+                failures.append({"file": name, "error": resume})
+            else:
+                yield resume, name
+
+    for score, name in calculate_resume_scores(contexts(), batch_size=batch_size,
+                                               n_process=n_process, as_tuples=True):
+        while failures:
+            yield failures.popleft()
+        yield {
+            "file": name,
+            "score": score["final_score"],
+            "max_score": score["max_possible_score"],
+            "percentage": round(score["percentage"], 1),
+            "details": score,
+        }
+    while failures:
+        yield failures.popleft()
+
+
+def ndjson_line(record) -> str:
+    """One newline-terminated JSON line for ``record``."""
+    return json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+
+def ndjson_lines(records):
+    """Serialize ``records`` as newline-delimited JSON."""
+    for record in records:
+        yield ndjson_line(record)
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from App.models.resume import Resume
+
+DAY = 24 * 60 * 60
+# Names per ``IN (...)`` query
+NAME_CHUNK = 500
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete stored resume files that no resume references any more. Files "
+        "saved or reused within the grace period are kept, since an upload may "
+        "not have committed its row yet."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--grace-seconds", type=float, default=DAY,
+                            help="Keep files touched this recently (default: one day)")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="List the files that would be deleted")
+
+    def handle(self, *args, **options):
+        field = Resume._meta.get_field("uploaded_file")
+        storage = field.storage
+
+        def referenced(names):
+            for start in range(0, len(names), NAME_CHUNK):
+                yield from Resume.objects.filter(uploaded_file__in=names[start:start + NAME_CHUNK]).values_list(
+                    "uploaded_file", flat=True)
+
+        deleted = 0
+        for name, mtime in list(storage.unreferenced(field.upload_to, referenced, options["grace_seconds"])):
+            if options["dry_run"]:
+                self.stdout.write(name)
+                deleted += 1
+            elif storage.delete_if_unchanged(name, mtime):
+                deleted += 1
+        verb = "Would delete" if options["dry_run"] else "Deleted"
+        self.stderr.write(f"{verb} {deleted} unreferenced files.")
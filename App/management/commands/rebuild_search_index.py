@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from App.models.resume import Resume
+from App.models.search import SearchDocument, SkillPosting, TermPosting, index_resume, superseded_resumes
+from App.utils.semantic import corpus_fingerprint
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite the term and skill postings that job description search uses, "
+        "for every stored resume (or, with --stale, only the missing or outdated ones). "
+        "Of several uploads with the same content, only the latest is indexed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--stale", action="store_true",
+                            help="Only index resumes never indexed or indexed with another corpus")
+        parser.add_argument("--chunk-size", type=int, default=200,
+                            help="Resumes loaded from the database at a time (default: 200)")
+
+    def handle(self, *args, **options):
+        superseded = superseded_resumes().values("pk")
+        for model in (TermPosting, SkillPosting, SearchDocument):
+            model.objects.filter(resume__in=superseded).delete()
+
+        resumes = Resume.objects.with_text().exclude(pk__in=superseded).order_by("pk")
+        if options["stale"]:
+            resumes = resumes.filter(
+                Q(search_document__isnull=True) | ~Q(search_document__vocabulary=corpus_fingerprint()))
+
+        indexed = failed = 0
+        for resume in resumes.iterator(chunk_size=options["chunk_size"]):
+            try:
+                index_resume(resume)
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"Resume {resume.pk}: {exc}")
+            else:
+                indexed += 1
+        self.stderr.write(f"Indexed {indexed} resumes; {failed} could not be indexed.")
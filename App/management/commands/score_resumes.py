@@ -0,0 +1,66 @@
+import os
+
+from django.conf import settings
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+
+from App.batch_scoring import is_scorable, ndjson_line, score_files
+
+
+def _resume_paths(paths):
+    """The given files, plus every scorable file under the given directories, in order."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                for name in sorted(names):
+                    if is_scorable(name):
+                        yield os.path.join(root, name)
+        elif os.path.exists(path):
+            yield path
+        else:
+            raise CommandError(f"No such file or directory: {path}")
+
+
+def _open_files(paths):
+    for path in paths:
+        with open(path, "rb") as handle:
+            yield File(handle, name=path)
+
+
+class Command(BaseCommand):
+    help = (
+        "Score resume files (PDF, DOCX or zip archives of them) in bulk and write "
+        "one JSON line per resume. Texts are parsed in spaCy batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="Resume files, zip archives or directories")
+        parser.add_argument("--batch-size", type=int, default=settings.SCORE_BATCH_SIZE,
+                            help="Texts per spaCy batch (default: SCORE_BATCH_SIZE)")
+        parser.add_argument("--n-process", type=int, default=settings.SCORE_N_PROCESS,
+                            help="spaCy parsing processes (default: SCORE_N_PROCESS)")
+        parser.add_argument("--max-files", type=int, default=0,
+                            help="Stop after this many resumes (default: no limit)")
+        parser.add_argument("-o", "--output", help="Write NDJSON here instead of stdout")
+
+    def handle(self, *args, **options):
+        records = score_files(
+            _open_files(_resume_paths(options["paths"])),
+            batch_size=options["batch_size"],
+            n_process=options["n_process"],
+            max_files=options["max_files"],
+        )
+        output = open(options["output"], "w", encoding="utf-8") if options["output"] else self.stdout
+        scored = failed = 0
+        try:
+            for record in records:
+                output.write(ndjson_line(record))
+                if "error" in record:
+                    failed += 1
+                else:
+                    scored += 1
+        finally:
+            if options["output"]:
+                output.close()
+        self.stderr.write(f"Scored {scored} resumes; {failed} could not be scored.")
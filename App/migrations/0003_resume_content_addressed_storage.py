@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:22
+
+import App.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('App', '0002_resume_content_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resume',
+            name='uploaded_file',
+            field=models.FileField(storage=App.storage.get_resume_storage, upload_to='resumes/'),
+        ),
+    ]
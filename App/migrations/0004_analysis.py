@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:24
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('App', '0003_resume_content_addressed_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Analysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.CharField(max_length=64)),
+                ('rules_version', models.CharField(max_length=32)),
+                ('result', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='analyses', to='App.resume')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('resume', 'position', 'rules_version'), name='unique_resume_position_rules')],
+            },
+        ),
+    ]
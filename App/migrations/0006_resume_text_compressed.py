@@ -0,0 +1,58 @@
+import zlib
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def compress_texts(apps, schema_editor):
+    Resume = apps.get_model("App", "Resume")
+    batch = []
+    for resume in Resume.objects.only("pk", "text").iterator(chunk_size=BATCH_SIZE):
+        resume.text_compressed = zlib.compress(resume.text.encode("utf-8"), 6)
+        batch.append(resume)
+        if len(batch) >= BATCH_SIZE:
+            Resume.objects.bulk_update(batch, ["text_compressed"])
+            batch = []
+    if batch:
+        Resume.objects.bulk_update(batch, ["text_compressed"])
+
+
+def decompress_texts(apps, schema_editor):
+    Resume = apps.get_model("App", "Resume")
+    batch = []
+    for resume in Resume.objects.only("pk", "text_compressed").iterator(chunk_size=BATCH_SIZE):
+        data = resume.text_compressed
+        resume.text = zlib.decompress(bytes(data)).decode("utf-8") if data else ""
+        batch.append(resume)
+        if len(batch) >= BATCH_SIZE:
+            Resume.objects.bulk_update(batch, ["text"])
+            batch = []
+    if batch:
+        Resume.objects.bulk_update(batch, ["text"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("App", "0005_resume_uploaded_at_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="text_compressed",
+            field=models.BinaryField(default=b"", editable=False),
+        ),
+        # A default lets the reverse migration re-add the column before refilling it
+        migrations.AlterField(
+            model_name="resume",
+            name="text",
+            field=models.TextField(default=""),
+        ),
+        migrations.RunPython(compress_texts, decompress_texts),
+        migrations.RemoveField(
+            model_name="resume",
+            name="text",
+        ),
+    ]
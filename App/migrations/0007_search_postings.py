@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('App', '0006_resume_text_compressed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('resume', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='App.resume')),
+                ('vocabulary', models.CharField(max_length=64)),
+                ('indexed_at', models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SkillPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=128)),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_postings', to='App.resume')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill'], name='skillposting_skill')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TermPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=128)),
+                ('weight', models.FloatField()),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='term_postings', to='App.resume')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term'], name='termposting_term')],
+            },
+        ),
+    ]
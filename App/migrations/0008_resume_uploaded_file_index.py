@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:55
+
+import App.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('App', '0007_search_postings'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resume',
+            name='uploaded_file',
+            field=models.FileField(db_index=True, storage=App.storage.get_resume_storage, upload_to='resumes/'),
+        ),
+    ]
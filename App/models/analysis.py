@@ -0,0 +1,80 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from App.models.resume import Resume
+from App.utils.result_cache import rules_version
+
+
+class Analysis(models.Model):
+    """Position analysis of a resume, stored when the upload is analyzed."""
+
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="analyses")
+    position = models.CharField(max_length=64)
+    # result_cache.rules_version() the result was computed with
+    rules_version = models.CharField(max_length=32)
+    result = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "App"
+        constraints = [
+            # Also the index every lookup goes through
+            models.UniqueConstraint(
+                fields=["resume", "position", "rules_version"], name="unique_resume_position_rules"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.resume_id} / {self.position} ({self.rules_version})"
+
+
+def store_analysis(resume, position, result):
+    """Save ``result`` for ``(resume, position)`` under the current rules, dropping stale versions."""
+    version = rules_version()
+    Analysis.objects.filter(resume=resume, position=position).exclude(rules_version=version).delete()
+    analysis, _ = Analysis.objects.update_or_create(
+        resume=resume, position=position, rules_version=version, defaults={"result": result}
+    )
+    return analysis
+
+
+def latest_resume_pk():
+    """Subquery selecting the primary key of the most recently uploaded resume."""
+    return models.Subquery(Resume.objects.order_by("-uploaded_at").values("pk")[:1])
+
+
+def stored_analysis_result(resume, position):
+    """
+    Stored result for ``position`` of ``resume`` under the current rules version.
+
+    A single query through the (resume, position, rules_version) index.
+
+    Args:
+        resume: A Resume, its primary key, or a subquery such as ``latest_resume_pk()``
+        position: Target position
+
+    Returns:
+        The result dict, or None if there is none (or the resume does not exist)
+    """
+    return (Analysis.objects
+            .filter(resume=resume, position=position, rules_version=rules_version())
+            .values_list("result", flat=True)
+            .first())
+
+
+def position_analysis(resume, position):
+    """
+    Stored result for ``(resume, position)``, computed and stored if missing or stale.
+
+    Recomputation goes through EnhancedResumeAnalyzer with the resume's
+    stored layout, as on upload (on the analysis worker pool when enabled).
+    """
+    result = stored_analysis_result(resume, position)
+    if result is None:
+        from App.models.recieve import stored_document
+        from App.utils.analysis_pool import position_analysis_job, run_analysis
+
+        document = stored_document(resume)
+        result = run_analysis(position_analysis_job, document.text, document.blocks, position)
+        store_analysis(resume, position, result)
+    return result
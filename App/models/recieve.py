@@ -1,28 +1,275 @@
 # d:\RateMyResume\App\models\recieve.py
 
+import hashlib
+import os
+from typing import NamedTuple
+
 from django import forms
+from django.conf import settings
 from App.models.resume import Resume
+from App.models.search import index_upload
+from App.utils.context import AnalysisContext
+from App.utils import docx_xml
+from App.utils.layout import TextBlock, blocks_from_json, blocks_to_json
 import fitz  # PyMuPDF
-import docx
 
 
-def extract_text_from_pdf(file):
+class DocumentTooLarge(ValueError):
+    """Raised when an upload exceeds RESUME_MAX_UPLOAD_BYTES or RESUME_MAX_PAGES."""
+
+
+class UnsupportedDocument(ValueError):
+    """Raised for an upload whose extension has no entry in DOCUMENT_EXTRACTORS."""
+
+
+class ExtractedDocument(NamedTuple):
+    """Plain text of an upload plus its layout blocks (see App.utils.layout)."""
+    text: str
+    blocks: list
+
+
+def _upload_size(file):
+    """Size of an uploaded file in bytes, without reading it."""
+    size = getattr(file, "size", None)
+    if size is None:
+        position = file.tell()
+        size = file.seek(0, os.SEEK_END)
+        file.seek(position)
+    return size
+
+
+def check_upload_size(file):
+    """Raise DocumentTooLarge if the upload is bigger than RESUME_MAX_UPLOAD_BYTES."""
+    max_bytes = getattr(settings, "RESUME_MAX_UPLOAD_BYTES", None)
+    if max_bytes and _upload_size(file) > max_bytes:
+        raise DocumentTooLarge(
+            f"File is larger than the {max_bytes // (1024 * 1024)} MB upload limit."
+        )
+
+
+# DOCX parts are deflated XML; each may expand to this many times the upload limit
+DOCX_MAX_EXPANSION = 20
+
+
+def _open_pdf(file):
+    # Large uploads are spooled to disk by Django; let PyMuPDF read that file directly
+    temporary_file_path = getattr(file, "temporary_file_path", None)
+    if temporary_file_path is not None:
+        return fitz.open(temporary_file_path(), filetype="pdf")
     file.seek(0)
-    with fitz.open(stream=file.read(), filetype="pdf") as pdf:
-        text = ""
+    return fitz.open(stream=file.read(), filetype="pdf")
+
+
+def _check_page_count(page_count, max_pages=None):
+    if max_pages is None:
+        max_pages = getattr(settings, "RESUME_MAX_PAGES", None)
+    if max_pages and page_count > max_pages:
+        raise DocumentTooLarge(
+            f"PDF has {page_count} pages; the limit is {max_pages}."
+        )
+
+
+def iter_pdf_pages(file, max_pages=None):
+    """
+    Yield the text of each PDF page in order.
+
+    The upload size is checked before the document is opened and the page
+    count before any text is extracted, so oversized documents are rejected
+    without parsing them.
+    """
+    check_upload_size(file)
+    with _open_pdf(file) as pdf:
+        _check_page_count(pdf.page_count, max_pages)
         for page in pdf:
-            text += page.get_text()
-    return text
+            yield page.get_text()
+
+
+def extract_text_from_pdf(file):
+    return "".join(iter_pdf_pages(file))
+
+
+def _pdf_line_style(line):
+    """Font size and boldness of a PDF line from its non-blank spans."""
+    spans = [span for span in line["spans"] if span["text"].strip()]
+    size = round(max(span["size"] for span in spans), 1)
+    # Flag bit 4 is bold; some fonts only say so in their name
+    bold = all(span["flags"] & 16 or "bold" in span["font"].lower() for span in spans)
+    return size, bold
+
+
+def _pdf_page_blocks(page, number):
+    """Blocks of one page: consecutive lines of a PyMuPDF block sharing size and weight."""
+    blocks = []
+    for raw in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]:
+        current = None
+        for line in raw.get("lines", []):
+            text = "".join(span["text"] for span in line["spans"]).strip()
+            if not text:
+                continue
+            size, bold = _pdf_line_style(line)
+            bbox = tuple(round(value, 1) for value in line["bbox"])
+            if current is not None and (current.size, current.bold) == (size, bold):
+                merged = (current.bbox[0], current.bbox[1], max(current.bbox[2], bbox[2]), bbox[3])
+                current = current._replace(text=current.text + "\n" + text, bbox=merged)
+                blocks[-1] = current
+                continue
+            current = TextBlock(text, page=number, bbox=bbox, size=size, bold=bold)
+            blocks.append(current)
+    return blocks
+
+
+def extract_pdf_document(file, max_pages=None):
+    """
+    Extract a PDF's text together with its layout blocks.
+
+    Reads PyMuPDF's span dictionaries (text, font size, flags, bbox) once
+    and derives the plain text from them, one line per extracted line.
+    Limits are checked as in ``iter_pdf_pages``.
+    """
+    check_upload_size(file)
+    blocks = []
+    with _open_pdf(file) as pdf:
+        _check_page_count(pdf.page_count, max_pages)
+        for number, page in enumerate(pdf, start=1):
+            blocks.extend(_pdf_page_blocks(page, number))
+    return ExtractedDocument("".join(block.text + "\n" for block in blocks), blocks)
+
+
+def extract_docx_document(file):
+    """
+    Extract a DOCX's text together with its layout blocks.
+
+    The package XML is streamed by App.utils.docx_xml rather than loaded
+    into python-docx. Headers, paragraphs, tables and text boxes are read
+    in document order; table rows become " | "-separated lines of the text.
+    Each part's uncompressed size is checked against DOCX_MAX_EXPANSION
+    times RESUME_MAX_UPLOAD_BYTES before it is inflated.
+    """
+    check_upload_size(file)
+    max_bytes = getattr(settings, "RESUME_MAX_UPLOAD_BYTES", None)
+    max_part_bytes = max_bytes * DOCX_MAX_EXPANSION if max_bytes else None
+    temporary_file_path = getattr(file, "temporary_file_path", None)
+    if temporary_file_path is None:
+        file.seek(0)
+    try:
+        text, blocks = docx_xml.read_docx(
+            temporary_file_path() if temporary_file_path is not None else file, max_part_bytes)
+    except docx_xml.PartTooLarge as exc:
+        raise DocumentTooLarge(
+            f"DOCX content is larger than the {max_part_bytes // (1024 * 1024)} MB limit."
+        ) from exc
+    return ExtractedDocument(text, blocks)
 
 
 def extract_text_from_docx(file):
-    file.seek(0)
-    doc = docx.Document(file)
-    text = ""
-    for para in doc.paragraphs:
-        text += para.text + "\n"
-    return text
+    return extract_docx_document(file).text
+
+
+# Upload extension -> function returning an ExtractedDocument
+DOCUMENT_EXTRACTORS = {
+    ".pdf": extract_pdf_document,
+    ".docx": extract_docx_document,
+}
+
+
+def upload_content_hash(file):
+    """
+    SHA-256 hex digest of an upload's bytes.
+
+    Uploads received through App.upload_handlers already carry the digest
+    computed while the request body streamed in; other files are hashed
+    chunk by chunk once and the digest is remembered on the file.
+    """
+    content_hash = getattr(file, "content_hash", None)
+    if content_hash is None:
+        digest = hashlib.sha256()
+        file.seek(0)
+        for chunk in file.chunks():
+            digest.update(chunk)
+        file.seek(0)
+        content_hash = file.content_hash = digest.hexdigest()
+    return content_hash
+
+
+def find_extracted_resume(file):
+    """Return the newest Resume stored from the same bytes as ``file``, or None."""
+    return (Resume.objects.with_text().filter(content_hash=upload_content_hash(file))
+            .order_by("-uploaded_at").first())
+
+
+def stored_document(resume):
+    """The ExtractedDocument saved with ``resume``; blocks are empty if none were kept."""
+    return ExtractedDocument(resume.text, blocks_from_json(resume.layout or []))
+
+
+def save_resume(file, text, blocks=None, duplicate_of=None):
+    """
+    Create the Resume row for an upload.
+
+    Args:
+        file: The uploaded file
+        text: Extracted text
+        blocks: Layout blocks to keep with the text, if any
+        duplicate_of: Earlier Resume with the same content; its stored file
+            (and layout, when ``blocks`` is not given) is reused instead of
+            writing another copy
+
+    Returns:
+        The new Resume
+    """
+    layout = blocks_to_json(blocks) if blocks else []
+    uploaded_file = file
+    if duplicate_of is not None:
+        uploaded_file = duplicate_of.uploaded_file.name
+        # Keeps the orphan sweeper off the file until the new row is committed
+        duplicate_of.uploaded_file.storage.touch(uploaded_file)
+        if not blocks:
+            layout = duplicate_of.layout
+    return Resume.objects.create(
+        filename=file.name,
+        text=text,
+        uploaded_file=uploaded_file,
+        content_hash=upload_content_hash(file),
+        layout=layout,
+    )
+
+
+
+def ingest_upload(file):
+    """
+    Extract, store and index an uploaded resume.
+
+    An identical earlier upload's text and layout are reused when its
+    layout was kept; otherwise the document is extracted. The new Resume
+    shares the stored file with an identical upload and is indexed for
+    search through the returned context.
+
+    Args:
+        file: The uploaded PDF or DOCX
+
+    Returns:
+        ``(resume, ctx)``: the new Resume and the AnalysisContext to analyze
+        it with (its TF-IDF vector and skills already computed)
+
+    Raises:
+        UnsupportedDocument: The file is not a PDF or DOCX
+        DocumentTooLarge: The file is over the size or page limit
+    """
+    extract_document = DOCUMENT_EXTRACTORS.get(os.path.splitext(file.name)[1].lower())
+    if extract_document is None:
+        raise UnsupportedDocument("Unsupported file format. Please upload a PDF or DOCX file.")
+
+    previous = find_extracted_resume(file)
+    if previous is not None and previous.layout:
+        document = stored_document(previous)
+    else:
+        document = extract_document(file)
 
+    resume = save_resume(file, document.text, document.blocks, duplicate_of=previous)
+    # One context for search indexing and analysis: the text is vectorized once
+    ctx = AnalysisContext(document.text, blocks=document.blocks)
+    index_upload(resume, ctx)
+    return resume, ctx
 
 class ResumeForm(forms.ModelForm):
     class Meta:
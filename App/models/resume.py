@@ -1,11 +1,45 @@
+import zlib
+
 from django.db import models
 
+from App.storage import get_resume_storage
+
+# Columns too large to load with every row; read on first access
+DEFERRED_FIELDS = ("text_compressed", "layout")
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def decompress_text(data) -> str:
+    # PostgreSQL returns bytea columns as memoryview
+    return zlib.decompress(bytes(data)).decode("utf-8") if data else ""
+
+
+class ResumeManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().defer(*DEFERRED_FIELDS)
+
+    def with_text(self):
+        """Resumes with their text loaded up front (layout still deferred)."""
+        return super().get_queryset().defer("layout")
+
 
 class Resume(models.Model):
     filename = models.CharField(max_length=255)
-    text = models.TextField()
-    uploaded_at = models.DateTimeField(auto_now_add=True)
-    uploaded_file = models.FileField(upload_to='resumes/')
+    # zlib-compressed UTF-8 text; use the ``text`` property
+    text_compressed = models.BinaryField(default=b"", editable=False)
+    uploaded_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Stored once per distinct content; rows with equal bytes share the file.
+    # Files no row references are removed by ``manage.py delete_orphan_files``.
+    uploaded_file = models.FileField(upload_to='resumes/', storage=get_resume_storage, db_index=True)
+    # SHA-256 of the uploaded bytes; identical re-uploads reuse text and file
+    content_hash = models.CharField(max_length=64, blank=True, default="", db_index=True)
+    # Layout blocks from extraction (App.utils.layout.blocks_to_json)
+    layout = models.JSONField(default=list, blank=True)
+
+    objects = ResumeManager()
 
     class Meta:
         app_label = "App"
@@ -13,3 +47,16 @@ class Resume(models.Model):
     def __str__(self):
         return self.filename
 
+    @property
+    def text(self) -> str:
+        """Extracted resume text, decompressed on first access."""
+        cached = self.__dict__.get("_text")
+        if cached is None:
+            cached = self.__dict__["_text"] = decompress_text(self.text_compressed)
+        return cached
+
+    @text.setter
+    def text(self, value: str):
+        self.text_compressed = compress_text(value)
+        self.__dict__["_text"] = value
+
@@ -0,0 +1,147 @@
+import logging
+
+from django.db import models, transaction
+
+from App.models.resume import Resume
+
+logger = logging.getLogger(__name__)
+
+
+class SearchDocument(models.Model):
+    """Marks a resume as indexed for job description search (see ``App.resume_search``)."""
+
+    resume = models.OneToOneField(Resume, on_delete=models.CASCADE, primary_key=True,
+                                  related_name="search_document")
+    # semantic.corpus_fingerprint() the term weights were computed with
+    vocabulary = models.CharField(max_length=64)
+    indexed_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        app_label = "App"
+
+    def __str__(self):
+        return f"{self.resume_id} ({self.indexed_at:%Y-%m-%d %H:%M})"
+
+
+class TermPosting(models.Model):
+    """Weight of one term in a resume's L2-normalized TF-IDF vector."""
+
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="term_postings")
+    term = models.CharField(max_length=128)
+    weight = models.FloatField()
+
+    class Meta:
+        app_label = "App"
+        indexes = [models.Index(fields=["term"], name="termposting_term")]
+
+
+class SkillPosting(models.Model):
+    """A canonical skill found in a resume by the shared skill matcher."""
+
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="skill_postings")
+    skill = models.CharField(max_length=128)
+
+    class Meta:
+        app_label = "App"
+        indexes = [models.Index(fields=["skill"], name="skillposting_skill")]
+
+
+def resume_postings(text):
+    """
+    Term and skill postings of a resume text.
+
+    Returns:
+        ``([(term, weight), ...], sorted skills)``; term weights are the
+        resume's row in the shared semantic TF-IDF model
+    """
+    from App.utils.context import as_context
+    from App.utils.semantic import get_semantic_index
+
+    ctx = as_context(text)
+    vector = ctx.semantic_vector
+    feature_names = get_semantic_index().feature_names
+    terms = [(str(feature_names[index]), float(weight))
+             for index, weight in zip(vector.indices, vector.data) if weight]
+    return terms, sorted(ctx.skills)
+
+
+def index_resume(resume, text=None):
+    """
+    (Re)write the search postings of ``resume``.
+
+    Args:
+        resume: The Resume to index
+        text: Its text or AnalysisContext, if already at hand (else ``resume.text``)
+
+    Returns:
+        The resume's SearchDocument
+    """
+    from App.utils.semantic import corpus_fingerprint
+
+    terms, skills = resume_postings(resume.text if text is None else text)
+    with transaction.atomic():
+        TermPosting.objects.filter(resume=resume).delete()
+        SkillPosting.objects.filter(resume=resume).delete()
+        TermPosting.objects.bulk_create(
+            TermPosting(resume=resume, term=term, weight=weight) for term, weight in terms)
+        SkillPosting.objects.bulk_create(SkillPosting(resume=resume, skill=skill) for skill in skills)
+        # Saved last: a search index refreshes a resume when its indexed_at changes
+        document, _ = SearchDocument.objects.update_or_create(
+            resume=resume, defaults={"vocabulary": corpus_fingerprint()})
+    return document
+
+
+def superseded_resumes():
+    """Resumes with a later upload of the same content; only the latest one is searchable."""
+    latest = (Resume.objects.exclude(content_hash="").order_by().values("content_hash")
+              .annotate(latest=models.Max("pk")).values("latest"))
+    return Resume.objects.exclude(content_hash="").exclude(pk__in=latest)
+
+
+def move_postings(resume):
+    """
+    Hand the postings of an indexed upload with the same content over to ``resume``.
+
+    Identical uploads have identical postings, so a re-upload takes over the
+    earlier row's postings (and any other copies are dropped) instead of
+    adding another indexed copy of the same resume.
+
+    Returns:
+        The resume's SearchDocument, or None if no same-content upload is indexed
+    """
+    from App.utils.semantic import corpus_fingerprint
+
+    if not resume.content_hash:
+        return None
+    with transaction.atomic():
+        documents = list(SearchDocument.objects.select_for_update()
+                         .filter(resume__content_hash=resume.content_hash)
+                         .exclude(resume=resume).order_by("-resume_id"))
+        current = [document for document in documents if document.vocabulary == corpus_fingerprint()]
+        if not current:
+            return None
+        others = [document.resume_id for document in documents if document is not current[0]]
+        TermPosting.objects.filter(resume_id__in=others).delete()
+        SkillPosting.objects.filter(resume_id__in=others).delete()
+        TermPosting.objects.filter(resume_id=current[0].resume_id).update(resume=resume)
+        SkillPosting.objects.filter(resume_id=current[0].resume_id).update(resume=resume)
+        SearchDocument.objects.filter(resume_id__in=[document.resume_id for document in documents]).delete()
+        # Created last: a search index refreshes a resume when its indexed_at changes
+        return SearchDocument.objects.create(resume=resume, vocabulary=corpus_fingerprint())
+
+
+def index_upload(resume, text=None):
+    """
+    Index a fresh upload, reusing the postings of an identical earlier one.
+
+    A failure is logged and does not fail the upload.
+
+    Args:
+        resume: The new Resume
+        text: Its text or (preferably) the AnalysisContext the upload is analyzed with
+    """
+    try:
+        return move_postings(resume) or index_resume(resume, text)
+    except Exception:
+        logger.exception("Could not index resume %s for search", resume.pk)
+        return None
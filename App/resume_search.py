@@ -0,0 +1,310 @@
+"""Search of stored resumes by job description.
+
+Every upload is indexed by ``App.models.search.index_resume``. The resume's
+TF-IDF row in the shared semantic model is stored as term postings. The
+canonical skills the skill matcher finds are stored as skill postings.
+Those tables are the inverted index on disk. ``manage.py
+rebuild_search_index`` rewrites it, which is needed after changing
+``SEMANTIC_CORPUS_PATH``.
+
+Each process answers queries from an in-memory copy of the postings: one
+sparse resumes x terms matrix and one resumes x skills matrix. A job
+description is vectorized in the same model. Every resume is then scored
+with one sparse matrix-vector product, which gives the cosine similarity
+that semantic job matching reports. The best ``top`` resumes are picked
+with ``argpartition``, so the query costs about one pass over the
+postings, not one analysis per resume. The copy is loaded on the first
+search. After that, each search only reads resumes (re)indexed since the
+previous one, so uploads handled by other processes show up right away.
+"""
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+import numpy as np
+from scipy import sparse
+
+from App.models.resume import Resume
+from App.models.search import SearchDocument, SkillPosting, TermPosting
+from App.utils.context import as_context
+from App.utils.matching import get_skill_matcher
+from App.utils.semantic import get_semantic_index
+
+# Documents indexed this close to the newest one already loaded are read
+# again on refresh: concurrent uploads can commit out of timestamp order.
+REFRESH_OVERLAP = timedelta(minutes=1)
+# Resume ids per ``IN (...)`` query when loading postings
+ID_CHUNK = 500
+# Replaced and discarded rows stay in the matrices until they make up this
+# fraction of all rows; the matrices are then rebuilt from the live rows
+COMPACT_DEAD_FRACTION = 0.25
+
+
+@dataclass
+class SearchHit:
+    resume_id: int
+    similarity: float
+    matched_skills: list = field(default_factory=list)
+
+
+class _SparseRows:
+    """Sparse rows appended in blocks, over columns that grow as new keys appear."""
+
+    def __init__(self):
+        self.columns = {}
+        self.keys = []
+        self._blocks = []
+        self._matrix = None
+
+    def append(self, rows) -> None:
+        """Append one row per item of ``rows``, each an iterable of ``(key, value)``."""
+        indptr, indices, data = [0], [], []
+        for row in rows:
+            for key, value in row:
+                column = self.columns.get(key)
+                if column is None:
+                    column = self.columns[key] = len(self.keys)
+                    self.keys.append(key)
+                indices.append(column)
+                data.append(value)
+            indptr.append(len(indices))
+        self._blocks.append(sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), indptr),
+            shape=(len(indptr) - 1, len(self.keys))))
+        self._matrix = None
+
+    @property
+    def matrix(self) -> sparse.csr_matrix:
+        """All rows as one CSR matrix (blocks are merged on first access after an append)."""
+        if self._matrix is None:
+            for block in self._blocks:
+                block.resize((block.shape[0], len(self.keys)))
+            self._matrix = (sparse.vstack(self._blocks, format="csr") if self._blocks
+                            else sparse.csr_matrix((0, len(self.keys)), dtype=np.float32))
+            self._blocks = [self._matrix]
+        return self._matrix
+
+    def take(self, rows) -> None:
+        """Keep only ``rows`` (indices into ``matrix``), in that order."""
+        self._matrix = self.matrix[rows]
+        self._blocks = [self._matrix]
+
+    def vector(self, weights: dict) -> np.ndarray:
+        """Dense column vector of ``weights``; keys without a column are dropped."""
+        vector = np.zeros(len(self.keys), dtype=np.float32)
+        for key, weight in weights.items():
+            column = self.columns.get(key)
+            if column is not None:
+                vector[column] = weight
+        return vector
+
+
+class ResumeSearchIndex:
+    """In-memory copy of the search postings, ranking resumes against job descriptions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._terms = _SparseRows()
+        self._skills = _SparseRows()
+        self._resume_ids = []
+        self._alive = np.zeros(0, dtype=bool)
+        # resume id -> (row, indexed_at of the postings in that row)
+        self._rows = {}
+        self._latest = None
+
+    def __len__(self):
+        return int(self._alive.sum())
+
+    def stats(self) -> dict:
+        """Loaded resumes, rows (including replaced ones), distinct terms and skills, and postings."""
+        with self._lock:
+            return {
+                "resumes": len(self),
+                "rows": len(self._resume_ids),
+                "terms": len(self._terms.keys),
+                "skills": len(self._skills.keys),
+                "term_postings": int(self._terms.matrix.nnz),
+            }
+
+    def refresh(self) -> int:
+        """Load resumes indexed since the last refresh; returns how many rows were (re)loaded."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        documents = SearchDocument.objects.order_by()
+        if self._latest is not None:
+            documents = documents.filter(indexed_at__gte=self._latest - REFRESH_OVERLAP)
+        changed, latest = {}, self._latest
+        for resume_id, indexed_at in documents.values_list("resume_id", "indexed_at"):
+            latest = indexed_at if latest is None else max(latest, indexed_at)
+            loaded = self._rows.get(resume_id)
+            if loaded is None or loaded[1] != indexed_at:
+                changed[resume_id] = indexed_at
+        self._latest = latest
+        if not changed:
+            return 0
+
+        terms, skills = defaultdict(list), defaultdict(list)
+        ids = list(changed)
+        # The first load reads every posting; later ones only the changed resumes'
+        chunks = [None] if not self._rows else [ids[i:i + ID_CHUNK] for i in range(0, len(ids), ID_CHUNK)]
+        for chunk in chunks:
+            term_postings, skill_postings = TermPosting.objects.order_by(), SkillPosting.objects.order_by()
+            if chunk is not None:
+                term_postings = term_postings.filter(resume_id__in=chunk)
+                skill_postings = skill_postings.filter(resume_id__in=chunk)
+            for resume_id, term, weight in term_postings.values_list(
+                    "resume_id", "term", "weight").iterator(chunk_size=10000):
+                terms[resume_id].append((term, weight))
+            for resume_id, skill in skill_postings.values_list("resume_id", "skill").iterator(chunk_size=10000):
+                skills[resume_id].append((skill, 1.0))
+
+        return self._load([(resume_id, changed[resume_id], terms.get(resume_id, ()), skills.get(resume_id, ()))
+                           for resume_id in ids])
+
+    def load(self, entries) -> int:
+        """
+        Add (or replace) rows without reading the database.
+
+        Args:
+            entries: ``(resume_id, indexed_at, [(term, weight), ...], [(skill, 1.0), ...])`` tuples
+        """
+        with self._lock:
+            return self._load(list(entries))
+
+    def _load(self, entries) -> int:
+        for resume_id, _, _, _ in entries:
+            previous = self._rows.get(resume_id)
+            if previous is not None:
+                self._alive[previous[0]] = False
+        first = len(self._resume_ids)
+        self._terms.append(terms for _, _, terms, _ in entries)
+        self._skills.append(skills for _, _, _, skills in entries)
+        self._alive = np.concatenate([self._alive, np.ones(len(entries), dtype=bool)])
+        for offset, (resume_id, indexed_at, _, _) in enumerate(entries):
+            self._resume_ids.append(resume_id)
+            self._rows[resume_id] = (first + offset, indexed_at)
+        self._compact()
+        return len(entries)
+
+    def discard(self, resume_ids) -> None:
+        """Drop resumes from results (e.g. ones deleted since they were loaded)."""
+        with self._lock:
+            for resume_id in resume_ids:
+                loaded = self._rows.pop(resume_id, None)
+                if loaded is not None:
+                    self._alive[loaded[0]] = False
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop replaced and discarded rows once they exceed ``COMPACT_DEAD_FRACTION``."""
+        dead = len(self._resume_ids) - len(self)
+        if not dead or dead < COMPACT_DEAD_FRACTION * len(self._resume_ids):
+            return
+        keep = np.flatnonzero(self._alive)
+        self._terms.take(keep)
+        self._skills.take(keep)
+        self._resume_ids = [self._resume_ids[row] for row in keep]
+        self._alive = np.ones(len(keep), dtype=bool)
+        self._rows = {resume_id: (row, self._rows[resume_id][1]) for row, resume_id in enumerate(self._resume_ids)}
+
+    def search(self, text, top: int = 10, skills=()) -> list:
+        """
+        Resumes most similar to a job description, best first.
+
+        Args:
+            text: Job description text or AnalysisContext
+            top: Maximum number of hits
+            skills: Skills every hit must have (aliases are resolved)
+
+        Returns:
+            SearchHit list; ``matched_skills`` are the description's skills the resume has
+        """
+        if top < 1:
+            return []
+        ctx = as_context(text)
+        query = ctx.semantic_vector
+        feature_names = get_semantic_index().feature_names
+        query_weights = {str(feature_names[index]): weight for index, weight in zip(query.indices, query.data)}
+        required = set()
+        for skill in skills:
+            required |= get_skill_matcher().canonical(skill) or {skill.lower().strip()}
+
+        with self._lock:
+            self._refresh()
+            scores = self._terms.matrix @ self._terms.vector(query_weights)
+            keep = self._alive & (scores > 0)
+            if required:
+                if not required <= self._skills.columns.keys():
+                    return []
+                counts = self._skills.matrix @ self._skills.vector(dict.fromkeys(required, 1.0))
+                keep &= counts >= len(required)
+            candidates = np.flatnonzero(keep)
+            if len(candidates) > top:
+                candidates = candidates[np.argpartition(-scores[candidates], top - 1)[:top]]
+            # Ties go to the resume indexed first
+            candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+            wanted = self._skills.vector(dict.fromkeys(ctx.skills, 1.0))
+            skill_rows = self._skills.matrix
+            hits = []
+            for row in candidates:
+                columns = skill_rows.indices[skill_rows.indptr[row]:skill_rows.indptr[row + 1]]
+                hits.append(SearchHit(
+                    resume_id=self._resume_ids[row],
+                    similarity=float(scores[row]),
+                    matched_skills=sorted(self._skills.keys[column] for column in columns if wanted[column]),
+                ))
+        return hits
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> ResumeSearchIndex:
+    """Return the process-wide search index (loaded from the postings on the first search)."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = ResumeSearchIndex()
+    return _index
+
+
+def search_resumes(text, top: int = 10, skills=()) -> list:
+    """
+    Stored resumes ranked against a job description.
+
+    Resumes deleted or no longer indexed since the index loaded them (a
+    re-upload of the same content takes over the earlier upload's
+    postings) are dropped, and the search repeated, so up to ``top`` live
+    resumes are returned.
+
+    Returns:
+        ``{'resume_id', 'filename', 'uploaded_at', 'similarity_score', 'matched_skills'}``
+        dicts, best first; ``similarity_score`` is a percentage
+    """
+    index = get_search_index()
+    ctx = as_context(text)
+    while True:
+        hits = index.search(ctx, top, skills)
+        resumes = {resume["pk"]: resume for resume in
+                   Resume.objects.filter(pk__in=[hit.resume_id for hit in hits], search_document__isnull=False)
+                   .values("pk", "filename", "uploaded_at")}
+        missing = [hit.resume_id for hit in hits if hit.resume_id not in resumes]
+        if not missing:
+            break
+        index.discard(missing)
+    return [
+        {
+            "resume_id": hit.resume_id,
+            "filename": resumes[hit.resume_id]["filename"],
+            "uploaded_at": resumes[hit.resume_id]["uploaded_at"],
+            "similarity_score": round(hit.similarity * 100, 2),
+            "matched_skills": hit.matched_skills,
+        }
+        for hit in hits
+    ]
@@ -162,6 +162,78 @@ STATICFILES_DIRS = [_static_dir] if _static_dir.exists() else []
 MEDIA_URL = "/media/"
 MEDIA_ROOT = Path(cast(str, env("MEDIA_ROOT")))
 
+# Django's default upload handlers, plus a SHA-256 of each file computed as it
+# streams in; re-uploaded resumes reuse their stored text and file.
+FILE_UPLOAD_HANDLERS = [
+    "App.upload_handlers.HashingMemoryFileUploadHandler",
+    "App.upload_handlers.HashingTemporaryFileUploadHandler",
+]
+
+# Uploaded resumes larger than this, or PDFs with more pages, are rejected
+# before their text is extracted. The page limit admits long academic CVs;
+# serial extraction of a 60-page PDF takes about 75 ms (see
+# benchmarks/pdf_extraction.py), and each page adds to every analysis.
+RESUME_MAX_UPLOAD_BYTES = env.int("RESUME_MAX_UPLOAD_BYTES", default=10 * 1024 * 1024)
+RESUME_MAX_PAGES = env.int("RESUME_MAX_PAGES", default=60)
+
+# Resume analysis
+# Load the spaCy pipeline when the WSGI worker starts rather than lazily on
+# the first request that needs it.
+PRELOAD_NLP = env.bool("PRELOAD_NLP", default=not DEBUG)
+# Run resume analysis on a pool of ANALYSIS_WORKERS processes (each preloads
+# spaCy once) so concurrent uploads are not serialized on the GIL; 0 runs it
+# in the request thread. Views give up on a job after ANALYSIS_TIMEOUT_SECONDS
+# (keep it below gunicorn's --timeout).
+ANALYSIS_WORKERS = env.int("ANALYSIS_WORKERS", default=0)
+ANALYSIS_TIMEOUT_SECONDS = env.int("ANALYSIS_TIMEOUT_SECONDS", default=120)
+# Bulk scoring (POST /api/score/batch/ and `manage.py score_resumes`): texts
+# are parsed by spaCy in batches of SCORE_BATCH_SIZE across SCORE_N_PROCESS
+# processes. Keep SCORE_N_PROCESS at 1 for the web endpoint under a threaded
+# server; raise it on the command line with --n-process instead.
+SCORE_BATCH_SIZE = env.int("SCORE_BATCH_SIZE", default=32)
+SCORE_N_PROCESS = env.int("SCORE_N_PROCESS", default=1)
+SCORE_BATCH_MAX_FILES = env.int("SCORE_BATCH_MAX_FILES", default=500)
+# Reference corpus the semantic job matcher fits its TF-IDF weights on, one
+# document per blank-line separated paragraph (empty: the bundled corpus).
+SEMANTIC_CORPUS_PATH = env("SEMANTIC_CORPUS_PATH", default="")
+
+# Analysis result cache (App/utils/result_cache.py). Results are keyed by the
+# resume text hash, position and scoring-rules version. Set
+# ANALYSIS_CACHE_URL (e.g. dbcache://analysis_cache on SQLite/Postgres, then
+# run `manage.py createcachetable`) to add a persistent tier.
+SCORING_RULES_VERSION = env("SCORING_RULES_VERSION", default="")
+ANALYSIS_CACHE_SIZE = env.int("ANALYSIS_CACHE_SIZE", default=256)
+ANALYSIS_CACHE_TIMEOUT = env.int("ANALYSIS_CACHE_TIMEOUT", default=7 * 24 * 3600)
+ANALYSIS_CACHE_ALIAS = ""
+
+# Chart rendering: "deferred" renders dashboard/analysis charts in a background
+# thread pool and serves them from /charts/<analysis_id>/<chart>.png; "inline"
+# embeds them in the page. Deferred charts live in process memory, so run a
+# single worker process (more threads are fine) when using it.
+CHART_RENDERING = env("CHART_RENDERING", default="deferred")
+CHART_RENDER_WORKERS = env.int("CHART_RENDER_WORKERS", default=1)
+CHART_JOB_LIMIT = env.int("CHART_JOB_LIMIT", default=64)
+# A chart request waits at most CHART_WAIT_SECONDS for its render, then
+# answers 503 + Retry-After so request threads are never held; the pages
+# poll until the image arrives (chart_poll_script.html).
+CHART_WAIT_SECONDS = env.float("CHART_WAIT_SECONDS", default=0.25)
+
+# Rendered chart images are cached by chart type and input values
+# (App/utils/chart_cache.py). CHART_CACHE_DISK adds a tier under
+# MEDIA_ROOT/chart_cache that survives restarts.
+CHART_CACHE_SIZE = env.int("CHART_CACHE_SIZE", default=2048)
+CHART_CACHE_MAX_BYTES = env.int("CHART_CACHE_MAX_BYTES", default=32 * 1024 * 1024)
+CHART_CACHE_DISK = env.bool("CHART_CACHE_DISK", default=False)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+if os.getenv("ANALYSIS_CACHE_URL"):
+    CACHES["analysis"] = env.cache_url("ANALYSIS_CACHE_URL")
+    ANALYSIS_CACHE_ALIAS = "analysis"
+
 if not DEBUG:
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
     SECURE_SSL_REDIRECT = env.bool("SECURE_SSL_REDIRECT", default=False)
@@ -0,0 +1,130 @@
+"""Content-addressed storage for uploaded resume files.
+
+Each file is stored once, under the SHA-256 of its bytes in the field's
+``upload_to`` directory (``resumes/ab/abcdef....pdf``). Saving content that is already stored
+writes nothing and returns the existing name, so any number of ``Resume``
+rows can point at one file. New files are written to a temporary file in
+the target directory and renamed into place, so readers never see a
+partial file.
+
+Files are never deleted when a ``Resume`` row goes away: a concurrent
+upload of the same content may be about to point a new row at the file.
+``manage.py delete_orphan_files`` removes files that no row references.
+Every save (or reuse) of a file refreshes its modification time, and files
+touched within the sweeper's grace period are left alone, which covers the
+gap between storing a file and committing the row that references it.
+"""
+import hashlib
+import os
+import posixpath
+import tempfile
+import time
+
+from django.core.files.storage import FileSystemStorage
+
+
+def content_hash(content) -> str:
+    """SHA-256 hex digest of ``content``, reusing one computed on upload."""
+    digest = getattr(content, "content_hash", None)
+    if digest is not None:
+        return digest
+    sha256 = hashlib.sha256()
+    if hasattr(content, "seek"):
+        content.seek(0)
+    for chunk in content.chunks():
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """File system storage that names files by the hash of their contents."""
+
+    def hashed_name(self, digest: str, name: str) -> str:
+        """Storage name for content with hash ``digest`` proposed as ``name``."""
+        directory, filename = posixpath.split(name)
+        extension = os.path.splitext(filename)[1].lower()
+        return posixpath.join(directory, digest[:2], digest + extension)
+
+    def get_available_name(self, name, max_length=None):
+        # Names are chosen from the content in _save; never add a random suffix
+        return name
+
+    def touch(self, name: str) -> None:
+        """Mark a stored file as in use, so the orphan sweeper leaves it alone for now."""
+        try:
+            os.utime(self.path(name))
+        except FileNotFoundError:
+            pass
+
+    def unreferenced(self, directory: str, referenced, grace_seconds: float):
+        """
+        Yield stored files no row references, skipping recently used ones.
+
+        Args:
+            directory: Storage directory to sweep (``upload_to`` of the field)
+            referenced: Callable taking a list of names and returning the referenced subset
+            grace_seconds: Files modified more recently than this are skipped
+
+        Yields:
+            ``(name, mtime)`` of each file that can be deleted
+        """
+        cutoff = time.time() - grace_seconds
+        root = self.path(directory)
+        for subdirectory, _, filenames in os.walk(root):
+            candidates = {}
+            for filename in filenames:
+                if filename.endswith(".tmp"):
+                    continue
+                path = os.path.join(subdirectory, filename)
+                mtime = os.stat(path).st_mtime
+                if mtime < cutoff:
+                    relative = os.path.relpath(path, self.location).replace(os.sep, "/")
+                    candidates[relative] = mtime
+            if candidates:
+                in_use = set(referenced(list(candidates)))
+                yield from ((name, mtime) for name, mtime in candidates.items() if name not in in_use)
+
+    def delete_if_unchanged(self, name: str, mtime: float) -> bool:
+        """Delete ``name`` unless it was saved again (touched) since ``mtime`` was read."""
+        try:
+            if os.stat(self.path(name)).st_mtime != mtime:
+                return False
+        except FileNotFoundError:
+            return False
+        self.delete(name)
+        return True
+
+    def _save(self, name, content):
+        name = self.hashed_name(content_hash(content), name)
+        if self.exists(name):
+            self.touch(name)
+            return name
+
+        path = self.path(name)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        if self.directory_permissions_mode is not None:
+            os.chmod(directory, self.directory_permissions_mode)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    tmp.write(chunk)
+            os.chmod(tmp_path, self.file_permissions_mode or 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return name
+
+
+resume_storage = ContentAddressedStorage()
+
+
+def get_resume_storage():
+    """Storage for ``Resume.uploaded_file`` (a callable keeps it out of migrations)."""
+    return resume_storage
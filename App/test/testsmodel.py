@@ -6,6 +6,7 @@ os.environ["SECURE_SSL_REDIRECT"] = "False"
 os.environ.setdefault("MPLCONFIGDIR", "/tmp")
 django.setup()
 
+import io
 import re
 import types
 from unittest.mock import patch
@@ -14,6 +15,7 @@ from django.test import TestCase
 
 import App.utils.rating as rating
 from App.models.resume import Resume
+from App.utils.result_cache import analysis_cache
 
 
 def _doc_with_ents(ents):
@@ -75,6 +77,8 @@ Experience:
 
 class ResumeModelComplexTest(TestCase):
     def setUp(self):
+        # Each test mocks spaCy differently; never reuse a cached score
+        analysis_cache.clear()
         self.resume = Resume.objects.create(
             filename='complex_resume.pdf',
             text=COMPLEX_RESUME,
@@ -177,3 +181,596 @@ class ResumeModelComplexTest(TestCase):
         self.assertEqual(r.text, COMPLEX_RESUME)
         # uploaded_file is a FieldFile; check its .name string
         self.assertTrue(r.uploaded_file.name.endswith('complex_resume.pdf'))
+
+    @patch.object(rating, "tool", create=True)
+    @patch.object(rating, "nlp", create=True)
+    def test_calculate_resume_score_parses_resume_once(self, mock_nlp, mock_tool):
+        mock_nlp.side_effect = lambda text: _doc_with_ents(
+            [("University of Example", "ORG")])
+        mock_tool.check.return_value = []
+
+        ctx = rating.AnalysisContext(COMPLEX_RESUME)
+        details = rating.calculate_resume_score(ctx)
+        rating.get_personal_info(ctx)
+
+        self.assertEqual(mock_nlp.call_count, 1)
+        self.assertEqual(details, rating.calculate_resume_score(COMPLEX_RESUME))
+
+
+def _pdf_bytes(pages):
+    import fitz
+
+    with fitz.open() as pdf:
+        for text in pages:
+            pdf.new_page().insert_text((72, 72), text)
+        return pdf.tobytes()
+
+
+class ResumeExtractionTest(TestCase):
+    def test_pdf_pages_are_extracted_in_order(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from App.models.recieve import extract_text_from_pdf
+
+        upload = SimpleUploadedFile("resume.pdf", _pdf_bytes(["Page one", "Page two", "Page three"]))
+
+        text = extract_text_from_pdf(upload)
+
+        self.assertLess(text.index("Page one"), text.index("Page two"))
+        self.assertLess(text.index("Page two"), text.index("Page three"))
+
+    def test_pdf_is_read_from_temporary_file_when_spooled(self):
+        from django.core.files.uploadedfile import TemporaryUploadedFile
+        from App.models.recieve import extract_text_from_pdf
+
+        data = _pdf_bytes(["Spooled resume"])
+        upload = TemporaryUploadedFile("resume.pdf", "application/pdf", len(data), None)
+        upload.write(data)
+        upload.flush()
+
+        import fitz
+
+        with patch("App.models.recieve.fitz.open", wraps=fitz.open) as mock_open:
+            self.assertIn("Spooled resume", extract_text_from_pdf(upload))
+        mock_open.assert_called_once_with(upload.temporary_file_path(), filetype="pdf")
+        upload.close()
+
+    def test_page_and_size_limits_abort_extraction(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from App.models.recieve import DocumentTooLarge, extract_text_from_pdf
+
+        data = _pdf_bytes(["a", "b", "c"])
+
+        with self.settings(RESUME_MAX_PAGES=2):
+            with self.assertRaises(DocumentTooLarge):
+                extract_text_from_pdf(SimpleUploadedFile("resume.pdf", data))
+        with self.settings(RESUME_MAX_UPLOAD_BYTES=len(data) - 1):
+            with self.assertRaises(DocumentTooLarge):
+                extract_text_from_pdf(SimpleUploadedFile("resume.pdf", data))
+
+    def test_pdf_blocks_carry_font_size_and_weight(self):
+        import fitz
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from App.models.recieve import extract_pdf_document
+
+        with fitz.open() as pdf:
+            page = pdf.new_page()
+            page.insert_text((72, 72), "Projects", fontsize=14, fontname="hebo")
+            page.insert_text((72, 96), "Resume parser", fontsize=10)
+            data = pdf.tobytes()
+
+        document = extract_pdf_document(SimpleUploadedFile("resume.pdf", data))
+
+        heading, body = document.blocks
+        self.assertEqual((heading.text, heading.page, heading.size, heading.bold),
+                         ("Projects", 1, 14.0, True))
+        self.assertEqual((body.text, body.size, body.bold), ("Resume parser", 10.0, False))
+        self.assertEqual(document.text, "Projects\nResume parser\n")
+
+    def test_docx_tables_are_extracted(self):
+        import io
+        import docx
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from App.models.recieve import extract_docx_document, extract_text_from_docx
+
+        doc = docx.Document()
+        doc.add_heading("Skills", 1)
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text, table.cell(0, 1).text = "Python", "Django"
+        table.cell(1, 0).merge(table.cell(1, 1)).text = "Kubernetes"
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        upload = SimpleUploadedFile("resume.docx", buffer.getvalue())
+
+        document = extract_docx_document(upload)
+
+        self.assertEqual(document.blocks[0].style, "Heading 1")
+        self.assertEqual(document.blocks[1].cells, (("Python", "Django"), ("Kubernetes",)))
+        self.assertIn("Python | Django\nKubernetes", extract_text_from_docx(upload))
+
+
+class ResumeReuseTest(TestCase):
+    def test_uploads_are_hashed_while_streaming(self):
+        import hashlib
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from django.test import RequestFactory
+
+        data = _pdf_bytes(["Hashed resume"])
+        request = RequestFactory().post("/", {"resume": SimpleUploadedFile("resume.pdf", data)})
+
+        self.assertEqual(request.FILES["resume"].content_hash, hashlib.sha256(data).hexdigest())
+
+    def test_reupload_reuses_text_layout_and_stored_file(self):
+        import tempfile
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from App.models.recieve import (
+            extract_pdf_document, find_extracted_resume, save_resume, stored_document,
+        )
+
+        data = _pdf_bytes(["Projects", "Resume parser"])
+        with tempfile.TemporaryDirectory() as media, self.settings(MEDIA_ROOT=media):
+            upload = SimpleUploadedFile("resume.pdf", data)
+            document = extract_pdf_document(upload)
+            first = save_resume(upload, document.text, document.blocks)
+
+            again = SimpleUploadedFile("resume (1).pdf", data)
+            previous = find_extracted_resume(again)
+            second = save_resume(again, previous.text, duplicate_of=previous)
+
+        self.assertEqual(previous, first)
+        self.assertEqual(stored_document(previous), document)
+        self.assertEqual(second.uploaded_file.name, first.uploaded_file.name)
+        self.assertEqual(second.filename, "resume (1).pdf")
+        self.assertIsNone(find_extracted_resume(SimpleUploadedFile("other.pdf", _pdf_bytes(["x"]))))
+
+
+    def test_ingest_upload_extracts_stores_and_indexes_once_per_content(self):
+        import tempfile
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from App.models.recieve import UnsupportedDocument, ingest_upload
+        from App.models.search import SearchDocument
+
+        data = _pdf_bytes(["Skills", "Python and Django"])
+        with tempfile.TemporaryDirectory() as media, self.settings(MEDIA_ROOT=media):
+            first, ctx = ingest_upload(SimpleUploadedFile("cv.pdf", data))
+            second, again = ingest_upload(SimpleUploadedFile("cv (1).pdf", data))
+
+            with self.assertRaises(UnsupportedDocument):
+                ingest_upload(SimpleUploadedFile("cv.txt", b"text"))
+
+        self.assertIn("Python and Django", ctx.text)
+        self.assertEqual((again.text, again.blocks), (ctx.text, ctx.blocks))
+        self.assertEqual(second.uploaded_file.name, first.uploaded_file.name)
+        self.assertEqual(list(SearchDocument.objects.values_list("resume_id", flat=True)), [second.pk])
+
+class ResumeStorageTest(TestCase):
+    def test_identical_files_are_stored_once_and_swept_when_unreferenced(self):
+        import hashlib
+        import tempfile
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from django.core.management import call_command
+
+        data = _pdf_bytes(["Stored once"])
+        digest = hashlib.sha256(data).hexdigest()
+        with tempfile.TemporaryDirectory() as media, self.settings(MEDIA_ROOT=media):
+            first, second = (
+                Resume.objects.create(filename=name, text="x",
+                                      uploaded_file=SimpleUploadedFile(name, data))
+                for name in ("Resume.pdf", "Resume.PDF")
+            )
+            storage = first.uploaded_file.storage
+
+            self.assertEqual(first.uploaded_file.name, f"resumes/{digest[:2]}/{digest}.pdf")
+            self.assertEqual(second.uploaded_file.name, first.uploaded_file.name)
+            self.assertEqual(os.listdir(os.path.join(media, "resumes", digest[:2])), [digest + ".pdf"])
+
+            name = second.uploaded_file.name
+            first.delete()
+            second.delete()
+            # Deleting rows never deletes files; an upload may be reusing this one
+            self.assertTrue(storage.exists(name))
+
+            call_command("delete_orphan_files", stderr=io.StringIO())
+            self.assertTrue(storage.exists(name))  # Still within the grace period
+
+            old = storage.path(name)
+            os.utime(old, (0, 0))
+            third = Resume.objects.create(filename="again.pdf", text="x",
+                                          uploaded_file=SimpleUploadedFile("again.pdf", data))
+            os.utime(old, (0, 0))
+            call_command("delete_orphan_files", grace_seconds=60, stderr=io.StringIO())
+            self.assertTrue(storage.exists(name))  # Referenced again
+
+            third.delete()
+            call_command("delete_orphan_files", grace_seconds=60, stderr=io.StringIO())
+            self.assertFalse(storage.exists(name))
+
+    def test_reusing_a_stored_file_keeps_it_from_the_sweeper(self):
+        import tempfile
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        with tempfile.TemporaryDirectory() as media, self.settings(MEDIA_ROOT=media):
+            resume = Resume.objects.create(filename="r.pdf", text="x",
+                                           uploaded_file=SimpleUploadedFile("r.pdf", b"%PDF-1.4"))
+            storage = resume.uploaded_file.storage
+            name = resume.uploaded_file.name
+            os.utime(storage.path(name), (0, 0))
+            resume.delete()
+            [(orphan, mtime)] = storage.unreferenced("resumes/", lambda names: [], 60)
+
+            # A concurrent upload of the same bytes before the sweeper deletes the file
+            storage.save("resumes/r.pdf", SimpleUploadedFile("r.pdf", b"%PDF-1.4"))
+
+            self.assertEqual(orphan, name)
+            self.assertFalse(storage.delete_if_unchanged(orphan, mtime))
+            self.assertTrue(storage.exists(name))
+
+    def test_text_is_stored_compressed_and_loaded_on_demand(self):
+        text = COMPLEX_RESUME * 5
+        resume = Resume.objects.create(filename="r.pdf", text=text, uploaded_file="resumes/r.pdf")
+        self.assertLess(len(resume.text_compressed), len(text.encode("utf-8")) / 2)
+
+        listed = Resume.objects.get(pk=resume.pk)
+        self.assertEqual(listed.get_deferred_fields(), {"text_compressed", "layout"})
+        with self.assertNumQueries(1):
+            self.assertEqual(listed.text, text)
+
+        loaded = Resume.objects.with_text().get(pk=resume.pk)
+        self.assertEqual(loaded.get_deferred_fields(), {"layout"})
+        with self.assertNumQueries(0):
+            self.assertEqual(loaded.text, text)
+
+
+class AnalysisPersistenceTest(TestCase):
+    RESULT = {
+        "position_score": {"weighted_score": 71.5, "grade": "B"},
+        "skills_analysis": {"required_found": ["python"]},
+        "suggestions": {"critical": [], "important": ["x"], "nice_to_have": []},
+        "base_analysis": {"final_score": 64},
+        "charts_data": {},
+    }
+
+    def setUp(self):
+        self.resume = Resume.objects.create(filename="r.pdf", text="Python", uploaded_file="resumes/r.pdf")
+
+    def _remember(self, resume):
+        session = self.client.session
+        session["resume_id"] = resume.pk
+        session.save()
+
+    def test_api_serves_stored_analysis_without_recomputing(self):
+        from App.models.analysis import store_analysis
+
+        store_analysis(self.resume, "data_scientist", self.RESULT)
+        self._remember(self.resume)
+
+        with patch("App.utils.enhana.EnhancedResumeAnalyzer.analyze_for_position") as analyze:
+            # The session, then the stored analysis
+            with self.assertNumQueries(2):
+                response = self.client.get("/api/dashboard/", {"position": "data_scientist"})
+
+        analyze.assert_not_called()
+        self.assertEqual(response.json()["overall_score"], 71.5)
+        self.assertEqual(response.json()["suggestions_count"]["important"], 1)
+
+    def test_stale_rules_version_is_recomputed_and_replaced(self):
+        from App.models.analysis import Analysis, latest_resume_pk, stored_analysis_result, store_analysis
+
+        with patch("App.models.analysis.rules_version", return_value="old"):
+            store_analysis(self.resume, "data_scientist", {"stale": True})
+        self.assertIsNone(stored_analysis_result(latest_resume_pk(), "data_scientist"))
+        self._remember(self.resume)
+
+        with patch("App.utils.enhana.EnhancedResumeAnalyzer.analyze_for_position",
+                   return_value=self.RESULT) as analyze:
+            response = self.client.get("/api/analysis/", {"position": "data_scientist"})
+
+        analyze.assert_called_once()
+        self.assertEqual(response.json()["grade"], "B")
+        self.assertEqual(list(Analysis.objects.values_list("result", flat=True)), [self.RESULT])
+
+    def test_unknown_position_is_rejected_without_storing_anything(self):
+        from App.models.analysis import Analysis
+
+        self._remember(self.resume)
+        with patch("App.utils.enhana.EnhancedResumeAnalyzer.analyze_for_position") as analyze:
+            for url in ("/api/dashboard/", "/api/analysis/", f"/api/resumes/{self.resume.pk}/analysis/"):
+                response = self.client.get(url, {"position": "x" * 100})
+                self.assertEqual(response.status_code, 400)
+
+        analyze.assert_not_called()
+        self.assertFalse(Analysis.objects.exists())
+
+    def test_resume_scoped_api_and_session_resume(self):
+        from App.models.analysis import store_analysis
+
+        other = Resume.objects.create(filename="later.pdf", text="Go", uploaded_file="resumes/later.pdf")
+        store_analysis(self.resume, "data_scientist", self.RESULT)
+        url = f"/api/resumes/{self.resume.pk}/analysis/"
+
+        # Only the visitor who uploaded a resume (or staff) can read it by id
+        self.assertEqual(self.client.get(url, {"position": "data_scientist"}).status_code, 404)
+        self._remember(self.resume)
+
+        response = self.client.get(url, {"position": "data_scientist"})
+        self.assertEqual(response.json()["resume_id"], self.resume.pk)
+        self.assertEqual(response.json()["overall_score"], 71.5)
+        self.assertEqual(self.client.get(f"/api/resumes/{other.pk}/analysis/").status_code, 404)
+
+        # The session's resume wins over a later upload by someone else
+        Resume.objects.filter(pk=other.pk).update(uploaded_at=self.resume.uploaded_at.replace(year=2100))
+        response = self.client.get("/api/analysis/", {"position": "data_scientist"})
+        self.assertEqual(response.json()["grade"], "B")
+
+    def test_visitor_without_a_resume_never_sees_someone_elses(self):
+        from django.contrib.auth.models import User
+        from App.models.analysis import store_analysis
+
+        store_analysis(self.resume, "data_scientist", self.RESULT)
+        for url in ("/api/dashboard/", "/api/analysis/"):
+            self.assertEqual(self.client.get(url, {"position": "data_scientist"}).json(),
+                             {"error": "No resume found"})
+        self.assertContains(self.client.get("/compare/"), "No resume found for comparison")
+
+        # A session whose resume was deleted does not fall back to the latest upload either
+        gone = Resume.objects.create(filename="gone.pdf", text="Go", uploaded_file="resumes/gone.pdf")
+        self._remember(gone)
+        gone.delete()
+        self.assertEqual(self.client.get("/api/analysis/", {"position": "data_scientist"}).json(),
+                         {"error": "No resume found"})
+
+        self.client.force_login(User.objects.create_user("staff", password="x", is_staff=True))
+        self.assertEqual(self.client.get("/api/analysis/", {"position": "data_scientist"}).json()["grade"], "B")
+
+
+class BatchScoringTest(TestCase):
+    def setUp(self):
+        analysis_cache.clear()
+
+    @staticmethod
+    def _pipe(items, **kwargs):
+        return ((_doc_with_ents([("Example Corp", "ORG")]), context) for _, context in items)
+
+    @patch.object(rating, "tool", create=True)
+    @patch.object(rating, "nlp", create=True)
+    def test_batch_parses_with_pipe_and_matches_single_scores(self, mock_nlp, mock_tool):
+        mock_nlp.side_effect = lambda text: _doc_with_ents([("Example Corp", "ORG")])
+        mock_nlp.pipe.side_effect = self._pipe
+        mock_tool.check.return_value = []
+        texts = [COMPLEX_RESUME + f"\nProject {number}: search engine in Rust\n" for number in range(3)]
+        cached = rating.calculate_resume_score(texts[1])
+        mock_nlp.reset_mock()
+
+        scores = list(rating.calculate_resume_scores(texts, batch_size=2))
+
+        mock_nlp.assert_not_called()
+        mock_nlp.pipe.assert_called_once()
+        self.assertEqual(mock_nlp.pipe.call_args.kwargs["batch_size"], 2)
+        self.assertEqual(scores[1], cached)
+        self.assertEqual(scores, [rating.calculate_resume_score(text) for text in texts])
+
+    @patch.object(rating, "tool", create=True)
+    @patch.object(rating, "nlp", create=True)
+    def test_batch_endpoint_streams_ndjson_for_files_and_zips(self, mock_nlp, mock_tool):
+        import io
+        import json
+        import zipfile
+        from django.contrib.auth.models import User
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from django.urls import reverse
+
+        self.assertEqual(self.client.post(reverse("score_batch_api")).status_code, 302)
+        self.client.force_login(User.objects.create_user("staff", password="x", is_staff=True))
+        mock_nlp.pipe.side_effect = self._pipe
+        mock_tool.check.return_value = []
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zipped:
+            zipped.writestr("cv/b.pdf", _pdf_bytes(["Bob Builder\nSkills\nPython, Docker"]))
+            zipped.writestr("cv/notes.txt", "not a resume")
+            zipped.writestr("__MACOSX/cv/._b.pdf", "metadata")
+
+        response = self.client.post(reverse("score_batch_api"), {"resumes": [
+            SimpleUploadedFile("a.pdf", _pdf_bytes(["Alice Smith\nExperience\nEngineer at Acme"])),
+            SimpleUploadedFile("broken.pdf", b"not a pdf"),
+            SimpleUploadedFile("batch.zip", archive.getvalue()),
+        ]})
+        with self.assertLogs("App.batch_scoring", "WARNING"):
+            records = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual({record["file"] for record in records},
+                         {"a.pdf", "broken.pdf", "batch.zip/cv/b.pdf", "batch.zip/cv/notes.txt"})
+        by_file = {record["file"]: record for record in records}
+        self.assertIn("error", by_file["broken.pdf"])
+        self.assertIn("error", by_file["batch.zip/cv/notes.txt"])
+        self.assertEqual(by_file["a.pdf"]["score"], by_file["a.pdf"]["details"]["final_score"])
+        self.assertEqual(mock_nlp.pipe.call_count, 1)
+        self.assertEqual(self.client.post(reverse("score_batch_api")).status_code, 400)
+
+
+class PositionComparisonTest(TestCase):
+    POSITIONS = ["software_engineer", "data_scientist", "product_manager", "marketing_manager"]
+
+    def setUp(self):
+        analysis_cache.clear()
+
+    @staticmethod
+    def _parse(text):
+        sentences = [types.SimpleNamespace(text=line) for line in text.split("\n") if line.strip()]
+        return types.SimpleNamespace(ents=[], sents=sentences)
+
+    @patch.object(rating, "nlp", create=True)
+    def test_multi_position_analysis_matches_per_position_analysis(self, mock_nlp):
+        from App.utils.enchanced_paid import AdvancedResumeAnalyzer
+
+        mock_nlp.side_effect = self._parse
+        analyzer = AdvancedResumeAnalyzer()
+        single = {position: analyzer.comprehensive_analysis(COMPLEX_RESUME, position)
+                  for position in self.POSITIONS}
+        analysis_cache.clear()
+
+        with patch.object(analyzer, "calculate_ats_score", wraps=analyzer.calculate_ats_score) as ats, \
+                patch.object(analyzer, "semantic_job_matches", wraps=analyzer.semantic_job_matches) as semantic:
+            multi = analyzer.comprehensive_analyses(COMPLEX_RESUME, self.POSITIONS)
+
+        ats.assert_called_once()
+        semantic.assert_called_once()
+        self.assertEqual(list(multi), self.POSITIONS)
+        for position in self.POSITIONS:
+            expected, actual = single[position], multi[position]
+            self.assertAlmostEqual(actual["semantic_analysis"].pop("similarity_score"),
+                                   expected["semantic_analysis"].pop("similarity_score"), places=9)
+            self.assertEqual(actual, expected)
+        self.assertIsNot(multi["data_scientist"]["ats_analysis"], multi["product_manager"]["ats_analysis"])
+        # Now cached: nothing is recomputed
+        with patch.object(analyzer, "calculate_ats_score") as ats:
+            analyzer.comprehensive_analyses(COMPLEX_RESUME, self.POSITIONS)
+        ats.assert_not_called()
+
+    def test_best_fit_positions_rank_every_position(self):
+        from App.utils.enchanced_paid import AdvancedResumeAnalyzer
+
+        analyzer = AdvancedResumeAnalyzer()
+        ranked = analyzer.best_fit_positions(COMPLEX_RESUME)
+        matches = analyzer.semantic_job_matches(COMPLEX_RESUME, self.POSITIONS)
+
+        self.assertEqual(sorted(match["position"] for match in ranked), sorted(self.POSITIONS))
+        self.assertEqual(ranked[0]["position"], "software_engineer")
+        scores = [match["similarity_score"] for match in ranked]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        for match in ranked:
+            self.assertAlmostEqual(match["similarity_score"], matches[match["position"]]["similarity_score"])
+        self.assertEqual(analyzer.best_fit_positions(COMPLEX_RESUME, top=2), ranked[:2])
+
+        from django.contrib.auth.models import User
+
+        resume = Resume.objects.create(filename="cv.pdf", text=COMPLEX_RESUME)
+        self.assertEqual(self.client.get(f"/api/resumes/{resume.pk}/best-positions/").status_code, 404)
+        self.client.force_login(User.objects.create_user("staff", password="x", is_staff=True))
+        response = self.client.get(f"/api/resumes/{resume.pk}/best-positions/", {"top": "1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["best_position"], "software_engineer")
+        self.assertEqual(len(response.json()["positions"]), 1)
+        self.assertEqual(self.client.get(f"/api/resumes/{resume.pk}/best-positions/", {"top": "x"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/resumes/999999/best-positions/").status_code, 404)
+
+
+class ResumeSearchTest(TestCase):
+    BACKEND = "Backend engineer building REST APIs in Python and Django with PostgreSQL and Docker."
+    DATA = "Data scientist using Python, pandas and scikit-learn for machine learning and statistics."
+    MARKETING = "Marketing manager running SEO, content marketing and social media campaigns."
+
+    def setUp(self):
+        from App import resume_search
+
+        analysis_cache.clear()
+        patcher = patch.object(resume_search, "_index", resume_search.ResumeSearchIndex())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.resumes = {}
+        for name, text in [("backend", self.BACKEND), ("data", self.DATA), ("marketing", self.MARKETING)]:
+            self.resumes[name] = Resume.objects.create(filename=f"{name}.pdf", text=text)
+
+    def _index_all(self):
+        from App.models.search import index_resume
+
+        for resume in self.resumes.values():
+            index_resume(resume)
+
+    def test_ranks_stored_resumes_by_tf_idf_cosine(self):
+        from App.models.search import TermPosting
+        from App.resume_search import search_resumes
+        from App.utils.semantic import get_semantic_index
+
+        self._index_all()
+        query = "Looking for a Python Django backend engineer who builds REST APIs"
+        results = search_resumes(query, top=2)
+
+        self.assertEqual([hit["resume_id"] for hit in results][:1], [self.resumes["backend"].pk])
+        self.assertLessEqual(len(results), 2)
+        self.assertIn("django", results[0]["matched_skills"])
+        index = get_semantic_index()
+        expected = index.transform(query).multiply(index.transform(self.BACKEND)).sum() * 100
+        self.assertAlmostEqual(results[0]["similarity_score"], expected, places=2)
+        self.assertTrue(TermPosting.objects.filter(resume=self.resumes["backend"], term="django").exists())
+
+        # Required skills filter through the skill postings
+        results = search_resumes("Python developer", skills=["pandas"])
+        self.assertEqual([hit["resume_id"] for hit in results], [self.resumes["data"].pk])
+        self.assertEqual(search_resumes("Python developer", skills=["cobol"]), [])
+
+    def test_new_and_deleted_resumes_are_picked_up_incrementally(self):
+        from App.models.search import index_resume
+        from App.resume_search import get_search_index, search_resumes
+
+        self._index_all()
+        query = "SEO and social media marketing campaigns"
+        self.assertEqual(search_resumes(query, top=1)[0]["resume_id"], self.resumes["marketing"].pk)
+
+        newcomer = Resume.objects.create(filename="seo.pdf", text="SEO, social media and marketing campaigns for SEO.")
+        index_resume(newcomer)
+        self.resumes["marketing"].delete()
+
+        ids = [hit["resume_id"] for hit in search_resumes(query)]
+        self.assertIn(newcomer.pk, ids)
+        self.assertNotIn(self.resumes["marketing"].pk, ids)
+        self.assertEqual(len(get_search_index()), 3)
+
+    def test_replaced_and_discarded_rows_are_compacted(self):
+        from App.resume_search import ResumeSearchIndex
+
+        index = ResumeSearchIndex()
+        index.load((resume_id, None, [("python", 1.0)], [("python", 1.0)]) for resume_id in range(1, 9))
+        index.load([(1, "again", [("django", 1.0)], [])])
+        self.assertEqual(index.stats()["rows"], 9)  # Below the dead-row fraction
+
+        index.discard([2, 3])
+        stats = index.stats()
+        self.assertEqual((stats["resumes"], stats["rows"], stats["term_postings"]), (6, 6, 6))
+        self.assertEqual([hit.resume_id for hit in index.search("django", top=10)], [1])
+        self.assertEqual(sorted(hit.resume_id for hit in index.search("python", top=10)), [4, 5, 6, 7, 8])
+        self.assertEqual(sorted(hit.resume_id for hit in index.search("python", skills=["python"])),
+                         [4, 5, 6, 7, 8])
+
+    def test_identical_reupload_takes_over_the_indexed_postings(self):
+        from django.core.management import call_command
+        from App.models.search import SearchDocument, TermPosting, index_upload
+        from App.resume_search import search_resumes
+        from App.utils.context import AnalysisContext
+
+        Resume.objects.filter(pk=self.resumes["data"].pk).update(content_hash="d" * 64)
+        first = Resume.objects.get(pk=self.resumes["data"].pk)
+        self.assertIsNotNone(index_upload(first, AnalysisContext(self.DATA)))
+        postings = TermPosting.objects.count()
+        query = "machine learning with pandas"
+        self.assertEqual([hit["resume_id"] for hit in search_resumes(query)], [first.pk])
+
+        again = Resume.objects.create(filename="data (1).pdf", text=self.DATA, content_hash="d" * 64)
+        with patch("App.models.search.resume_postings") as postings_of:
+            index_upload(again, AnalysisContext(self.DATA))
+        postings_of.assert_not_called()
+
+        self.assertEqual(TermPosting.objects.count(), postings)
+        self.assertEqual(list(SearchDocument.objects.values_list("resume_id", flat=True)), [again.pk])
+        self.assertEqual([hit["resume_id"] for hit in search_resumes(query)], [again.pk])
+
+        # A rebuild indexes the latest upload of each content only
+        call_command("rebuild_search_index", stderr=io.StringIO())
+        self.assertNotIn(first.pk, SearchDocument.objects.values_list("resume_id", flat=True))
+        self.assertEqual(SearchDocument.objects.count(), 3)
+
+    def test_rebuild_command_and_search_api(self):
+        from django.contrib.auth.models import User
+        from django.core.management import call_command
+        from App.models.search import SearchDocument
+
+        call_command("rebuild_search_index", "--stale", stderr=io.StringIO())
+        self.assertEqual(SearchDocument.objects.count(), 3)
+
+        url = "/api/resumes/search/"
+        self.assertEqual(self.client.get(url, {"q": "python"}).status_code, 302)
+        self.client.force_login(User.objects.create_user("staff", password="x", is_staff=True))
+        response = self.client.post(url, {"q": "machine learning with pandas", "top": "1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([hit["resume_id"] for hit in response.json()["results"]], [self.resumes["data"].pk])
+        self.assertEqual(self.client.get(url).status_code, 400)
+        self.assertEqual(self.client.get(url, {"q": "python", "top": "0"}).status_code, 400)
@@ -0,0 +1,509 @@
+import json
+import os
+import tempfile
+import django
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "App.settings")
+os.environ["DEBUG"] = "True"
+os.environ["SECURE_SSL_REDIRECT"] = "False"
+os.environ.setdefault("MPLCONFIGDIR", "/tmp")
+django.setup()
+
+from django.test import SimpleTestCase
+
+from App.utils import (
+    analysis_pool, chart_cache, chart_jobs, common, docx_xml, figure_templates, layout, line_scanner, matching,
+    pipelines, result_cache, semantic,
+)
+
+
+class PipelineRegistryTest(SimpleTestCase):
+    def setUp(self):
+        self._saved = (dict(pipelines._pipelines), dict(pipelines._stats))
+        pipelines._pipelines.clear()
+        pipelines._stats.clear()
+
+    def tearDown(self):
+        pipelines._pipelines.clear()
+        pipelines._stats.clear()
+        pipelines._pipelines.update(self._saved[0])
+        pipelines._stats.update(self._saved[1])
+
+    @patch("App.utils.pipelines.spacy.load")
+    def test_pipeline_is_loaded_once_across_threads(self, mock_load):
+        mock_load.return_value = object()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(pipelines.get_pipeline("fake_model")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_load.assert_called_once_with("fake_model")
+        self.assertTrue(all(nlp is mock_load.return_value for nlp in results))
+        stats = pipelines.pipeline_stats()["fake_model"]
+        self.assertIn("load_seconds", stats)
+        self.assertIn("rss_delta_bytes", stats)
+
+    @patch("App.utils.pipelines.spacy.load")
+    def test_common_and_advanced_analyzer_share_instance(self, mock_load):
+        from App.utils.enchanced_paid import AdvancedResumeAnalyzer
+
+        mock_load.return_value = object()
+        self.assertIs(common.get_nlp(), AdvancedResumeAnalyzer().nlp)
+        self.assertIs(common.nlp.resolve(), common.get_nlp())
+        mock_load.assert_called_once()
+
+
+class AnalysisCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.cache = result_cache.AnalysisCache()
+
+    def test_identical_text_and_position_hit_the_cache(self):
+        calls = []
+        compute = lambda: calls.append(1) or {"score": 1, "items": []}
+
+        first = self.cache.get_or_compute("kind", "resume text", "pm", compute)
+        first["items"].append("mutated by caller")
+        second = self.cache.get_or_compute("kind", "resume text", "pm", compute)
+        self.cache.get_or_compute("kind", "resume text", "se", compute)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(second, {"score": 1, "items": []})
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_rule_table_change_and_invalidate_force_recompute(self):
+        calls = []
+        compute = lambda: calls.append(1) or {"score": len(calls)}
+        table = {"python": 2}
+        result_cache.register_rules("tests.table", table)
+
+        self.cache.get_or_compute("kind", "text", None, compute)
+        table["python"] = 3
+        result_cache.register_rules("tests.table", table)
+        self.cache.get_or_compute("kind", "text", None, compute)
+        self.cache.invalidate()
+        self.cache.get_or_compute("kind", "text", None, compute)
+
+        self.assertEqual(len(calls), 3)
+        result_cache._rule_fingerprints.pop("tests.table")
+        result_cache._rules_version = None
+
+    def test_invalidate_reaches_other_processes_through_the_persistent_tier(self):
+        from django.core.cache import caches
+        from django.test import override_settings
+
+        shared = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "generation-test"}
+        with override_settings(CACHES={"default": shared, "analysis": shared}, ANALYSIS_CACHE_ALIAS="analysis"), \
+                patch.object(result_cache, "GENERATION_CHECK_SECONDS", 0):
+            self.addCleanup(caches["analysis"].clear)
+            calls = []
+            compute = lambda: calls.append(1) or {"score": len(calls)}
+            # Another worker process, sharing only the persistent tier
+            worker = result_cache.AnalysisCache()
+
+            worker.get_or_compute("kind", "text", None, compute)
+            worker.get_or_compute("kind", "text", None, compute)
+            self.cache.get_or_compute("kind", "text", None, compute)
+            self.assertEqual(len(calls), 1)
+
+            self.cache.invalidate()
+            worker.get_or_compute("kind", "text", None, compute)
+            # A restarted process sees the stored generation too
+            result_cache.AnalysisCache().get_or_compute("kind", "text", None, compute)
+
+        self.assertEqual(len(calls), 2)
+
+
+class SkillMatcherTest(SimpleTestCase):
+    def test_reports_overlapping_hits_with_offsets_in_one_pass(self):
+        matcher = matching.SkillMatcher(["java", "javascript", "machine learning", "c++"])
+        text = "javascript, c++ and machine learning"
+
+        hits = list(matcher.finditer(text))
+
+        self.assertIn(matching.SkillHit(0, 10, "javascript"), hits)
+        self.assertIn(matching.SkillHit(12, 15, "c++"), hits)
+        self.assertIn(matching.SkillHit(20, 36, "machine learning"), hits)
+        # "java" is a prefix of "javascript" but not a whole word there
+        self.assertNotIn("java", {hit.term for hit in hits})
+
+    def test_short_skills_do_not_match_inside_words(self):
+        matcher = matching.SkillMatcher(["r", "go", "sql"])
+
+        self.assertEqual(matcher.find_terms("good programmer using postgresql"), set())
+        self.assertEqual(matcher.find_terms("r, go and sql"), {"r", "go", "sql"})
+
+    def test_aliases_report_canonical_skill(self):
+        matcher = matching.SkillMatcher(aliases={"postgresql": ["postgres"], "javascript": ["js"]})
+
+        self.assertEqual(matcher.find_skills("postgres and js"), {"postgresql", "javascript"})
+        self.assertEqual(matcher.canonical("js"), {"javascript"})
+
+    def test_shared_matcher_covers_all_skill_tables(self):
+        matcher = matching.get_skill_matcher()
+
+        for term in ["matlab", "wireframing", "hootsuite", "nodejs"]:
+            self.assertIn(term, matcher)
+
+
+class LineScannerTest(SimpleTestCase):
+    def test_scan_matches_per_line_rescans(self):
+        text = "Jane Doe\n\n\nExperience\nLed a team lead group of 5 people\n\n  \nBuilt APIs\r\n\n"
+        scan = line_scanner.get_line_scanner().scan(text)
+
+        self.assertEqual(scan.word_count, len(text.split()))
+        self.assertEqual(scan.double_newlines, text.count("\n\n"))
+        self.assertEqual(scan.experience_heading, 3)
+        self.assertEqual([line.index for line in scan.with_group("leadership")], [4])
+        self.assertTrue(scan.lines[4].quantified)
+        self.assertEqual(scan.group_terms("action_verbs"), {"led", "built"})
+
+    def test_lines_containing_uses_substring_semantics(self):
+        scan = line_scanner.get_line_scanner().scan("Java developer\nJavaScript and React\nGo")
+
+        self.assertEqual([line.index for line in scan.lines_containing("java")], [0, 1])
+        self.assertEqual([line.index for line in scan.lines_containing("react")], [1])
+        self.assertEqual([line.index for line in scan.lines_containing("not a skill")], [])
+
+
+class LayoutSectionsTest(SimpleTestCase):
+    BLOCKS = [
+        layout.TextBlock("Jane Doe", size=20.0, bold=True),
+        layout.TextBlock("jane@example.com", size=10.0),
+        layout.TextBlock("PROJECTS", size=14.0, bold=True),
+        layout.TextBlock("• Resume parser\n• Chart service", size=10.0),
+        layout.TextBlock("Volunteer Work", size=14.0),
+        layout.TextBlock("Food bank driver", size=10.0),
+        layout.TextBlock("Certifications: AWS Solutions Architect, CKAD", size=10.0),
+    ]
+
+    def test_sections_follow_headings(self):
+        sections = layout.detect_sections(self.BLOCKS)
+
+        self.assertEqual(sections["projects"].lines, ["Resume parser", "Chart service"])
+        # A larger font marks an unknown heading, which ends the previous section
+        self.assertEqual(sections["volunteer work"].lines, ["Food bank driver"])
+        self.assertEqual(sections["certifications"].inline, "AWS Solutions Architect, CKAD")
+
+    def test_extractors_prefer_detected_sections(self):
+        from App.utils.context import AnalysisContext
+        from App.utils.extractors import extract_certifications, extract_projects
+
+        text = "".join(block.text + "\n" for block in self.BLOCKS)
+        ctx = AnalysisContext(text, blocks=self.BLOCKS)
+
+        self.assertCountEqual(extract_projects(ctx)["projects"], ["Resume parser", "Chart service"])
+        self.assertCountEqual(extract_certifications(ctx)["certifications"],
+                              ["AWS Solutions Architect", "CKAD"])
+        self.assertNotEqual(ctx.cache_key, AnalysisContext(text).cache_key)
+
+
+class DocxXmlTest(SimpleTestCase):
+    NS = ('xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+          'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"')
+
+    def _docx(self, body, header=None):
+        import io
+        import zipfile
+
+        styles = (f'<w:styles {self.NS}>'
+                  '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+                  '<w:name w:val="Normal"/></w:style>'
+                  '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/>'
+                  '<w:rPr><w:b/><w:sz w:val="32"/></w:rPr></w:style></w:styles>')
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("word/document.xml", f'<w:document {self.NS}><w:body>{body}</w:body></w:document>')
+            archive.writestr("word/styles.xml", styles)
+            if header:
+                archive.writestr("word/header1.xml", f'<w:hdr {self.NS}>{header}</w:hdr>')
+                archive.writestr("word/header2.xml", f'<w:hdr {self.NS}>{header}</w:hdr>')
+        buffer.seek(0)
+        return buffer
+
+    def test_reads_headers_tables_and_text_boxes(self):
+        textbox = '<w:txbxContent><w:p><w:r><w:t>{}</w:t></w:r></w:p></w:txbxContent>'
+        body = (
+            '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Skills</w:t></w:r></w:p>'
+            '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Python</w:t></w:r></w:p></w:tc>'
+            '<w:tc><w:p><w:r><w:t>SQL</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+            '<w:p/>'
+            '<w:p><w:r><mc:AlternateContent><mc:Choice>' + textbox.format("Sidebar") + '</mc:Choice>'
+            '<mc:Fallback>' + textbox.format("Sidebar") + '</mc:Fallback></mc:AlternateContent></w:r>'
+            '<w:r><w:rPr><w:b/></w:rPr><w:t>Anchor</w:t></w:r></w:p>'
+        )
+        header = '<w:p><w:r><w:t>Jane Doe</w:t><w:tab/><w:t>jane@example.com</w:t></w:r></w:p>'
+
+        text, blocks = docx_xml.read_docx(self._docx(body, header))
+
+        self.assertEqual(text, "Jane Doe\tjane@example.com\nSkills\nPython | SQL\n\nSidebar\nAnchor\n")
+        self.assertEqual(blocks[1], layout.TextBlock("Skills", size=16.0, bold=True, style="Heading 1"))
+        self.assertEqual(blocks[2].cells, (("Python", "SQL"),))
+        self.assertEqual(blocks[4], layout.TextBlock("Anchor", bold=True, style="Normal"))
+
+    def test_part_over_the_size_limit_is_rejected_before_decompressing(self):
+        body = "<w:p><w:r><w:t>{}</w:t></w:r></w:p>".format("A" * 100000)
+        docx = self._docx(body)
+
+        with patch.object(docx_xml, "iter_part_items") as parse:
+            with self.assertRaises(docx_xml.PartTooLarge):
+                docx_xml.read_docx(docx, max_part_bytes=50000)
+        parse.assert_not_called()
+
+        docx.seek(0)
+        text, _ = docx_xml.read_docx(docx, max_part_bytes=200000)
+        self.assertEqual(len(text), 100001)
+
+
+class ChartJobsTest(SimpleTestCase):
+    def tearDown(self):
+        chart_jobs.chart_jobs.clear()
+
+    def test_inline_mode_embeds_data_uri(self):
+        sources = chart_jobs.chart_sources({"gauge": lambda: b"png", "empty": lambda: ""}, chart_jobs.INLINE)
+
+        self.assertEqual(sources["gauge"], "data:image/png;base64,cG5n")
+        self.assertEqual(sources["empty"], "")
+
+    def test_deferred_chart_is_served_from_its_url(self):
+        sources = chart_jobs.chart_sources({"gauge": lambda: b"png"}, chart_jobs.DEFERRED)
+
+        response = self.client.get(sources["gauge"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(response.content, b"png")
+        self.assertEqual(self.client.get(sources["gauge"].replace("gauge", "radar")).status_code, 404)
+
+    def test_chart_still_rendering_answers_503_without_holding_the_thread(self):
+        import time
+
+        release = threading.Event()
+        sources = chart_jobs.chart_sources({"gauge": lambda: release.wait(5) and b"png"}, chart_jobs.DEFERRED)
+
+        started = time.monotonic()
+        response = self.client.get(sources["gauge"])
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+
+        release.set()
+        chart_jobs.chart_jobs.get(sources["gauge"].split("/")[2], "gauge").result(timeout=5)
+        self.assertEqual(self.client.get(sources["gauge"]).status_code, 200)
+
+    def test_store_drops_oldest_analysis(self):
+        jobs = chart_jobs.ChartJobs(max_workers=1, max_analyses=2)
+        first = jobs.submit({"gauge": lambda: b"1"})
+        jobs.submit({"gauge": lambda: b"2"})
+        jobs.submit({"gauge": lambda: b"3"})
+
+        self.assertEqual(len(jobs), 2)
+        self.assertIsNone(jobs.get(first, "gauge"))
+
+    def test_client_mode_returns_json_specs_without_rendering(self):
+        from App.utils.dashgen import ResumeDashboard
+
+        dashboard = ResumeDashboard(chart_mode=chart_jobs.CLIENT)
+        analysis = {
+            "position_score": {"weighted_score": 72.5, "experience_score": 40.0, "skills_score": 80.0,
+                               "education_score": 100.0, "projects_score": 20.0},
+            "base_analysis": {"experience_score": 6, "tech_skills_score": 12, "red_flags": ["x"]},
+            "skills_analysis": {"required_found": ["python"], "required_missing": ["sql"],
+                                "preferred_found": [], "preferred_missing": ["aws"]},
+            "suggestions": {"critical": [{"category": "Skills", "impact": "High"}],
+                            "important": [{"category": "Experience", "impact": "Medium"},
+                                          {"category": "Skills", "impact": "Low"}],
+                            "nice_to_have": []},
+        }
+
+        with patch.object(dashboard.analyzer, "analyze_for_position", return_value=analysis), \
+                patch.object(ResumeDashboard, "_fig_to_png") as fig_to_png:
+            data = dashboard.generate_comprehensive_dashboard("python developer python", "software_engineer")
+
+        fig_to_png.assert_not_called()
+        specs = json.loads(json.dumps(data["chart_specs"]))
+        self.assertEqual(len(specs), 8)
+        self.assertEqual(specs["improvement_priority"]["data"]["labels"], ["Skills", "Experience"])
+        self.assertEqual(specs["wordcloud"]["data"]["labels"][0], "python")
+        self.assertEqual([d["label"] for d in specs["recommendation_chart"]["data"]["datasets"]],
+                         ["Experience", "Skills"])
+
+
+class FigureTemplateTest(SimpleTestCase):
+    def setUp(self):
+        figure_templates.clear_templates()
+
+    def test_template_is_built_once_per_thread_and_rerendered(self):
+        builds = []
+
+        def build(fig):
+            builds.append(threading.get_ident())
+            ax = fig.add_subplot()
+            ax.set_xlim(0, 10)
+            return {"line": ax.plot([0, 10], [0, 0])[0]}
+
+        def update(artists, value):
+            artists["line"].set_ydata([value, value])
+
+        first = figure_templates.get_template("tests.line", build, (2, 2))
+        self.assertTrue(first.render(update, 1).startswith(b"\x89PNG"))
+        self.assertIs(figure_templates.get_template("tests.line", build, (2, 2)), first)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(figure_templates.get_template("tests.line", build, (2, 2))))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(other[0], first)
+        self.assertEqual(len(builds), 2)
+
+
+class ChartCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.cache = chart_cache.ChartCache()
+
+    def test_same_inputs_render_once(self):
+        renders = []
+        draw = lambda: renders.append(1) or b"png"
+
+        first = self.cache.get_or_render("tests.gauge", {"score": 72.5}, draw)
+        second = self.cache.get_or_render("tests.gauge", {"score": 72.5}, draw)
+        self.cache.get_or_render("tests.gauge", {"score": 73.0}, draw)
+        self.cache.get_or_render("tests.gauge", {"score": 72.5}, lambda: b"")
+
+        self.assertEqual((first, second), (b"png", b"png"))
+        self.assertEqual(len(renders), 2)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_memory_tier_is_bounded_by_bytes(self):
+        memory = result_cache.LRUCache(maxsize=100, max_bytes=10)
+        memory.set("a", b"12345")
+        memory.set("b", b"12345")
+        memory.set("c", b"123")
+        memory.set("huge", b"x" * 11)
+
+        self.assertIsNone(memory.get("a"))
+        self.assertEqual(memory.get("c"), b"123")
+        self.assertIsNone(memory.get("huge"))
+        self.assertEqual(memory.bytes, 8)
+
+    def test_disk_tier_survives_memory_clear(self):
+        with tempfile.TemporaryDirectory() as media_root, \
+                self.settings(MEDIA_ROOT=media_root, CHART_CACHE_DISK=True):
+            self.cache.get_or_render("tests.bars", [1, 2, 3, 4], lambda: b"png")
+            self.cache.memory.clear()
+
+            png = self.cache.get_or_render("tests.bars", [1, 2, 3, 4], lambda: b"other")
+
+            self.assertEqual(png, b"png")
+            self.assertEqual(self.cache.stats()["disk_hits"], 1)
+            self.assertTrue(list(Path(media_root, "chart_cache").rglob("*.png")))
+
+
+class AnalysisExecutorTest(SimpleTestCase):
+    def test_disabled_pool_runs_jobs_inline(self):
+        executor = analysis_pool.AnalysisExecutor(max_workers=0)
+
+        self.assertEqual(executor.run(divmod, 7, 2), (3, 1))
+        with self.assertRaises(ZeroDivisionError):
+            executor.run(divmod, 1, 0)
+
+        stats = executor.stats()
+        self.assertEqual((stats["mode"], stats["completed"], stats["failed"]), ("inline", 1, 1))
+
+    def test_jobs_run_in_worker_processes_with_timeouts(self):
+        import time
+
+        executor = analysis_pool.AnalysisExecutor(max_workers=1, preload=False)
+        self.addCleanup(executor.shutdown)
+
+        self.assertNotEqual(executor.run(os.getpid, timeout=60), os.getpid())
+        with self.assertRaises(analysis_pool.AnalysisTimeout):
+            executor.run(time.sleep, 0.5, timeout=0.05)
+
+        stats = executor.stats()
+        self.assertEqual((stats["mode"], stats["workers"], stats["timeouts"]), ("process", 1, 1))
+        self.assertGreaterEqual(stats["completed"], 1)
+        self.assertGreaterEqual(stats["in_flight"], 0)
+
+    def test_broken_pool_is_shut_down_and_replaced(self):
+        from concurrent.futures.process import BrokenProcessPool
+
+        executor = analysis_pool.AnalysisExecutor(max_workers=1, preload=False)
+        self.addCleanup(executor.shutdown)
+        broken = executor.pool
+
+        with self.assertRaises(BrokenProcessPool):
+            executor.run(os._exit, 1, timeout=60)
+
+        self.assertTrue(broken._shutdown_thread)
+        self.assertIsNot(executor.pool, broken)
+        self.assertNotEqual(executor.run(os.getpid, timeout=60), os.getpid())
+
+
+class SemanticIndexTest(SimpleTestCase):
+    TEMPLATES = {
+        "backend": "python django rest apis postgresql docker",
+        "analyst": "sql excel dashboards reporting statistics",
+    }
+    CORPUS = ["python services and sql databases", "excel reports for management", "docker and kubernetes"]
+
+    def test_vectors_match_sklearn_and_scores_are_cosines(self):
+        index = semantic.SemanticIndex(self.TEMPLATES, self.CORPUS)
+        text = "Built django rest apis in python with postgresql"
+
+        vector = index.transform(text)
+        # sklearn drops unknown terms before normalizing; ours only differs in scale
+        expected = index.vectorizer.transform([text])
+        scale = vector.multiply(vector).sum() ** 0.5
+        self.assertAlmostEqual(abs(vector / scale - expected).sum(), 0.0)
+
+        (backend, terms), (analyst, _) = index.match(vector, ["backend", "analyst"])
+        self.assertAlmostEqual(backend, index.templates[0].multiply(expected).sum() * scale)
+        self.assertEqual(analyst, 0.0)
+        self.assertIn("django", terms)
+        # Unknown positions fall back to the default template
+        self.assertEqual(index.match(vector, ["astronaut"])[0][0], backend)
+
+    def test_rank_scores_every_position_in_one_product(self):
+        index = semantic.SemanticIndex(self.TEMPLATES, self.CORPUS)
+        vector = index.transform("sql dashboards and excel reporting, some python")
+
+        ranked = index.rank(vector)
+
+        self.assertEqual([position for position, _ in ranked], ["analyst", "backend"])
+        matches = dict(zip(index.positions, index.match(vector, index.positions)))
+        for position, similarity in ranked:
+            self.assertAlmostEqual(similarity, matches[position][0])
+
+    def test_unknown_words_count_towards_the_norm(self):
+        index = semantic.SemanticIndex(self.TEMPLATES, self.CORPUS)
+
+        known = index.match(index.transform("python django"), ["backend"])[0][0]
+        diluted = index.match(index.transform("python django zyxwv qwerty"), ["backend"])[0][0]
+
+        self.assertGreater(known, diluted)
+        self.assertGreater(diluted, 0.0)
+
+    def test_shared_index_is_fitted_once(self):
+        from App.utils.enchanced_paid import AdvancedResumeAnalyzer
+
+        first = semantic.get_semantic_index()
+        analyzer = AdvancedResumeAnalyzer()
+        with patch.object(semantic, "TfidfVectorizer") as vectorizer:
+            for text in ["Python developer using Django", "Java and JavaScript engineer"]:
+                match = analyzer.semantic_job_matching(text, "software_engineer")
+                self.assertGreater(match["similarity_score"], 0.0)
+
+        vectorizer.assert_not_called()
+        self.assertIs(semantic.get_semantic_index(), first)
+        self.assertIn("semantic_corpus.txt", str(semantic.corpus_path()))
@@ -1,7 +1,7 @@
 import os
 import django
 import types
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 # Ensure this is the correct settings module for your project
@@ -16,6 +16,7 @@ from django.test import SimpleTestCase
 from django.urls import reverse, resolve, NoReverseMatch
 
 import App.views_enhanced as views
+from App.utils.analysis_pool import position_analysis_job
 
 
 class TestViewResolution(SimpleTestCase):
@@ -74,11 +75,16 @@ class TestViewResolution(SimpleTestCase):
 
 
 class DashboardAnalysisTest(SimpleTestCase):
-    @patch("App.views_dashboard.Resume.objects.create")
-    @patch("App.views_dashboard.extract_text_from_pdf")
+    @patch("App.models.recieve.index_upload")
+    @patch("App.views_dashboard.run_analysis")
+    @patch("App.views_dashboard.remember_resume")
+    @patch("App.views_dashboard.store_analysis")
+    @patch("App.models.recieve.find_extracted_resume", return_value=None)
+    @patch("App.models.recieve.Resume.objects.create")
     @patch("App.views_dashboard.ResumeDashboard")
     def test_dashboard_post_renders_existing_template(
-        self, mock_dashboard_cls, mock_extract_pdf, mock_resume_create
+        self, mock_dashboard_cls, mock_resume_create, mock_find_resume,
+        mock_store_analysis, mock_remember_resume, mock_run_analysis, mock_index_upload,
     ):
         resume_text = (
             "Jane Doe\n"
@@ -88,7 +94,11 @@ class DashboardAnalysisTest(SimpleTestCase):
             "Built internal tools\n"
         )
 
-        mock_extract_pdf.return_value = resume_text
+        from App.models.recieve import ExtractedDocument
+        from App.utils.layout import TextBlock
+
+        blocks = [TextBlock(line) for line in resume_text.splitlines()]
+        mock_extract_pdf = MagicMock(return_value=ExtractedDocument(resume_text, blocks))
         mock_resume_create.return_value = types.SimpleNamespace(
             filename="resume.pdf",
             text=resume_text,
@@ -135,14 +145,20 @@ class DashboardAnalysisTest(SimpleTestCase):
             content_type="application/pdf",
         )
 
-        response = self.client.post(
-            reverse("comprehensive_analysis"),
-            {"resume": upload, "position": "software_engineer"},
-        )
+        with patch.dict("App.models.recieve.DOCUMENT_EXTRACTORS", {".pdf": mock_extract_pdf}):
+            response = self.client.post(
+                reverse("comprehensive_analysis"),
+                {"resume": upload, "position": "software_engineer"},
+            )
 
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "dashboard.html")
         mock_extract_pdf.assert_called_once()
+        # Indexing and analysis share one context of the upload
+        ctx = mock_index_upload.call_args.args[1]
+        self.assertEqual((ctx.text, ctx.blocks), (resume_text, blocks))
+        mock_index_upload.assert_called_once_with(mock_resume_create.return_value, ctx)
+        mock_run_analysis.assert_called_once_with(position_analysis_job, ctx, blocks, "software_engineer")
         mock_dashboard.generate_comprehensive_dashboard.assert_called_once_with(
-            resume_text, "software_engineer"
+            resume_text, "software_engineer", analysis=mock_run_analysis.return_value
         )
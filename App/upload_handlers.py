@@ -0,0 +1,39 @@
+"""Upload handlers that hash file contents as the request body streams in.
+
+They behave exactly like Django's default memory and temporary-file
+handlers, and additionally set ``content_hash`` (SHA-256 hex digest) on
+each uploaded file. Re-uploads of an already extracted resume can then be
+recognized without reading the file a second time (see
+``App.models.recieve.upload_content_hash``).
+"""
+import hashlib
+
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+
+
+class ContentHashMixin:
+    """Hash the chunks a handler keeps and stamp the digest on the file it returns."""
+
+    def new_file(self, *args, **kwargs):
+        # Set before super(): the memory handler raises StopFutureHandlers
+        self.content_hash = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if file is not None:
+            file.content_hash = self.content_hash.hexdigest()
+        return file
+
+
+class HashingMemoryFileUploadHandler(ContentHashMixin, MemoryFileUploadHandler):
+    def receive_data_chunk(self, raw_data, start):
+        if self.activated:
+            self.content_hash.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+
+class HashingTemporaryFileUploadHandler(ContentHashMixin, TemporaryFileUploadHandler):
+    def receive_data_chunk(self, raw_data, start):
+        self.content_hash.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
@@ -6,6 +6,9 @@ from django.urls import path, include
 from . import views
 from . import views_enhanced
 from . import views_dashboard
+from . import views_charts
+from . import views_resumes
+from . import views_batch
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -18,10 +21,21 @@ urlpatterns = [
     path("enhanced/", views_enhanced.enhanced_analysis, name="enhanced_analysis"),
     path("api/analysis/", views_enhanced.get_analysis_data, name="analysis_api"),
     path("compare/", views_enhanced.compare_positions, name="compare_positions"),
+    path("api/analysis/stats/", views_enhanced.analysis_stats, name="analysis_stats_api"),
     
     # Comprehensive Dashboard URLs
     path("dashboard/", views_dashboard.comprehensive_analysis, name="comprehensive_analysis"),
     path("api/dashboard/", views_dashboard.get_dashboard_api, name="dashboard_api"),
+    path("api/resumes/search/", views_resumes.resume_search, name="resume_search_api"),
+    path("api/resumes/<int:resume_id>/analysis/", views_resumes.resume_analysis, name="resume_analysis_api"),
+    path("api/resumes/<int:resume_id>/best-positions/", views_resumes.resume_best_positions,
+         name="best_positions_api"),
+    
+    # Bulk scoring, streamed as NDJSON
+    path("api/score/batch/", views_batch.score_batch, name="score_batch_api"),
+    
+    # Charts rendered in the background (CHART_RENDERING=deferred)
+    path("charts/<str:analysis_id>/<str:chart_name>.png", views_charts.chart_image, name="chart_image"),
     
     # Legacy home
     path("old-home/", views.Home, name="old_home"),
@@ -0,0 +1,301 @@
+"""Resume analysis on a pool of worker processes.
+
+Scoring and position analysis are pure Python CPU work, so under a threaded
+server two concurrent uploads take turns on the GIL. With
+``ANALYSIS_WORKERS`` > 0 the views hand their analysis to a persistent pool
+of that many processes and wait for the result (up to
+``ANALYSIS_TIMEOUT_SECONDS``). Each worker sets up Django and preloads the
+spaCy pipeline, the skill matcher, the line scanner and the semantic
+matcher once, when it starts. With ``ANALYSIS_WORKERS=0`` (the default)
+jobs run in the calling thread, exactly as before.
+
+Jobs are the module-level ``*_job`` functions below. They take plain,
+picklable arguments (text, layout blocks, position) and return plain
+dicts; the ``AnalysisContext`` is rebuilt in the worker. A view that
+already built the upload's context can pass it as the text: inline jobs
+then reuse its parse, TF-IDF vector and skills, and a pool worker receives
+only its text and blocks. Charts are still drawn in the web process from
+the returned analysis.
+
+Workers are started with the ``spawn`` method (forking a threaded server
+process is unsafe).
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisTimeout(TimeoutError):
+    """Raised when a job does not finish within ``ANALYSIS_TIMEOUT_SECONDS``."""
+
+
+def _init_worker(preload: bool) -> None:
+    """Pool initializer: set up Django and load the shared analysis state once."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "App.settings")
+    import django
+
+    django.setup()
+    if not preload:
+        return
+    try:
+        from .line_scanner import get_line_scanner
+        from .matching import get_skill_matcher
+        from .pipelines import get_pipeline
+        from .semantic import get_semantic_index
+
+        get_pipeline()
+        get_skill_matcher()
+        get_line_scanner()
+        get_semantic_index()
+    except Exception:
+        # The job will load what it needs (and report the error) on first use
+        logger.exception("Analysis worker %s could not preload its models", os.getpid())
+
+
+def _timed_call(fn, args):
+    """Run ``fn(*args)`` in a worker and report how long it kept the worker busy."""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def _context(text, blocks):
+    """The job's ``AnalysisContext``: ``text`` itself if it is one, else a new one."""
+    from .context import AnalysisContext
+
+    return text if isinstance(text, AnalysisContext) else AnalysisContext(text, blocks=blocks)
+
+
+def resume_score_job(text: str, blocks=None) -> dict:
+    """``calculate_resume_score`` of a resume text and its layout blocks."""
+    from .calculator import calculate_resume_score
+
+    return calculate_resume_score(_context(text, blocks))
+
+
+def position_analysis_job(text: str, blocks, position: str) -> dict:
+    """``EnhancedResumeAnalyzer.analyze_for_position`` of a resume text."""
+    from .enhana import EnhancedResumeAnalyzer
+
+    return EnhancedResumeAnalyzer().analyze_for_position(_context(text, blocks), position)
+
+
+def enhanced_analysis_job(text: str, blocks, position: str) -> tuple:
+    """
+    Position analysis and advanced analysis of one resume, sharing one parse.
+
+    Returns:
+        ``(analysis, advanced_analysis)``
+    """
+    from .enchanced_paid import AdvancedResumeAnalyzer
+    from .enhana import EnhancedResumeAnalyzer
+
+    ctx = _context(text, blocks)
+    advanced = AdvancedResumeAnalyzer().comprehensive_analysis(ctx, position)
+    return EnhancedResumeAnalyzer().analyze_for_position(ctx, position), advanced
+
+
+def position_comparison_job(text: str, blocks, positions) -> dict:
+    """``AdvancedResumeAnalyzer.comprehensive_analyses`` of one resume for ``positions``."""
+    from .enchanced_paid import AdvancedResumeAnalyzer
+
+    return AdvancedResumeAnalyzer().comprehensive_analyses(_context(text, blocks), positions)
+
+
+def best_fit_positions_job(text: str, blocks=None, top: int = None) -> list:
+    """``AdvancedResumeAnalyzer.best_fit_positions`` of a resume text."""
+    from .enchanced_paid import AdvancedResumeAnalyzer
+
+    return AdvancedResumeAnalyzer().best_fit_positions(_context(text, blocks), top)
+
+
+class AnalysisExecutor:
+    """
+    Runs analysis jobs on a process pool, or inline when the pool is disabled.
+
+    Args:
+        max_workers: Worker processes (``ANALYSIS_WORKERS`` by default); 0 runs jobs inline
+        timeout: Seconds ``run`` waits for a job (``ANALYSIS_TIMEOUT_SECONDS`` by default)
+        preload: Load spaCy and the matchers in each worker as it starts
+    """
+
+    def __init__(self, max_workers: int = None, timeout: float = None, preload: bool = True):
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self.preload = preload
+        self._pool = None
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def workers(self) -> int:
+        if self._max_workers is None:
+            return getattr(settings, "ANALYSIS_WORKERS", 0)
+        return self._max_workers
+
+    @property
+    def timeout(self) -> float:
+        if self._timeout is None:
+            return getattr(settings, "ANALYSIS_TIMEOUT_SECONDS", 120)
+        return self._timeout
+
+    @property
+    def enabled(self) -> bool:
+        """Whether jobs go to worker processes rather than running inline."""
+        return self.workers > 0
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=get_context("spawn"),
+                        initializer=_init_worker, initargs=(self.preload,))
+                    self._started = time.monotonic()
+                    self.busy_seconds = 0.0
+        return self._pool
+
+    def start(self) -> None:
+        """Start (and warm up) every worker now instead of on the first jobs."""
+        if self.enabled:
+            for future in [self.pool.submit(int) for _ in range(self.workers)]:
+                future.result()
+
+    def submit(self, fn, *args) -> Future:
+        """
+        Queue ``fn(*args)`` and return a Future of its result.
+
+        When the pool is disabled the job runs before ``submit`` returns and
+        the Future is already done. A pool whose worker died is discarded
+        (the next job starts a fresh one) and the job runs inline instead.
+        """
+        if not self.enabled:
+            return self._run_inline(fn, args)
+        pool = self.pool
+        try:
+            inner = pool.submit(_timed_call, fn, args)
+        except BrokenProcessPool:
+            logger.error("Analysis pool is broken; restarting it and running the job inline")
+            self._discard_broken_pool(pool)
+            return self._run_inline(fn, args)
+
+        future = Future()
+        self._count("in_flight", 1)
+        inner.add_done_callback(lambda done: self._finish(done, future, pool))
+        # Cancelling the returned Future withdraws the job if it has not started
+        future.add_done_callback(lambda done: done.cancelled() and inner.cancel())
+        return future
+
+    def run(self, fn, *args, timeout: float = None):
+        """
+        Run ``fn(*args)`` and return its result, waiting at most ``timeout`` seconds.
+
+        Raises:
+            AnalysisTimeout: The job did not finish in time. A job that has
+                not started yet is cancelled; a running one finishes in its
+                worker and its result is discarded.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._count("timeouts", 1)
+            raise AnalysisTimeout(f"Analysis did not finish within {timeout} seconds.") from None
+
+    def stats(self) -> dict:
+        """Queue depth, worker utilization and job counters."""
+        workers = self.workers
+        running = min(self.in_flight, workers)
+        elapsed = time.monotonic() - self._started
+        return {
+            "mode": "process" if self.enabled else "inline",
+            "workers": workers,
+            "in_flight": self.in_flight,
+            "running": running,
+            "queued": self.in_flight - running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "utilization": round(self.busy_seconds / (workers * elapsed), 3) if workers and elapsed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; the next job starts a new pool."""
+        pool = self._discard_pool()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def _discard_pool(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        return pool
+
+    def _discard_broken_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drop ``pool`` (unless a fresh pool already replaced it) and release its thread and processes."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        # Not waiting: this may run in the pool's own management thread
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run_inline(self, fn, args) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            self._count("failed", 1)
+            future.set_exception(exc)
+        else:
+            self._count("completed", 1)
+        return future
+
+    def _finish(self, inner: Future, future: Future, pool: ProcessPoolExecutor) -> None:
+        self._count("in_flight", -1)
+        if inner.cancelled():
+            future.cancel()
+            return
+        exc = inner.exception()
+        if exc is not None:
+            self._count("failed", 1)
+            if isinstance(exc, BrokenProcessPool):
+                self._discard_broken_pool(pool)
+            if future.set_running_or_notify_cancel():
+                future.set_exception(exc)
+            return
+        result, seconds = inner.result()
+        with self._lock:
+            self.completed += 1
+            self.busy_seconds += seconds
+        if future.set_running_or_notify_cancel():
+            future.set_result(result)
+
+    def _count(self, counter: str, delta) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + delta)
+
+
+analysis_executor = AnalysisExecutor()
+
+
+def run_analysis(fn, *args, timeout: float = None):
+    """Run an analysis job on the shared executor; see ``AnalysisExecutor.run``."""
+    return analysis_executor.run(fn, *args, timeout=timeout)
@@ -1,5 +1,7 @@
 """Main resume scoring calculator - Orchestrates all scoring logic."""
 
+from collections import deque
+
 from .extractors import (
     get_personal_info,
     extract_experience,
@@ -14,38 +16,107 @@ from .scorers import (
     calculate_quality_score,
 )
 from .validators import detect_red_flags
+from .context import AnalysisContext, as_context
+from .result_cache import analysis_cache
 from . import common
 
 
-def calculate_resume_score(resume_text: str) -> dict:
+def calculate_resume_score(resume_text: str | AnalysisContext) -> dict:
     """
     Calculate comprehensive resume score combining all metrics.
 
+    Every extractor and scorer receives the same AnalysisContext, so the
+    resume is tokenized and parsed by spaCy only once per call. Results are
+    cached by content hash (``ctx.cache_key``) and scoring-rules version.
+
     Args:
-        resume_text: The resume text to analyze
+        resume_text: The resume text (or AnalysisContext) to analyze
 
     Returns:
         Dictionary with detailed score breakdown and final score (0-100)
     """
+    ctx = as_context(resume_text)
+    return analysis_cache.get_or_compute(
+        "resume_score", ctx.cache_key, None, lambda: _score_resume(ctx))
+
+
+def calculate_resume_scores(resumes, batch_size: int = 32, n_process: int = 1,
+                            as_tuples: bool = False):
+    """
+    Score many resumes, parsing them with spaCy's ``nlp.pipe``.
+
+    Parsing dominates scoring time; ``nlp.pipe`` runs the pipeline over
+    whole batches (optionally across ``n_process`` processes) instead of
+    one call per resume. Resumes whose score is already cached, or whose
+    context already holds a ``Doc``, are not parsed again. Results are
+    yielded lazily and in input order.
+
+    Args:
+        resumes: Iterable of resume texts or AnalysisContexts; with
+            ``as_tuples``, of ``(resume, context)`` pairs
+        batch_size: Number of texts spaCy processes per batch
+        n_process: Number of processes spaCy parses with
+        as_tuples: Pass a caller-defined context through with each resume
+
+    Yields:
+        Score dictionaries as returned by ``calculate_resume_score``; with
+        ``as_tuples``, ``(score, context)`` pairs
+    """
+    from . import rating
+
+    # Inputs read by nlp.pipe but not yielded yet: [ctx, context, cached score]
+    pending = deque()
+    parsed = {}
+
+    def texts_to_parse():
+        for index, item in enumerate(resumes):
+            resume, context = item if as_tuples else (item, None)
+            ctx = as_context(resume)
+            cached = analysis_cache.get("resume_score", ctx.cache_key)
+            pending.append((index, ctx, context, cached))
+            if cached is None and "doc" not in ctx.__dict__:
+                yield ctx.text, index
+
+    def ready():
+        while pending:
+            index, ctx, context, cached = pending[0]
+            if cached is None and "doc" not in ctx.__dict__:
+                if index not in parsed:
+                    return
+                ctx.__dict__["doc"] = parsed.pop(index)
+            pending.popleft()
+            score = cached if cached is not None else calculate_resume_score(ctx)
+            yield (score, context) if as_tuples else score
+
+    # Docs may come back from other processes, so they are matched by index
+    for doc, index in rating.nlp.pipe(texts_to_parse(), as_tuples=True,
+                                      batch_size=batch_size, n_process=n_process):
+        parsed[index] = doc
+        yield from ready()
+    yield from ready()
+
+
+def _score_resume(ctx: AnalysisContext) -> dict:
+    """Compute the uncached score breakdown for ``ctx``."""
     final_score = 0
     details = {}
 
     # 1. Personal Info (0-10 points)
-    personal_result = get_personal_info(resume_text)
+    personal_result = get_personal_info(ctx)
     personal_score = personal_result["score"]
     details["personal_info_score"] = personal_score
     details["personal_info"] = personal_result["info"]
     final_score += personal_score
 
     # 2. Experience (0-15 points)
-    exp = extract_experience(resume_text)
+    exp = extract_experience(ctx)
     exp_score = min(15, len(exp["experience_entries"]) * 2)
     details["experience_score"] = exp_score
     details["experience_entries"] = exp["experience_entries"]
     final_score += exp_score
 
     # 3. Technical Skills (0-20 points)
-    tech = tech_skills_score(resume_text)
+    tech = tech_skills_score(ctx)
     tech_score = tech["score"]
     details["tech_skills_score"] = tech_score
     details["tech_skills"] = tech
@@ -53,14 +124,14 @@ def calculate_resume_score(resume_text: str) -> dict:
     final_score += tech_score
 
     # 4. Projects (0-10 points)
-    proj = extract_projects(resume_text)
+    proj = extract_projects(ctx)
     proj_score = min(10, proj["project_count"] * 3)
     details["project_score"] = proj_score
     details["projects"] = proj["projects"]
     final_score += proj_score
 
     # 5. Education (0-8 points)
-    edu = extract_education_section(resume_text)
+    edu = extract_education_section(ctx)
     edu_score = min(8, len(edu["degrees"]) * 4 + len(edu["universities"]) * 2)
     details["education_score"] = edu_score
     details["education"] = edu
@@ -68,33 +139,33 @@ def calculate_resume_score(resume_text: str) -> dict:
     final_score += edu_score
 
     # 6. Achievements (0-8 points)
-    ach = extract_achievements(resume_text)
+    ach = extract_achievements(ctx)
     ach_score = min(8, ach["count"] * 2)
     details["achievements_score"] = ach_score
     details["achievements"] = ach["achievements"]
     final_score += ach_score
 
     # 7. Certifications (0-6 points)
-    cert = extract_certifications(resume_text)
+    cert = extract_certifications(ctx)
     cert_score = min(6, cert["count"] * 2)
     details["certifications_score"] = cert_score
     details["certifications"] = cert["certifications"]
     final_score += cert_score
 
     # 8. Leadership (0-5 points)
-    lead = extract_leadership_roles(resume_text)
+    lead = extract_leadership_roles(ctx)
     lead_score = min(5, lead["count"] * 2)
     details["leadership_score"] = lead_score
     details["leadership_roles"] = lead["leadership_roles"]
     final_score += lead_score
 
     # 9. Content Quality (0-8 points)
-    quality_score = calculate_quality_score(resume_text)
+    quality_score = calculate_quality_score(ctx)
     details["content_quality_score"] = quality_score
     final_score += quality_score
 
     # 10. Red Flags (penalties)
-    red_flags = detect_red_flags(resume_text)
+    red_flags = detect_red_flags(ctx)
     red_flag_penalty = len(red_flags) * 2
     details["red_flags"] = red_flags
     details["red_flag_penalty"] = red_flag_penalty
@@ -103,7 +174,7 @@ def calculate_resume_score(resume_text: str) -> dict:
     # Grammar issues (for test compatibility)
     # Import here to get the mocked tool if available
     from . import rating
-    grammar_issues = rating.tool.check(resume_text)
+    grammar_issues = rating.tool.check(ctx.text)
     details["grammar_issues"] = len(grammar_issues)
 
     # Final calculations
@@ -0,0 +1,174 @@
+"""Content-addressed cache for rendered chart images.
+
+Most charts depend on a handful of numbers (a score, four counts, four
+percentages), and scores cluster heavily, so the same PNG gets rendered
+over and over. Rendered bytes are cached under the chart kind plus the
+SHA-256 of its canonical JSON inputs. The first tier is an in-process LRU
+bounded by ``CHART_CACHE_MAX_BYTES``. The optional second tier
+(``CHART_CACHE_DISK``) stores files under ``MEDIA_ROOT/chart_cache`` so
+renders survive restarts.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+
+from .chart_jobs import PYPLOT_LOCK
+from .result_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever chart drawing code changes so stale images are not served.
+CHART_CACHE_VERSION = "1"
+
+
+def chart_key(kind: str, inputs) -> str:
+    """Return the cache key for a ``kind`` chart drawn from ``inputs``."""
+    payload = json.dumps([CHART_CACHE_VERSION, kind, inputs], sort_keys=True, default=str)
+    return "{}-{}".format(kind, hashlib.sha256(payload.encode("utf-8")).hexdigest())
+
+
+class ChartCache:
+    """Two-tier (memory, optional disk) store of chart PNG bytes."""
+
+    def __init__(self):
+        self._memory = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    @property
+    def memory(self) -> LRUCache:
+        if self._memory is None:
+            self._memory = LRUCache(
+                maxsize=getattr(settings, "CHART_CACHE_SIZE", 2048),
+                max_bytes=getattr(settings, "CHART_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+            )
+        return self._memory
+
+    @property
+    def directory(self):
+        """Disk tier directory, or None when the disk tier is disabled."""
+        if not getattr(settings, "CHART_CACHE_DISK", False):
+            return None
+        return Path(settings.MEDIA_ROOT) / "chart_cache"
+
+    def _path(self, key: str):
+        directory = self.directory
+        if directory is None:
+            return None
+        kind, digest = key.rsplit("-", 1)
+        return directory / kind / digest[:2] / (digest + ".png")
+
+    def _read_disk(self, key: str):
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError:
+            logger.exception("Chart cache read failed for %s", path)
+            return None
+
+    def _write_disk(self, key: str, png: bytes) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename so readers never see partial images
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(png)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.exception("Chart cache write failed for %s", path)
+
+    def get_or_render(self, kind: str, inputs, draw) -> bytes:
+        """
+        Return the cached PNG for ``(kind, inputs)`` or render it.
+
+        Args:
+            kind: Chart type, e.g. ``"dashboard.score_gauge"``
+            inputs: JSON-serializable data the chart is drawn from
+            draw: Zero-argument callable returning PNG bytes; called under the pyplot lock
+
+        Returns:
+            PNG bytes (b"" when nothing could be drawn; empty results are not cached)
+        """
+        key = chart_key(kind, inputs)
+        png = self.memory.get(key)
+        if png is not None:
+            self._count("hits")
+            return png
+
+        png = self._read_disk(key)
+        if png is not None:
+            self._count("hits")
+            self._count("disk_hits")
+            self.memory.set(key, png)
+            return png
+
+        self._count("misses")
+        with PYPLOT_LOCK:
+            png = draw() or b""
+        if png:
+            self.memory.set(key, png)
+            self._write_disk(key, png)
+        return png
+
+    def clear(self, clear_disk: bool = False) -> None:
+        """Clear the memory tier and counters; ``clear_disk`` also removes cached files."""
+        self.memory.clear()
+        with self._lock:
+            self.hits = self.misses = self.disk_hits = 0
+        directory = self.directory
+        if clear_disk and directory is not None and directory.exists():
+            for path in directory.rglob("*.png"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and memory usage."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "size": len(self.memory),
+            "bytes": self.memory.bytes,
+            "max_bytes": self.memory.max_bytes,
+        }
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+chart_cache = ChartCache()
+
+
+class CachedChart:
+    """
+    Zero-argument chart callable that goes through ``chart_cache``.
+
+    Cache hits return without taking the pyplot lock; only renders take it.
+    """
+
+    self_locking = True
+
+    def __init__(self, kind: str, inputs, draw):
+        self.kind = kind
+        self.inputs = inputs
+        self.draw = draw
+
+    def __call__(self) -> bytes:
+        return chart_cache.get_or_render(self.kind, self.inputs, self.draw)
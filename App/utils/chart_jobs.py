@@ -0,0 +1,166 @@
+"""Chart rendering off the request thread.
+
+Rendering a dashboard's matplotlib figures dominates response time when it
+happens inside the request. In ``deferred`` mode (``CHART_RENDERING``) the
+chart callables are submitted to a small background thread pool and the
+page references each chart by URL (``/charts/<analysis_id>/<chart_name>.png``).
+The chart view answers 503 with ``Retry-After`` while a chart is still
+rendering (after at most ``CHART_WAIT_SECONDS``), and the page polls until
+the image arrives. In ``inline`` mode charts are rendered immediately and embedded
+as base64 data URIs. In ``client`` mode no image is rendered at all; the
+analyzers return Chart.js specs (``chart_specs``) for the browser to draw.
+
+pyplot keeps global state and is not thread-safe, so every render, inline
+or deferred, holds ``PYPLOT_LOCK``.
+"""
+import base64
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.urls import reverse
+
+logger = logging.getLogger(__name__)
+
+PYPLOT_LOCK = threading.RLock()
+
+INLINE = "inline"
+DEFERRED = "deferred"
+CLIENT = "client"
+CHART_MODES = (INLINE, DEFERRED, CLIENT)
+
+
+def resolve_chart_mode(mode: str = None) -> str:
+    """Return ``mode`` if it is a known chart mode, else ``settings.CHART_RENDERING``."""
+    if mode in CHART_MODES:
+        return mode
+    return getattr(settings, "CHART_RENDERING", INLINE)
+
+
+def chart_mode(request) -> str:
+    """Return the chart mode asked for by ``?charts=`` (or a ``charts`` form field), else the default."""
+    return resolve_chart_mode(request.GET.get("charts") or request.POST.get("charts"))
+
+
+def render_png(draw) -> bytes:
+    """
+    Run a chart callable under the pyplot lock.
+
+    Callables marked ``self_locking`` (e.g. ``chart_cache.CachedChart``) take
+    the lock themselves, and only when they actually draw.
+
+    Args:
+        draw: Zero-argument callable returning PNG bytes (or "" when charts are unavailable)
+
+    Returns:
+        PNG bytes, or b"" if nothing was drawn
+    """
+    if getattr(draw, "self_locking", False):
+        return draw() or b""
+    with PYPLOT_LOCK:
+        return draw() or b""
+
+
+def png_data_uri(png: bytes) -> str:
+    """Return ``png`` as a ``data:`` URI for an ``<img src>``, or "" when empty."""
+    if not png:
+        return ""
+    return "data:image/png;base64," + base64.b64encode(png).decode()
+
+
+class ChartJobs:
+    """
+    Background render pool and bounded store of pending and finished charts.
+
+    Args:
+        max_workers: Render threads (``CHART_RENDER_WORKERS`` by default)
+        max_analyses: Analyses whose charts are kept (``CHART_JOB_LIMIT`` by default);
+            the oldest are dropped, and their unfinished renders cancelled, beyond it
+    """
+
+    def __init__(self, max_workers: int = None, max_analyses: int = None):
+        self._max_workers = max_workers
+        self._max_analyses = max_analyses
+        self._executor = None
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_analyses(self) -> int:
+        if self._max_analyses is None:
+            return getattr(settings, "CHART_JOB_LIMIT", 64)
+        return self._max_analyses
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    workers = self._max_workers or getattr(settings, "CHART_RENDER_WORKERS", 1)
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="chart-render")
+        return self._executor
+
+    def submit(self, charts: dict) -> str:
+        """
+        Queue every chart of one analysis for rendering.
+
+        Args:
+            charts: Mapping of chart name -> zero-argument callable returning PNG bytes
+
+        Returns:
+            The analysis id the charts are stored under
+        """
+        analysis_id = uuid.uuid4().hex
+        futures = {name: self.executor.submit(render_png, draw) for name, draw in charts.items()}
+        with self._lock:
+            self._jobs[analysis_id] = futures
+            while len(self._jobs) > self.max_analyses:
+                _, dropped = self._jobs.popitem(last=False)
+                for future in dropped.values():
+                    future.cancel()
+        return analysis_id
+
+    def get(self, analysis_id: str, chart_name: str):
+        """Return the future rendering ``chart_name`` of ``analysis_id``, or None."""
+        with self._lock:
+            return self._jobs.get(analysis_id, {}).get(chart_name)
+
+    def clear(self) -> None:
+        """Forget every stored analysis, cancelling renders not yet started."""
+        with self._lock:
+            jobs, self._jobs = self._jobs, OrderedDict()
+        for futures in jobs.values():
+            for future in futures.values():
+                future.cancel()
+
+    def __len__(self):
+        return len(self._jobs)
+
+
+chart_jobs = ChartJobs()
+
+
+def chart_sources(charts: dict, mode: str = None) -> dict:
+    """
+    Render or schedule a set of charts and return their ``<img src>`` values.
+
+    Args:
+        charts: Mapping of chart name -> zero-argument callable returning PNG bytes
+        mode: ``"deferred"`` to render in the background; any other mode renders
+            inline. Defaults to ``settings.CHART_RENDERING``
+
+    Returns:
+        Mapping of chart name -> data URI (inline) or chart URL (deferred)
+    """
+    if resolve_chart_mode(mode) != DEFERRED:
+        return {name: png_data_uri(render_png(draw)) for name, draw in charts.items()}
+
+    analysis_id = chart_jobs.submit(charts)
+    return {
+        name: reverse("chart_image", args=[analysis_id, name])
+        for name in charts
+    }
@@ -0,0 +1,145 @@
+"""Chart.js configurations for browser-side chart rendering.
+
+In ``client`` chart mode (``CHART_RENDERING`` or ``?charts=client``) the
+server never touches matplotlib. The analyzers turn their chart data into
+the small JSON configurations built here, and the templates hand each one
+to ``new Chart(canvas, spec)``. Every builder returns a plain,
+JSON-serializable dict.
+"""
+
+SCORE_COLORS = ((50, '#e74c3c'), (75, '#f39c12'), (101, '#27ae60'))
+
+
+def score_color(score: float) -> str:
+    """Return the red/orange/green color used for a 0-100 score."""
+    for limit, color in SCORE_COLORS:
+        if score < limit:
+            return color
+    return SCORE_COLORS[-1][1]
+
+
+def _title(text: str) -> dict:
+    return {'title': {'display': True, 'text': text, 'font': {'size': 16, 'weight': 'bold'}}}
+
+
+def dataset(label: str, values, color, **extra) -> dict:
+    """Build one dataset; ``color`` may be a single color or one per value."""
+    return {'label': label, 'data': list(values), 'backgroundColor': color, **extra}
+
+
+def gauge(score: float, title: str, label: str = 'Score') -> dict:
+    """
+    Half-doughnut gauge for a 0-100 score.
+
+    Args:
+        score: Score to display
+        title: Chart title
+        label: Caption shown under the title with the score
+
+    Returns:
+        Chart.js configuration
+    """
+    score = max(0.0, min(100.0, float(score)))
+    plugins = _title(title)
+    plugins['subtitle'] = {'display': True, 'text': f'{label}: {score:.1f}%', 'font': {'size': 20}}
+    plugins['legend'] = {'display': False}
+    plugins['tooltip'] = {'enabled': False}
+    return {
+        'type': 'doughnut',
+        'data': {
+            'labels': [label, ''],
+            'datasets': [dataset(label, [score, 100 - score], [score_color(score), '#ecf0f1'])],
+        },
+        'options': {'rotation': -90, 'circumference': 180, 'cutout': '70%', 'plugins': plugins},
+    }
+
+
+def radar(labels, values, title: str, max_value: float = 10, color: str = '#3498db') -> dict:
+    """Radar chart of ``values`` on a 0-``max_value`` scale."""
+    return {
+        'type': 'radar',
+        'data': {
+            'labels': list(labels),
+            'datasets': [dataset(title, values, color + '40', borderColor=color, fill=True)],
+        },
+        'options': {
+            'scales': {'r': {'min': 0, 'max': max_value}},
+            'plugins': {**_title(title), 'legend': {'display': False}},
+        },
+    }
+
+
+def bar(labels, datasets: list, title: str, horizontal: bool = False, stacked: bool = False,
+        max_value: float = None, axis_label: str = None) -> dict:
+    """
+    Bar chart with one or more datasets.
+
+    Args:
+        labels: Category labels
+        datasets: Datasets built with ``dataset``
+        title: Chart title
+        horizontal: Draw bars along the x axis
+        stacked: Stack the datasets
+        max_value: Fixed maximum of the value axis
+        axis_label: Title of the value axis
+
+    Returns:
+        Chart.js configuration
+    """
+    value_axis = {'beginAtZero': True, 'stacked': stacked}
+    if max_value is not None:
+        value_axis['max'] = max_value
+    if axis_label:
+        value_axis['title'] = {'display': True, 'text': axis_label}
+    category_axis = {'stacked': stacked}
+    value_key, category_key = ('x', 'y') if horizontal else ('y', 'x')
+
+    options = {
+        'scales': {value_key: value_axis, category_key: category_axis},
+        'plugins': {**_title(title), 'legend': {'display': len(datasets) > 1}},
+    }
+    if horizontal:
+        options['indexAxis'] = 'y'
+    return {'type': 'bar', 'data': {'labels': list(labels), 'datasets': datasets}, 'options': options}
+
+
+def pie(labels, values, title: str, colors=None) -> dict:
+    """Pie chart of ``values``."""
+    return {
+        'type': 'pie',
+        'data': {'labels': list(labels), 'datasets': [dataset(title, values, list(colors or []))]},
+        'options': {'plugins': _title(title)},
+    }
+
+
+def bubble(points: list, title: str, x_labels: list, y_labels: list) -> dict:
+    """
+    Bubble matrix with categorical 1..n axes.
+
+    Args:
+        points: ``(label, x, y)`` tuples, one dataset (and legend entry) each
+        title: Chart title
+        x_labels: Names of x positions 1..n
+        y_labels: Names of y positions 1..n
+
+    Returns:
+        Chart.js configuration; the templates turn each axis's ``tickLabels``
+        into a tick callback
+    """
+    palette = ['#440154', '#3b528b', '#21918c', '#5ec962', '#fde725', '#e74c3c', '#9b59b6']
+    datasets = [
+        dataset(label, [{'x': x, 'y': y, 'r': 12}], palette[i % len(palette)] + '99')
+        for i, (label, x, y) in enumerate(points)
+    ]
+    axis = {'min': 0.5, 'ticks': {'stepSize': 1}}
+    return {
+        'type': 'bubble',
+        'data': {'datasets': datasets},
+        'options': {
+            'scales': {
+                'x': {**axis, 'max': len(x_labels) + 0.5, 'tickLabels': list(x_labels)},
+                'y': {**axis, 'max': len(y_labels) + 0.5, 'tickLabels': list(y_labels)},
+            },
+            'plugins': _title(title),
+        },
+    }
@@ -1,9 +1,10 @@
 """Common utilities and shared resources for resume analysis."""
 import re
-import spacy
 
-# Load spaCy NLP model
-nlp = spacy.load("en_core_web_sm")
+from .pipelines import DEFAULT_PIPELINE, LazyPipeline, get_pipeline
+
+# spaCy NLP model - resolved lazily from the process-wide pipeline registry
+nlp = LazyPipeline(DEFAULT_PIPELINE)
 
 
 class ToolStub:
@@ -22,8 +23,8 @@ def normalize_text(text: str) -> str:
 
 
 def get_nlp():
-    """Get the loaded spaCy NLP model."""
-    return nlp
+    """Get the loaded spaCy NLP model (shared across the whole process)."""
+    return get_pipeline(DEFAULT_PIPELINE)
 
 
 def get_tool():
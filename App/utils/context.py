@@ -0,0 +1,162 @@
+"""Shared per-resume analysis context.
+
+An ``AnalysisContext`` wraps one resume text and lazily computes the derived
+views every extractor, scorer and analyzer needs (lowercased text, lines,
+word tokens, the spaCy ``Doc`` and its entities). Each view is computed at
+most once, so a single scoring run parses the resume a single time no matter
+how many components read it.
+
+Contexts built from an upload can also carry its layout blocks (see
+``App.utils.layout``); sections are then detected from the document's
+headings once and shared by the section extractors.
+"""
+import json
+from functools import cached_property
+
+from .layout import detect_sections
+from .line_scanner import get_line_scanner
+from .matching import contains_word, get_skill_matcher
+
+
+class AnalysisContext:
+    """
+    Lazily computed, cached views of a single resume text.
+
+    Args:
+        text: The resume text to analyze
+        doc: Optional pre-parsed spaCy ``Doc`` for ``text`` (e.g. from ``nlp.pipe``)
+        blocks: Optional layout ``TextBlock``s of the document ``text`` came from
+    """
+
+    def __init__(self, text: str, doc=None, blocks=None):
+        self.text = text
+        self.blocks = blocks or []
+        if doc is not None:
+            self.__dict__["doc"] = doc
+
+    def __repr__(self):
+        return f"<AnalysisContext {len(self.text)} chars>"
+
+    def __getstate__(self):
+        # Sent to analysis workers as text and blocks; derived views are rebuilt there
+        return {"text": self.text, "blocks": self.blocks}
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased resume text."""
+        return self.text.lower()
+
+    @cached_property
+    def lines(self) -> list:
+        """Resume text split on newlines."""
+        return self.text.split('\n')
+
+    @cached_property
+    def lower_lines(self) -> list:
+        """Lowercased resume text split on newlines."""
+        return self.lower.split('\n')
+
+    @cached_property
+    def words(self) -> list:
+        """Whitespace-separated word tokens."""
+        return self.text.split()
+
+    @cached_property
+    def word_count(self) -> int:
+        return self.scan.word_count
+
+    @cached_property
+    def scan(self):
+        """``LineScan`` of the text: per-line keywords, quantifiers and totals."""
+        return get_line_scanner().scan(self.text, self.lower)
+
+    @cached_property
+    def sections(self) -> dict:
+        """Sections detected from ``blocks`` by heading; empty when there is no layout."""
+        return detect_sections(self.blocks) if self.blocks else {}
+
+    @cached_property
+    def cache_key(self) -> str:
+        """
+        Text that identifies this context's analysis results.
+
+        Results computed from detected sections can differ from plain-text
+        results, so the sections are part of the key when there are any.
+        """
+        if not self.sections:
+            return self.text
+        layout = {name: section.lines for name, section in self.sections.items()}
+        return self.text + "\0" + json.dumps(layout, sort_keys=True)
+
+    def section(self, name: str):
+        """Return the detected ``Section`` called ``name``, or None."""
+        return self.sections.get(name)
+
+    @cached_property
+    def doc(self):
+        """spaCy ``Doc`` for the resume, parsed on first access."""
+        # Resolve through the rating facade so tests can patch rating.nlp
+        from . import rating
+        return rating.nlp(self.text)
+
+    @cached_property
+    def entities(self) -> list:
+        """Named entities of ``doc``."""
+        return list(self.doc.ents)
+
+    @cached_property
+    def sentences(self) -> list:
+        """Sentence texts of ``doc``."""
+        return [sent.text for sent in self.doc.sents]
+
+    @cached_property
+    def semantic_vector(self):
+        """TF-IDF row of the text in the shared semantic model (``App.utils.semantic``)."""
+        from .semantic import get_semantic_index
+        return get_semantic_index().transform(self.text)
+
+    @cached_property
+    def skill_hits(self) -> list:
+        """Every skill-table term occurring in the text, from one matcher pass."""
+        return list(get_skill_matcher().finditer(self.lower))
+
+    @cached_property
+    def skill_terms(self) -> frozenset:
+        """Distinct skill-table terms occurring in the text."""
+        return frozenset(hit.term for hit in self.skill_hits)
+
+    @cached_property
+    def skills(self) -> frozenset:
+        """Canonical skills of ``skill_terms`` (aliases resolved)."""
+        matcher = get_skill_matcher()
+        return frozenset().union(*(matcher.canonical(term) for term in self.skill_terms))
+
+    def mentions(self, term: str) -> bool:
+        """
+        Return True if ``term`` occurs in the text as a whole word.
+
+        Terms from the skill tables are answered from ``skill_hits``; any
+        other term falls back to a single regex search.
+        """
+        if term in get_skill_matcher():
+            return term.lower().strip() in self.skill_terms
+        return contains_word(self.lower, term)
+
+    def entities_with_label(self, label: str) -> list:
+        """Return the text of every entity labelled ``label``."""
+        return [ent.text for ent in self.entities if ent.label_ == label]
+
+
+def as_context(resume) -> AnalysisContext:
+    """
+    Return ``resume`` as an ``AnalysisContext``.
+
+    Args:
+        resume: A resume text or an existing ``AnalysisContext``
+
+    Returns:
+        The given context unchanged, or a new context wrapping the text
+    """
+    if isinstance(resume, AnalysisContext):
+        return resume
+    return AnalysisContext(resume)
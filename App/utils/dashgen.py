@@ -8,23 +8,65 @@ except ImportError:
     CHARTS_AVAILABLE = False
 # from wordcloud import WordCloud  # Removed due to installation issues
 from .enhana import EnhancedResumeAnalyzer
+from . import chart_specs
+from .chart_cache import CachedChart
+from .chart_jobs import CLIENT, PYPLOT_LOCK, chart_sources, resolve_chart_mode
+from .context import as_context
+from .figure_templates import get_template
+from . import patterns
+
+RADAR_CATEGORIES = ['Technical Skills', 'Experience', 'Education', 'Projects',
+                    'Certifications', 'Leadership', 'Communication']
+
+# Section scores companies typically look for
+IDEAL_SECTION_SCORES = {
+    'Personal Info': 10,
+    'Experience': 15,
+    'Projects': 10,
+    'Education': 8,
+    'Skills': 20,
+    'Achievements': 8,
+    'Certifications': 6
+}
+
+PRIORITIES = ['critical', 'important', 'nice_to_have']
+PRIORITY_COLORS = ['#e74c3c', '#f39c12', '#3498db']
+PRIORITY_LEVELS = {'critical': 3, 'important': 2, 'nice_to_have': 1}
+IMPACT_LEVELS = {'High': 3, 'Medium': 2, 'Low': 1}
+
+KEYWORD_STOP_WORDS = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'are', 'was', 'were'}
+
 
 class ResumeDashboard:
-    def __init__(self):
+    def __init__(self, chart_mode: str = None):
         self.analyzer = EnhancedResumeAnalyzer()
+        # inline/deferred PNGs or client-side specs; None follows settings.CHART_RENDERING
+        self.chart_mode = chart_mode
         if CHARTS_AVAILABLE:
-            try:
-                import matplotlib
-                matplotlib.use('Agg')  # Use non-GUI backend
-                plt.style.use('seaborn-v0_8')
-            except:
-                pass
-        
-    def generate_comprehensive_dashboard(self, resume_text: str, position: str = 'software_engineer') -> dict:
-        """Generate a comprehensive dashboard with all analytics"""
+            with PYPLOT_LOCK:
+                try:
+                    import matplotlib
+                    matplotlib.use('Agg')  # Use non-GUI backend
+                    plt.style.use('seaborn-v0_8')
+                except:
+                    pass
+        
+    def generate_comprehensive_dashboard(self, resume_text, position: str = 'software_engineer',
+                                         analysis: dict = None) -> dict:
+        """Generate a comprehensive dashboard with all analytics (``analysis`` if already computed)"""
+        ctx = as_context(resume_text)
         
         # Get analysis
-        analysis = self.analyzer.analyze_for_position(resume_text, position)
+        if analysis is None:
+            analysis = self.analyzer.analyze_for_position(ctx, position)
+        
+        if resolve_chart_mode(self.chart_mode) == CLIENT:
+            # The browser draws the charts; matplotlib is not used at all
+            return {
+                'analysis': analysis,
+                'charts': {},
+                'chart_specs': self._chart_specs(analysis, ctx)
+            }
         
         if not CHARTS_AVAILABLE:
             return {
@@ -33,29 +75,52 @@ class ResumeDashboard:
                           'section_comparison', 'skills_heatmap', 'wordcloud', 'progress_bars', 'recommendation_chart']}
             }
         
-        # Generate all charts
+        # Charts are rendered now or in the background (settings.CHART_RENDERING).
+        # Each is cached under the few values it is drawn from.
+        base = analysis['base_analysis']
+        skills = analysis['skills_analysis']
+        position_score = analysis['position_score']
+        score = position_score['weighted_score']
+        progress = [position_score[key] for key in
+                    ('experience_score', 'skills_score', 'education_score', 'projects_score')]
+        skill_counts = [len(skills[key]) for key in
+                        ('required_found', 'required_missing', 'preferred_found', 'preferred_missing')]
+        charts = {
+            'score_gauge': CachedChart('dashboard.score_gauge', score,
+                                       lambda: self._create_advanced_gauge(score)),
+            'skills_radar': CachedChart('dashboard.skills_radar', self._radar_values(base),
+                                        lambda: self._create_skills_radar(analysis)),
+            'improvement_priority': CachedChart('dashboard.improvement_priority',
+                                                self._priority_counts(analysis['suggestions']),
+                                                lambda: self._create_improvement_priority_chart(analysis['suggestions'])),
+            'section_comparison': CachedChart('dashboard.section_comparison', self._section_scores(base),
+                                              lambda: self._create_section_comparison(base)),
+            'skills_heatmap': CachedChart('dashboard.skills_heatmap', skill_counts,
+                                          lambda: self._create_skills_heatmap(skills)),
+            'wordcloud': CachedChart('dashboard.wordcloud', self._top_keywords(ctx),
+                                     lambda: self._create_resume_wordcloud(ctx)),
+            'progress_bars': CachedChart('dashboard.progress_bars', progress,
+                                         lambda: self._create_progress_bars(position_score)),
+            'recommendation_chart': CachedChart('dashboard.recommendation_chart',
+                                                self._recommendation_points(analysis['suggestions']),
+                                                lambda: self._create_recommendation_chart(analysis))
+        }
         dashboard_data = {
             'analysis': analysis,
-            'charts': {
-                'score_gauge': self._create_advanced_gauge(analysis['position_score']['weighted_score']),
-                'skills_radar': self._create_skills_radar(analysis),
-                'improvement_priority': self._create_improvement_priority_chart(analysis['suggestions']),
-                'section_comparison': self._create_section_comparison(analysis['base_analysis']),
-                'skills_heatmap': self._create_skills_heatmap(analysis['skills_analysis']),
-                'wordcloud': self._create_resume_wordcloud(resume_text),
-                'progress_bars': self._create_progress_bars(analysis['position_score']),
-                'recommendation_chart': self._create_recommendation_chart(analysis)
-            }
+            'charts': chart_sources(charts, self.chart_mode)
         }
         
         return dashboard_data
     
-    def _create_advanced_gauge(self, score: float) -> str:
+    def _create_advanced_gauge(self, score: float) -> bytes:
         """Create an advanced gauge chart with color zones"""
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Create gauge background
-        theta = np.linspace(0, np.pi, 100)
+        template = get_template('dashboard.gauge', self._build_advanced_gauge, (10, 6),
+                                dpi=150, facecolor='white')
+        return template.render(self._update_advanced_gauge, score)
+    
+    def _build_advanced_gauge(self, fig) -> dict:
+        """Static gauge: color zones, hub, labels and title"""
+        ax = fig.add_subplot()
         
         # Color zones
         zones = [
@@ -69,16 +134,13 @@ class ResumeDashboard:
             zone_theta = np.linspace(np.pi * (1 - end/100), np.pi * (1 - start/100), 50)
             ax.plot(np.cos(zone_theta), np.sin(zone_theta), color=color, linewidth=15, alpha=0.3)
         
-        # Score needle
-        score_angle = np.pi * (1 - score/100)
-        needle_x = [0, 0.8 * np.cos(score_angle)]
-        needle_y = [0, 0.8 * np.sin(score_angle)]
-        ax.plot(needle_x, needle_y, 'black', linewidth=4)
+        # Score needle (updated per render)
+        needle, = ax.plot([0, 0], [0, 0.8], 'black', linewidth=4)
         ax.plot(0, 0, 'ko', markersize=10)
         
-        # Score text
-        ax.text(0, -0.3, f'{score:.1f}%', ha='center', va='center', 
-                fontsize=28, fontweight='bold')
+        # Score text (updated per render)
+        score_text = ax.text(0, -0.3, '100.0%', ha='center', va='center', 
+                             fontsize=28, fontweight='bold')
         ax.text(0, -0.45, 'Resume Score', ha='center', va='center', 
                 fontsize=16, color='gray')
         
@@ -92,79 +154,66 @@ class ResumeDashboard:
         ax.set_ylim(-0.6, 1.2)
         ax.set_aspect('equal')
         ax.axis('off')
-        plt.title('Overall Resume Assessment', fontsize=18, fontweight='bold', pad=20)
+        ax.set_title('Overall Resume Assessment', fontsize=18, fontweight='bold', pad=20)
         
-        return self._fig_to_base64(fig)
+        return {'needle': needle, 'score_text': score_text}
     
-    def _create_skills_radar(self, analysis: dict) -> str:
+    def _update_advanced_gauge(self, artists: dict, score: float) -> None:
+        score_angle = np.pi * (1 - score/100)
+        artists['needle'].set_data([0, 0.8 * np.cos(score_angle)], [0, 0.8 * np.sin(score_angle)])
+        artists['score_text'].set_text(f'{score:.1f}%')
+    
+    def _create_skills_radar(self, analysis: dict) -> bytes:
         """Create radar chart for skills analysis"""
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
-        
-        # Data preparation
-        categories = ['Technical Skills', 'Experience', 'Education', 'Projects', 
-                     'Certifications', 'Leadership', 'Communication']
-        
-        base = analysis['base_analysis']
-        values = [
-            min(10, base.get('tech_skills_score', 0)),
-            min(10, base.get('experience_score', 0)),
-            min(10, base.get('education_score', 0)),
-            min(10, base.get('project_score', 0)),
-            min(10, base.get('certifications_score', 0)),
-            min(10, base.get('leadership_score', 0)),
-            10 - len(base.get('red_flags', []))  # Communication proxy
-        ]
-        
-        # Normalize to 0-10 scale
-        values = [max(0, v) for v in values]
+        values = self._radar_values(analysis['base_analysis'])
         values += values[:1]  # Close the circle
         
+        template = get_template('dashboard.skills_radar', self._build_skills_radar, (10, 10),
+                                dpi=150, facecolor='white')
+        return template.render(self._update_radar, values)
+    
+    def _build_skills_radar(self, fig) -> dict:
+        """Static radar: polar grid, category labels and title"""
+        ax = fig.add_subplot(projection='polar')
+        
         # Calculate angles
-        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
+        angles = np.linspace(0, 2 * np.pi, len(RADAR_CATEGORIES), endpoint=False).tolist()
         angles += angles[:1]
         
-        # Plot
-        ax.plot(angles, values, 'o-', linewidth=3, color='#3498db', markersize=8)
-        ax.fill(angles, values, alpha=0.25, color='#3498db')
+        # Data artists (updated per render)
+        line, = ax.plot(angles, [10] * len(angles), 'o-', linewidth=3, color='#3498db', markersize=8)
+        fill, = ax.fill(angles, [10] * len(angles), alpha=0.25, color='#3498db')
         
         # Customize
         ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(categories, fontsize=12)
+        ax.set_xticklabels(RADAR_CATEGORIES, fontsize=12)
         ax.set_ylim(0, 10)
         ax.set_yticks(range(0, 11, 2))
         ax.set_yticklabels(range(0, 11, 2), fontsize=10)
         ax.grid(True, alpha=0.3)
         
-        plt.title('Skills & Competencies Radar', size=16, fontweight='bold', pad=30)
+        ax.set_title('Skills & Competencies Radar', size=16, fontweight='bold', pad=30)
         
-        return self._fig_to_base64(fig)
+        return {'angles': angles, 'line': line, 'fill': fill}
+    
+    def _update_radar(self, artists: dict, values: list) -> None:
+        artists['line'].set_data(artists['angles'], values)
+        artists['fill'].set_xy(np.column_stack([artists['angles'], values]))
     
-    def _create_improvement_priority_chart(self, suggestions: dict) -> str:
+    def _create_improvement_priority_chart(self, suggestions: dict) -> bytes:
         """Create priority chart for improvements"""
         fig, ax = plt.subplots(figsize=(12, 8))
         
         # Count suggestions by priority and category
-        priority_data = {}
-        categories = set()
-        
-        for priority, items in suggestions.items():
-            priority_data[priority] = {}
-            for item in items:
-                category = item['category']
-                categories.add(category)
-                priority_data[priority][category] = priority_data[priority].get(category, 0) + 1
+        categories, counts = self._priority_counts(suggestions)
         
         # Create stacked bar chart
-        categories = list(categories)
-        priorities = ['critical', 'important', 'nice_to_have']
-        colors = ['#e74c3c', '#f39c12', '#3498db']
-        
         bottom = np.zeros(len(categories))
         
-        for i, priority in enumerate(priorities):
-            values = [priority_data.get(priority, {}).get(cat, 0) for cat in categories]
+        for i, priority in enumerate(PRIORITIES):
+            values = counts[priority]
             ax.bar(categories, values, bottom=bottom, label=priority.replace('_', ' ').title(), 
-                   color=colors[i], alpha=0.8)
+                   color=PRIORITY_COLORS[i], alpha=0.8)
             bottom += values
         
         ax.set_ylabel('Number of Suggestions')
@@ -173,38 +222,17 @@ class ResumeDashboard:
         plt.xticks(rotation=45, ha='right')
         plt.tight_layout()
         
-        return self._fig_to_base64(fig)
+        return self._fig_to_png(fig)
     
-    def _create_section_comparison(self, base_analysis: dict) -> str:
+    def _create_section_comparison(self, base_analysis: dict) -> bytes:
         """Create section comparison chart"""
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
         
-        # Current scores
-        sections = {
-            'Personal Info': base_analysis.get('personal_info_score', 0),
-            'Experience': base_analysis.get('experience_score', 0),
-            'Projects': base_analysis.get('project_score', 0),
-            'Education': base_analysis.get('education_score', 0),
-            'Skills': base_analysis.get('tech_skills_score', 0),
-            'Achievements': base_analysis.get('achievements_score', 0),
-            'Certifications': base_analysis.get('certifications_score', 0)
-        }
-        
-        # Ideal scores (what companies typically look for)
-        ideal_scores = {
-            'Personal Info': 10,
-            'Experience': 15,
-            'Projects': 10,
-            'Education': 8,
-            'Skills': 20,
-            'Achievements': 8,
-            'Certifications': 6
-        }
-        
-        # Current vs Ideal
+        # Current scores vs ideal scores (what companies typically look for)
+        sections = self._section_scores(base_analysis)
         x = range(len(sections))
         current = list(sections.values())
-        ideal = list(ideal_scores.values())
+        ideal = list(IDEAL_SECTION_SCORES.values())
         
         ax1.bar([i - 0.2 for i in x], current, 0.4, label='Current', color='#3498db', alpha=0.7)
         ax1.bar([i + 0.2 for i in x], ideal, 0.4, label='Industry Standard', color='#27ae60', alpha=0.7)
@@ -226,9 +254,9 @@ class ResumeDashboard:
         ax2.axvline(x=0, color='black', linestyle='-', alpha=0.3)
         
         plt.tight_layout()
-        return self._fig_to_base64(fig)
+        return self._fig_to_png(fig)
     
-    def _create_skills_heatmap(self, skills_analysis: dict) -> str:
+    def _create_skills_heatmap(self, skills_analysis: dict) -> bytes:
         """Create skills matching heatmap"""
         fig, ax = plt.subplots(figsize=(12, 6))
         
@@ -253,18 +281,11 @@ class ResumeDashboard:
         ax.set_title('Skills Matching Analysis', fontsize=16, fontweight='bold')
         plt.tight_layout()
         
-        return self._fig_to_base64(fig)
+        return self._fig_to_png(fig)
     
-    def _create_resume_wordcloud(self, resume_text: str) -> str:
+    def _create_resume_wordcloud(self, resume_text) -> bytes:
         """Create simple keyword visualization"""
-        import re
-        from collections import Counter
-        
-        # Extract keywords
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', resume_text.lower())
-        stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'are', 'was', 'were'}
-        keywords = [w for w in words if w not in stop_words]
-        top_words = Counter(keywords).most_common(15)
+        top_words = self._top_keywords(resume_text)
         
         fig, ax = plt.subplots(figsize=(12, 6))
         
@@ -291,13 +312,10 @@ class ResumeDashboard:
         
         ax.axis('off') if not top_words else None
         plt.tight_layout()
-        return self._fig_to_base64(fig)
+        return self._fig_to_png(fig)
     
-    def _create_progress_bars(self, position_score: dict) -> str:
+    def _create_progress_bars(self, position_score: dict) -> bytes:
         """Create progress bars for different score components"""
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        categories = ['Experience', 'Skills', 'Education', 'Projects']
         scores = [
             position_score['experience_score'],
             position_score['skills_score'],
@@ -305,20 +323,26 @@ class ResumeDashboard:
             position_score['projects_score']
         ]
         
+        template = get_template('dashboard.progress_bars', self._build_progress_bars, (10, 6),
+                                dpi=150, facecolor='white')
+        return template.render(self._update_progress_bars, scores)
+    
+    def _build_progress_bars(self, fig) -> dict:
+        """Static progress bars: backgrounds, category labels and axes"""
+        ax = fig.add_subplot()
+        
+        categories = ['Experience', 'Skills', 'Education', 'Projects']
+        
         # Create horizontal progress bars
         y_pos = np.arange(len(categories))
         
         # Background bars
         ax.barh(y_pos, [100] * len(categories), color='lightgray', alpha=0.3)
         
-        # Progress bars with color coding
-        colors = ['#e74c3c' if s < 50 else '#f39c12' if s < 75 else '#27ae60' for s in scores]
-        bars = ax.barh(y_pos, scores, color=colors, alpha=0.8)
-        
-        # Add percentage labels
-        for i, (bar, score) in enumerate(zip(bars, scores)):
-            ax.text(score + 2, bar.get_y() + bar.get_height()/2, 
-                   f'{score:.1f}%', va='center', fontweight='bold')
+        # Progress bars and percentage labels (updated per render)
+        bars = ax.barh(y_pos, [100] * len(categories), alpha=0.8)
+        labels = [ax.text(102, bar.get_y() + bar.get_height()/2, '100.0%', 
+                          va='center', fontweight='bold') for bar in bars]
         
         ax.set_yticks(y_pos)
         ax.set_yticklabels(categories)
@@ -326,55 +350,40 @@ class ResumeDashboard:
         ax.set_title('Score Breakdown by Category', fontsize=16, fontweight='bold')
         ax.set_xlim(0, 105)
         
-        plt.tight_layout()
-        return self._fig_to_base64(fig)
+        fig.tight_layout()
+        return {'bars': bars, 'labels': labels}
+    
+    def _update_progress_bars(self, artists: dict, scores: list) -> None:
+        for bar, label, score in zip(artists['bars'], artists['labels'], scores):
+            # Color coding
+            bar.set_width(score)
+            bar.set_facecolor('#e74c3c' if score < 50 else '#f39c12' if score < 75 else '#27ae60')
+            label.set_x(score + 2)
+            label.set_text(f'{score:.1f}%')
     
-    def _create_recommendation_chart(self, analysis: dict) -> str:
+    def _create_recommendation_chart(self, analysis: dict) -> bytes:
         """Create recommendation priority chart"""
         fig, ax = plt.subplots(figsize=(10, 8))
         
-        # Extract recommendation data
-        suggestions = analysis['suggestions']
-        all_suggestions = []
-        
-        for priority, items in suggestions.items():
-            for item in items:
-                all_suggestions.append({
-                    'category': item['category'],
-                    'priority': priority,
-                    'impact': item['impact']
-                })
+        # Mean priority and impact of the suggestions in each category
+        points = self._recommendation_points(analysis['suggestions'])
         
-        if not all_suggestions:
+        if not points:
             ax.text(0.5, 0.5, 'No specific recommendations\nYour resume looks good!', 
                    ha='center', va='center', fontsize=16, color='green', fontweight='bold')
             ax.set_xlim(0, 1)
             ax.set_ylim(0, 1)
             ax.axis('off')
-            return self._fig_to_base64(fig)
-        
-        # Create bubble chart
-        df = pd.DataFrame(all_suggestions)
-        
-        priority_map = {'critical': 3, 'important': 2, 'nice_to_have': 1}
-        impact_map = {'High': 3, 'Medium': 2, 'Low': 1}
-        
-        df['priority_num'] = df['priority'].map(priority_map)
-        df['impact_num'] = df['impact'].map(impact_map)
-        
-        # Group by category
-        grouped = df.groupby('category').agg({
-            'priority_num': 'mean',
-            'impact_num': 'mean'
-        }).reset_index()
+            return self._fig_to_png(fig)
         
         # Create scatter plot
-        scatter = ax.scatter(grouped['priority_num'], grouped['impact_num'], 
-                           s=200, alpha=0.6, c=range(len(grouped)), cmap='viridis')
+        categories, priority_levels, impact_levels = zip(*points)
+        scatter = ax.scatter(priority_levels, impact_levels, 
+                           s=200, alpha=0.6, c=range(len(points)), cmap='viridis')
         
         # Add labels
-        for i, row in grouped.iterrows():
-            ax.annotate(row['category'], (row['priority_num'], row['impact_num']), 
+        for category, priority_level, impact_level in points:
+            ax.annotate(category, (priority_level, impact_level), 
                        xytext=(5, 5), textcoords='offset points', fontsize=10)
         
         ax.set_xlabel('Priority Level')
@@ -387,17 +396,133 @@ class ResumeDashboard:
         ax.grid(True, alpha=0.3)
         
         plt.tight_layout()
-        return self._fig_to_base64(fig)
+        return self._fig_to_png(fig)
+    
+    def _radar_values(self, base: dict) -> list:
+        """Section scores for the radar chart on a 0-10 scale"""
+        values = [
+            min(10, base.get('tech_skills_score', 0)),
+            min(10, base.get('experience_score', 0)),
+            min(10, base.get('education_score', 0)),
+            min(10, base.get('project_score', 0)),
+            min(10, base.get('certifications_score', 0)),
+            min(10, base.get('leadership_score', 0)),
+            10 - len(base.get('red_flags', []))  # Communication proxy
+        ]
+        return [max(0, v) for v in values]
+    
+    def _priority_counts(self, suggestions: dict) -> tuple:
+        """Suggestion categories and, per priority, the count in each category"""
+        categories = []
+        for items in suggestions.values():
+            for item in items:
+                if item['category'] not in categories:
+                    categories.append(item['category'])
+        counts = {}
+        for priority in PRIORITIES:
+            items = suggestions.get(priority, [])
+            counts[priority] = [sum(1 for item in items if item['category'] == category)
+                                for category in categories]
+        return categories, counts
+    
+    def _section_scores(self, base_analysis: dict) -> dict:
+        """Current section scores, keyed like IDEAL_SECTION_SCORES"""
+        return {
+            'Personal Info': base_analysis.get('personal_info_score', 0),
+            'Experience': base_analysis.get('experience_score', 0),
+            'Projects': base_analysis.get('project_score', 0),
+            'Education': base_analysis.get('education_score', 0),
+            'Skills': base_analysis.get('tech_skills_score', 0),
+            'Achievements': base_analysis.get('achievements_score', 0),
+            'Certifications': base_analysis.get('certifications_score', 0)
+        }
+    
+    def _top_keywords(self, resume_text, limit: int = 15) -> list:
+        """Most common resume words as (word, count) pairs"""
+        from collections import Counter
+        
+        words = patterns.KEYWORD_TOKEN.findall(as_context(resume_text).lower)
+        keywords = [w for w in words if w not in KEYWORD_STOP_WORDS]
+        return Counter(keywords).most_common(limit)
+    
+    def _recommendation_points(self, suggestions: dict) -> list:
+        """(category, mean priority level, mean impact level) per suggestion category"""
+        levels = {}
+        for priority, items in suggestions.items():
+            for item in items:
+                priority_levels, impact_levels = levels.setdefault(item['category'], ([], []))
+                if priority in PRIORITY_LEVELS:
+                    priority_levels.append(PRIORITY_LEVELS[priority])
+                if item['impact'] in IMPACT_LEVELS:
+                    impact_levels.append(IMPACT_LEVELS[item['impact']])
+        
+        points = []
+        for category in sorted(levels):
+            priority_levels, impact_levels = levels[category]
+            if priority_levels and impact_levels:
+                points.append((category,
+                               sum(priority_levels) / len(priority_levels),
+                               sum(impact_levels) / len(impact_levels)))
+        return points
+    
+    def _chart_specs(self, analysis: dict, resume_text) -> dict:
+        """Chart.js specs for every dashboard chart, drawn in the browser"""
+        base = analysis['base_analysis']
+        skills = analysis['skills_analysis']
+        position_score = analysis['position_score']
+        
+        categories, counts = self._priority_counts(analysis['suggestions'])
+        sections = self._section_scores(base)
+        keywords = self._top_keywords(resume_text)
+        progress = {
+            'Experience': position_score['experience_score'],
+            'Skills': position_score['skills_score'],
+            'Education': position_score['education_score'],
+            'Projects': position_score['projects_score']
+        }
+        
+        return {
+            'score_gauge': chart_specs.gauge(
+                position_score['weighted_score'], 'Overall Resume Assessment', 'Resume Score'),
+            'skills_radar': chart_specs.radar(
+                RADAR_CATEGORIES, self._radar_values(base), 'Skills & Competencies Radar'),
+            'improvement_priority': chart_specs.bar(
+                categories,
+                [chart_specs.dataset(priority.replace('_', ' ').title(), counts[priority], color)
+                 for priority, color in zip(PRIORITIES, PRIORITY_COLORS)],
+                'Improvement Priorities by Category', stacked=True, axis_label='Number of Suggestions'),
+            'section_comparison': chart_specs.bar(
+                list(sections),
+                [chart_specs.dataset('Current', sections.values(), '#3498db'),
+                 chart_specs.dataset('Industry Standard', IDEAL_SECTION_SCORES.values(), '#27ae60')],
+                'Current vs Industry Standard', axis_label='Score'),
+            'skills_heatmap': chart_specs.bar(
+                ['Required Skills', 'Preferred Skills'],
+                [chart_specs.dataset('Found', [len(skills['required_found']), len(skills['preferred_found'])], '#27ae60'),
+                 chart_specs.dataset('Missing', [len(skills['required_missing']), len(skills['preferred_missing'])], '#e74c3c')],
+                'Skills Matching Analysis', stacked=True, axis_label='Count'),
+            'wordcloud': chart_specs.bar(
+                [word for word, _ in keywords],
+                [chart_specs.dataset('Frequency', [count for _, count in keywords], 'skyblue')],
+                'Top Resume Keywords', horizontal=True, axis_label='Frequency'),
+            'progress_bars': chart_specs.bar(
+                list(progress),
+                [chart_specs.dataset('Score', progress.values(),
+                                     [chart_specs.score_color(score) for score in progress.values()])],
+                'Score Breakdown by Category', horizontal=True, max_value=100, axis_label='Score Percentage'),
+            'recommendation_chart': chart_specs.bubble(
+                self._recommendation_points(analysis['suggestions']),
+                'Improvement Recommendations Matrix',
+                ['Nice to Have', 'Important', 'Critical'],
+                ['Low Impact', 'Medium Impact', 'High Impact']),
+        }
     
-    def _fig_to_base64(self, fig) -> str:
-        """Convert matplotlib figure to base64 string"""
+    def _fig_to_png(self, fig) -> bytes:
+        """Render matplotlib figure to PNG bytes"""
         if not CHARTS_AVAILABLE:
-            return ""
+            return b""
         import io
-        import base64
         buffer = io.BytesIO()
         fig.savefig(buffer, format='png', bbox_inches='tight', dpi=150, facecolor='white')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
         plt.close(fig)
-        return image_base64
\ No newline at end of file
+        return buffer.getvalue()
@@ -0,0 +1,324 @@
+"""Streaming DOCX reader built on ``zipfile`` and ``ElementTree.iterparse``.
+
+python-docx loads the whole package into an object model (every part,
+relationship and element proxy) before a single paragraph can be read,
+which dominates DOCX upload latency. This module walks ``word/document.xml``
+(and the header parts) as a stream of XML events, clearing elements as
+soon as they have been read. It produces the same ``TextBlock``s as the
+layout extraction: paragraphs with their style name, bold and font size;
+tables with their cells; and text box paragraphs, which python-docx does
+not expose at all.
+
+``word/styles.xml`` is often larger than the document itself (Word's
+template defines hundreds of latent styles), so only the styles the
+document actually references are located and parsed. Only direct
+formatting and the paragraph style's own run properties are considered,
+not style inheritance chains.
+"""
+import re
+import zipfile
+from xml.etree.ElementTree import ParseError, fromstring, iterparse
+
+from .layout import TextBlock
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_P, _R, _T, _TAB, _BR, _CR = (W + "p", W + "r", W + "t", W + "tab", W + "br", W + "cr")
+_TBL, _TR, _TC, _TXBX = (W + "tbl", W + "tr", W + "tc", W + "txbxContent")
+_PPR, _RPR = (W + "pPr", W + "rPr")
+_TBL_STYLE = W + "tblPr/" + W + "tblStyle"
+_VAL = W + "val"
+_FALSE = ("0", "false", "off")
+
+_HEADER_PART = re.compile(r"^word/header\d*\.xml$")
+_STYLES_ROOT = re.compile(rb"<w:styles\b[^>]*>")
+_DEFAULT_STYLE = re.compile(rb'w:default="(?:1|true|on)"')
+_STYLE_END = b"</w:style>"
+
+
+class PartTooLarge(ValueError):
+    """Raised when a package part would decompress to more than ``max_part_bytes``."""
+
+
+# Style id standing for the default paragraph style (paragraphs without w:pStyle)
+DEFAULT_STYLE = None
+
+
+def _on(element) -> bool:
+    """Value of a toggle property such as ``<w:b/>`` or ``<w:b w:val="0"/>``."""
+    return element.get(_VAL, "1").lower() not in _FALSE
+
+
+def _run_properties(rpr):
+    """``(bold, size)`` set directly by a ``w:rPr``; None where not set."""
+    if rpr is None:
+        return None, None
+    bold = rpr.find(W + "b")
+    size = rpr.find(W + "sz")
+    half_points = size.get(_VAL, "") if size is not None else ""
+    return (_on(bold) if bold is not None else None,
+            int(half_points) / 2 if half_points.isdigit() else None)
+
+
+def _style_name(name: str) -> str:
+    # Built-in styles are stored lowercase ("heading 1"); Word shows "Heading 1"
+    return name[:1].upper() + name[1:] if name else ""
+
+
+def _style_entry(style):
+    name = style.find(W + "name")
+    bold, size = _run_properties(style.find(_RPR))
+    return _style_name(name.get(_VAL) if name is not None else ""), bold, size
+
+
+def _is_default_paragraph_style(style) -> bool:
+    return (style.get(W + "type") == "paragraph"
+            and style.get(W + "default", "0").lower() in ("1", "true", "on"))
+
+
+def _style_chunk(data: bytes, position: int):
+    """The ``<w:style>...</w:style>`` element of ``data`` enclosing ``position``."""
+    start = data.rfind(b"<w:style ", 0, position)
+    end = data.find(_STYLE_END, position)
+    if start == -1 or end == -1:
+        return None
+    return data[start:end + len(_STYLE_END)]
+
+
+def read_styles(data: bytes, style_ids) -> dict:
+    """
+    Map the referenced style ids to ``(name, bold, size)``.
+
+    Each wanted ``<w:style>`` is located by its ``w:styleId`` and parsed on
+    its own; the rest of ``styles.xml`` is never parsed.
+
+    Args:
+        data: Contents of ``word/styles.xml``
+        style_ids: Style ids to resolve; ``DEFAULT_STYLE`` for the default paragraph style
+
+    Returns:
+        Mapping of style id -> ``(name, bold, size)`` for the ids that were found
+    """
+    root = _STYLES_ROOT.search(data)
+    if root is None:
+        return _read_all_styles(data, style_ids)
+    # Parse each chunk inside the root tag so its namespace prefixes resolve
+    opening, closing = root.group(0), b"</w:styles>"
+
+    def parse(chunk):
+        try:
+            return fromstring(opening + chunk + closing)[0]
+        except (ParseError, IndexError):
+            return None
+
+    styles = {}
+    for style_id in style_ids:
+        if style_id is DEFAULT_STYLE:
+            for match in _DEFAULT_STYLE.finditer(data):
+                chunk = _style_chunk(data, match.start())
+                style = parse(chunk) if chunk else None
+                if style is not None and _is_default_paragraph_style(style):
+                    styles[DEFAULT_STYLE] = _style_entry(style)
+                    break
+            continue
+        position = data.find(b'w:styleId="%s"' % style_id.encode("utf-8"))
+        chunk = _style_chunk(data, position) if position != -1 else None
+        style = parse(chunk) if chunk else None
+        if style is not None:
+            styles[style_id] = _style_entry(style)
+    return styles
+
+
+def _read_all_styles(data: bytes, style_ids) -> dict:
+    """Fallback for unusual namespace prefixes: parse the whole styles part."""
+    styles = {}
+    wanted = set(style_ids)
+    for style in fromstring(data).iter(W + "style"):
+        if style.get(W + "styleId") in wanted:
+            styles[style.get(W + "styleId")] = _style_entry(style)
+        if DEFAULT_STYLE in wanted and _is_default_paragraph_style(style):
+            styles[DEFAULT_STYLE] = _style_entry(style)
+    return styles
+
+
+class _Paragraph:
+    __slots__ = ("text", "parts", "style", "runs")
+
+    def __init__(self):
+        self.text = ""
+        self.parts = []
+        self.style = DEFAULT_STYLE
+        self.runs = []
+
+
+class _Table:
+    __slots__ = ("text", "rows", "style")
+
+    def __init__(self, text, rows, style):
+        self.text = text
+        self.rows = rows
+        self.style = style
+
+
+def _run_text(run) -> str:
+    parts = []
+    for child in run:
+        if child.tag == _T:
+            parts.append(child.text or "")
+        elif child.tag == _TAB:
+            parts.append("\t")
+        elif child.tag in (_BR, _CR):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def iter_part_items(source):
+    """
+    Yield the paragraphs and tables of one WordprocessingML part in reading order.
+
+    Paragraphs inside table cells are folded into their table; text box
+    paragraphs are yielded where they are anchored. The duplicate VML copy
+    of each text box (``mc:Fallback``) is skipped. Items carry style ids,
+    which ``read_docx`` resolves once every part has been read.
+    """
+    paragraphs = []
+    tables = []
+    containers = []
+    fallback = 0
+
+    for event, element in iterparse(source, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == _MC_FALLBACK:
+                fallback += 1
+            elif fallback:
+                continue
+            elif tag == _P:
+                paragraphs.append(_Paragraph())
+            elif tag == _TBL:
+                tables.append([])
+                containers.append(_TBL)
+            elif tag == _TR:
+                tables[-1].append([])
+            elif tag == _TC:
+                tables[-1][-1].append([])
+                containers.append(_TC)
+            elif tag == _TXBX:
+                containers.append(_TXBX)
+            continue
+
+        if tag == _MC_FALLBACK:
+            fallback -= 1
+            element.clear()
+            continue
+        if fallback:
+            continue
+
+        if tag == _R and paragraphs:
+            text = _run_text(element)
+            paragraphs[-1].parts.append(text)
+            if text.strip():
+                paragraphs[-1].runs.append(_run_properties(element.find(_RPR)))
+            element.clear()
+        elif tag == _PPR and paragraphs:
+            style = element.find(W + "pStyle")
+            if style is not None:
+                paragraphs[-1].style = style.get(_VAL)
+        elif tag == _P:
+            paragraph = paragraphs.pop()
+            paragraph.text = "".join(paragraph.parts)
+            element.clear()
+            if containers and containers[-1] == _TC:
+                tables[-1][-1][-1].append(paragraph.text)
+            elif paragraph.text.strip() or not (containers and containers[-1] == _TXBX):
+                yield paragraph
+        elif tag in (_TC, _TXBX):
+            containers.pop()
+        elif tag == _TBL:
+            containers.pop()
+            rows = tuple(
+                tuple(" ".join("\n".join(cell).split()) for cell in row)
+                for row in tables.pop()
+            )
+            rows = tuple(row for row in rows if any(row))
+            style = element.find(_TBL_STYLE)
+            element.clear()
+            if not rows:
+                continue
+            text = "\n".join(" | ".join(row) for row in rows)
+            if containers and containers[-1] == _TC:
+                # Nested table: its text belongs to the enclosing cell
+                tables[-1][-1][-1].append(text)
+                continue
+            yield _Table(text, rows, style.get(_VAL) if style is not None else "")
+
+
+def _block(item, styles: dict):
+    """TextBlock for a paragraph or table, or None for an empty paragraph."""
+    if isinstance(item, _Table):
+        return TextBlock(item.text, style=styles.get(item.style, ("",))[0], cells=item.rows)
+
+    text = item.text.strip()
+    if not text:
+        return None
+    style_name, style_bold, style_size = styles.get(item.style, ("", None, None))
+    if item.style and not style_name:
+        style_name = item.style  # Style id missing from styles.xml
+    sizes = [size or style_size for _, size in item.runs]
+    sizes = [size for size in sizes if size]
+    bold = bool(item.runs) and all(
+        bold if bold is not None else bool(style_bold) for bold, _ in item.runs
+    )
+    return TextBlock(text, size=max(sizes) if sizes else None, bold=bold, style=style_name)
+
+
+def _open_part(archive, name, max_part_bytes):
+    """Open a package part, checking its declared size before decompressing anything."""
+    info = archive.getinfo(name)
+    if max_part_bytes and info.file_size > max_part_bytes:
+        raise PartTooLarge(
+            f"{name} expands to {info.file_size} bytes; the limit is {max_part_bytes}."
+        )
+    # ZipExtFile stops at file_size, so a part cannot inflate past the size checked here
+    return archive.open(info)
+
+
+def read_docx(file, max_part_bytes=None):
+    """
+    Read a DOCX upload's text and layout blocks without python-docx.
+
+    Header paragraphs come first (identical headers, e.g. first-page and
+    default, only once), followed by the document body.
+
+    Args:
+        file: Path or binary file object of the .docx package
+        max_part_bytes: Uncompressed size limit of each part read, or None
+
+    Returns:
+        ``(text, blocks)``: newline-terminated lines and their ``TextBlock``s
+
+    Raises:
+        PartTooLarge: A part read is bigger than ``max_part_bytes``
+    """
+    items = []
+    with zipfile.ZipFile(file) as archive:
+        seen_headers = set()
+        for name in sorted(n for n in archive.namelist() if _HEADER_PART.match(n)):
+            with _open_part(archive, name, max_part_bytes) as source:
+                header = [item for item in iter_part_items(source) if item.text.strip()]
+            key = tuple(item.text for item in header)
+            if key and key not in seen_headers:
+                seen_headers.add(key)
+                items.extend(header)
+        with _open_part(archive, "word/document.xml", max_part_bytes) as source:
+            items.extend(iter_part_items(source))
+        try:
+            with _open_part(archive, "word/styles.xml", max_part_bytes) as source:
+                styles_xml = source.read()
+        except KeyError:
+            styles_xml = b""
+
+    styles = read_styles(styles_xml, {item.style for item in items}) if styles_xml else {}
+    blocks = [block for block in (_block(item, styles) for item in items) if block is not None]
+    return "".join(item.text + "\n" for item in items), blocks
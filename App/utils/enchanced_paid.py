@@ -1,63 +1,119 @@
-import re
-import spacy
+import copy
+
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
     import numpy as np
+    from .semantic import corpus_fingerprint, get_semantic_index
     ML_AVAILABLE = True
 except ImportError:
     ML_AVAILABLE = False
     import math
 
+from .common import get_nlp
+from .context import as_context
+from . import patterns
+from .result_cache import analysis_cache, register_rules
+
+# Industry-specific skill databases
+SKILL_DATABASES = {
+    'software_engineer': {
+        'core_skills': ['python', 'java', 'javascript', 'c++', 'sql', 'git', 'algorithms', 'data structures'],
+        'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring', 'node.js', 'express'],
+        'tools': ['docker', 'kubernetes', 'jenkins', 'aws', 'azure', 'gcp', 'mongodb', 'postgresql'],
+        'methodologies': ['agile', 'scrum', 'devops', 'ci/cd', 'tdd', 'microservices'],
+        'experience_keywords': ['developed', 'built', 'implemented', 'designed', 'optimized', 'scaled', 'deployed']
+    },
+    'data_scientist': {
+        'core_skills': ['python', 'r', 'sql', 'statistics', 'machine learning', 'deep learning'],
+        'frameworks': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras'],
+        'tools': ['jupyter', 'tableau', 'power bi', 'spark', 'hadoop', 'aws', 'docker'],
+        'methodologies': ['data mining', 'feature engineering', 'model validation', 'a/b testing'],
+        'experience_keywords': ['analyzed', 'modeled', 'predicted', 'visualized', 'extracted', 'processed']
+    },
+    'product_manager': {
+        'core_skills': ['product strategy', 'roadmap', 'stakeholder management', 'user research', 'analytics'],
+        'frameworks': ['agile', 'scrum', 'lean', 'design thinking', 'user stories'],
+        'tools': ['jira', 'confluence', 'figma', 'mixpanel', 'google analytics', 'sql'],
+        'methodologies': ['market research', 'competitive analysis', 'go-to-market', 'product launch'],
+        'experience_keywords': ['launched', 'managed', 'coordinated', 'prioritized', 'defined', 'executed']
+    },
+    'marketing_manager': {
+        'core_skills': ['digital marketing', 'seo', 'sem', 'content marketing', 'social media', 'analytics'],
+        'frameworks': ['marketing automation', 'lead generation', 'conversion optimization', 'brand management'],
+        'tools': ['google ads', 'facebook ads', 'hubspot', 'salesforce', 'mailchimp', 'hootsuite'],
+        'methodologies': ['campaign management', 'market segmentation', 'customer acquisition', 'retention'],
+        'experience_keywords': ['increased', 'grew', 'generated', 'optimized', 'managed', 'executed']
+    }
+}
+
+# Job requirement templates the resume is compared with in semantic matching
+JOB_TEMPLATES = {
+    'software_engineer': """
+    Software Engineer with experience in programming languages like Python, Java, JavaScript.
+    Experience with frameworks like React, Django, Spring. Knowledge of databases, cloud platforms,
+    version control systems. Strong problem-solving skills and experience with agile methodologies.
+    """,
+    'data_scientist': """
+    Data Scientist with expertise in Python, R, machine learning, statistics, data analysis.
+    Experience with pandas, numpy, scikit-learn, TensorFlow. Knowledge of data visualization,
+    SQL databases, big data technologies. Strong analytical and mathematical skills.
+    """,
+    'product_manager': """
+    Product Manager with experience in product strategy, roadmap planning, stakeholder management.
+    Knowledge of agile methodologies, user research, analytics tools. Strong communication and
+    leadership skills. Experience with product launches and go-to-market strategies.
+    """,
+    'marketing_manager': """
+    Marketing Manager with expertise in digital marketing, SEO, content marketing, social media.
+    Experience with marketing automation tools, analytics platforms, campaign management.
+    Strong creative and analytical skills with focus on customer acquisition and retention.
+    """
+}
+
+# ATS-friendly keywords
+ATS_KEYWORDS = {
+    'action_verbs': ['achieved', 'administered', 'analyzed', 'built', 'collaborated', 'created', 
+                     'delivered', 'developed', 'executed', 'implemented', 'improved', 'increased',
+                     'led', 'managed', 'optimized', 'organized', 'reduced', 'resolved', 'streamlined'],
+    'quantifiers': patterns.QUANTIFIER_PATTERNS
+}
+
+# Words marking a line as part of an experience/project section
+CONTEXT_KEYWORDS = ['experience', 'project', 'work', 'job']
+
+SKILL_VARIATIONS = {
+    'javascript': ['js', 'node.js', 'nodejs'],
+    'python': ['py'],
+    'machine learning': ['ml', 'artificial intelligence', 'ai'],
+    'tensorflow': ['tf'],
+    'postgresql': ['postgres'],
+    'mongodb': ['mongo'],
+    'amazon web services': ['aws'],
+    'google cloud platform': ['gcp'],
+    'microsoft azure': ['azure']
+}
+
+
+register_rules('enchanced_paid.skill_databases', SKILL_DATABASES)
+register_rules('enchanced_paid.ats_keywords', ATS_KEYWORDS)
+register_rules('enchanced_paid.skill_variations', SKILL_VARIATIONS)
+register_rules('enchanced_paid.job_templates', JOB_TEMPLATES)
+if ML_AVAILABLE:
+    register_rules('enchanced_paid.semantic_corpus', corpus_fingerprint())
+
+
 class AdvancedResumeAnalyzer:
     def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
-        
-        # Industry-specific skill databases
-        self.skill_databases = {
-            'software_engineer': {
-                'core_skills': ['python', 'java', 'javascript', 'c++', 'sql', 'git', 'algorithms', 'data structures'],
-                'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring', 'node.js', 'express'],
-                'tools': ['docker', 'kubernetes', 'jenkins', 'aws', 'azure', 'gcp', 'mongodb', 'postgresql'],
-                'methodologies': ['agile', 'scrum', 'devops', 'ci/cd', 'tdd', 'microservices'],
-                'experience_keywords': ['developed', 'built', 'implemented', 'designed', 'optimized', 'scaled', 'deployed']
-            },
-            'data_scientist': {
-                'core_skills': ['python', 'r', 'sql', 'statistics', 'machine learning', 'deep learning'],
-                'frameworks': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras'],
-                'tools': ['jupyter', 'tableau', 'power bi', 'spark', 'hadoop', 'aws', 'docker'],
-                'methodologies': ['data mining', 'feature engineering', 'model validation', 'a/b testing'],
-                'experience_keywords': ['analyzed', 'modeled', 'predicted', 'visualized', 'extracted', 'processed']
-            },
-            'product_manager': {
-                'core_skills': ['product strategy', 'roadmap', 'stakeholder management', 'user research', 'analytics'],
-                'frameworks': ['agile', 'scrum', 'lean', 'design thinking', 'user stories'],
-                'tools': ['jira', 'confluence', 'figma', 'mixpanel', 'google analytics', 'sql'],
-                'methodologies': ['market research', 'competitive analysis', 'go-to-market', 'product launch'],
-                'experience_keywords': ['launched', 'managed', 'coordinated', 'prioritized', 'defined', 'executed']
-            },
-            'marketing_manager': {
-                'core_skills': ['digital marketing', 'seo', 'sem', 'content marketing', 'social media', 'analytics'],
-                'frameworks': ['marketing automation', 'lead generation', 'conversion optimization', 'brand management'],
-                'tools': ['google ads', 'facebook ads', 'hubspot', 'salesforce', 'mailchimp', 'hootsuite'],
-                'methodologies': ['campaign management', 'market segmentation', 'customer acquisition', 'retention'],
-                'experience_keywords': ['increased', 'grew', 'generated', 'optimized', 'managed', 'executed']
-            }
-        }
-        
-        # ATS-friendly keywords
-        self.ats_keywords = {
-            'action_verbs': ['achieved', 'administered', 'analyzed', 'built', 'collaborated', 'created', 
-                           'delivered', 'developed', 'executed', 'implemented', 'improved', 'increased',
-                           'led', 'managed', 'optimized', 'organized', 'reduced', 'resolved', 'streamlined'],
-            'quantifiers': [r'\d+%', r'\$\d+', r'\d+\s*(million|thousand|k|m)', r'\d+\s*(users|customers|clients)',
-                          r'\d+\s*(projects|teams|people)', r'\d+\s*(years|months)', r'\d+x\s*improvement']
-        }
+        self.skill_databases = SKILL_DATABASES
+        self.ats_keywords = ATS_KEYWORDS
+
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline from the process-wide registry (loaded on first use)"""
+        return get_nlp()
 
-    def advanced_skill_extraction(self, resume_text: str, position: str) -> dict:
+    def advanced_skill_extraction(self, resume_text, position: str) -> dict:
         """Advanced skill extraction using NLP and fuzzy matching"""
-        text_lower = resume_text.lower()
-        doc = self.nlp(resume_text)
+        ctx = as_context(resume_text)
         
         position_skills = self.skill_databases.get(position, self.skill_databases['software_engineer'])
         
@@ -67,19 +123,19 @@ class AdvancedResumeAnalyzer:
         
         for category, skills in position_skills.items():
             for skill in skills:
-                # Exact match
-                if skill in text_lower:
+                # Whole-word match, answered from the shared matcher pass
+                if ctx.mentions(skill):
                     found_skills[category].append(skill)
                     # Context scoring - higher score if skill appears in experience/projects section
-                    context_score = self._calculate_context_score(resume_text, skill)
+                    context_score = self._calculate_context_score(ctx, skill)
                     skill_scores[skill] = context_score
                 
                 # Fuzzy matching for variations
                 variations = self._get_skill_variations(skill)
                 for variation in variations:
-                    if variation in text_lower and variation not in found_skills[category]:
+                    if ctx.mentions(variation) and variation not in found_skills[category]:
                         found_skills[category].append(variation)
-                        skill_scores[variation] = self._calculate_context_score(resume_text, variation)
+                        skill_scores[variation] = self._calculate_context_score(ctx, variation)
         
         return {
             'found_skills': found_skills,
@@ -87,68 +143,56 @@ class AdvancedResumeAnalyzer:
             'total_skills': sum(len(skills) for skills in found_skills.values())
         }
 
-    def _calculate_context_score(self, resume_text: str, skill: str) -> float:
+    def _calculate_context_score(self, resume_text, skill: str) -> float:
         """Calculate skill relevance based on context"""
-        lines = resume_text.lower().split('\n')
         score = 1.0
         
-        for i, line in enumerate(lines):
-            if skill in line:
-                # Higher score if in experience/project sections
-                if any(keyword in line for keyword in ['experience', 'project', 'work', 'job']):
-                    score += 0.5
-                # Higher score if mentioned with action verbs
-                if any(verb in line for verb in self.ats_keywords['action_verbs']):
-                    score += 0.3
-                # Higher score if mentioned with quantifiers
-                if any(re.search(pattern, line) for pattern in self.ats_keywords['quantifiers']):
-                    score += 0.4
+        for line in as_context(resume_text).scan.lines_containing(skill):
+            # Higher score if in experience/project sections
+            if 'context' in line.groups:
+                score += 0.5
+            # Higher score if mentioned with action verbs
+            if 'action_verbs' in line.groups:
+                score += 0.3
+            # Higher score if mentioned with quantifiers
+            if line.quantified:
+                score += 0.4
         
         return min(score, 3.0)  # Cap at 3.0
 
     def _get_skill_variations(self, skill: str) -> list:
         """Get common variations of a skill"""
-        variations = {
-            'javascript': ['js', 'node.js', 'nodejs'],
-            'python': ['py'],
-            'machine learning': ['ml', 'artificial intelligence', 'ai'],
-            'tensorflow': ['tf'],
-            'postgresql': ['postgres'],
-            'mongodb': ['mongo'],
-            'amazon web services': ['aws'],
-            'google cloud platform': ['gcp'],
-            'microsoft azure': ['azure']
-        }
-        return variations.get(skill, [])
+        return SKILL_VARIATIONS.get(skill, [])
 
-    def calculate_ats_score(self, resume_text: str) -> dict:
+    def calculate_ats_score(self, resume_text) -> dict:
         """Calculate ATS (Applicant Tracking System) compatibility score"""
+        ctx = as_context(resume_text)
+        resume_text = ctx.text
         score = 0
         details = {}
         
         # 1. Action verbs usage
-        action_verb_count = sum(1 for verb in self.ats_keywords['action_verbs'] 
-                               if verb in resume_text.lower())
+        action_verb_count = len(ctx.scan.group_terms('action_verbs'))
         action_score = min(action_verb_count * 2, 20)
         score += action_score
         details['action_verbs'] = {'count': action_verb_count, 'score': action_score}
         
         # 2. Quantified achievements
-        quantifier_count = sum(1 for pattern in self.ats_keywords['quantifiers'] 
-                              if re.search(pattern, resume_text, re.IGNORECASE))
+        quantifier_count = sum(1 for pattern in patterns.QUANTIFIERS 
+                              if pattern.search(resume_text))
         quant_score = min(quantifier_count * 5, 25)
         score += quant_score
         details['quantified_achievements'] = {'count': quantifier_count, 'score': quant_score}
         
         # 3. Section structure
         sections = ['experience', 'education', 'skills', 'projects']
-        section_count = sum(1 for section in sections if section in resume_text.lower())
+        section_count = sum(1 for section in sections if section in ctx.lower)
         section_score = section_count * 5
         score += section_score
         details['sections'] = {'found': section_count, 'score': section_score}
         
         # 4. Length optimization (300-800 words ideal)
-        word_count = len(resume_text.split())
+        word_count = ctx.word_count
         if 300 <= word_count <= 800:
             length_score = 15
         elif 200 <= word_count < 300 or 800 < word_count <= 1000:
@@ -159,8 +203,8 @@ class AdvancedResumeAnalyzer:
         details['length'] = {'word_count': word_count, 'score': length_score}
         
         # 5. Contact information completeness
-        email = bool(re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', resume_text))
-        phone = bool(re.search(r'\+?[\d\s\-\(\)]{10,}', resume_text))
+        email = bool(patterns.EMAIL.search(resume_text))
+        phone = bool(patterns.ATS_PHONE.search(resume_text))
         contact_score = (email + phone) * 5
         score += contact_score
         details['contact_info'] = {'email': email, 'phone': phone, 'score': contact_score}
@@ -178,82 +222,58 @@ class AdvancedResumeAnalyzer:
         elif score >= 55: return 'Fair'
         else: return 'Needs Improvement'
 
-    def semantic_job_matching(self, resume_text: str, position: str) -> dict:
+    def semantic_job_matching(self, resume_text, position: str) -> dict:
         """Use semantic similarity to match resume with job requirements"""
+        return self.semantic_job_matches(resume_text, [position])[position]
+
+    def semantic_job_matches(self, resume_text, positions) -> dict:
+        """
+        Semantic match of the resume against several positions' job templates at once.
+
+        The resume is vectorized once with the pre-fitted TF-IDF model (see
+        ``App.utils.semantic``) and compared with the cached template rows
+        using sparse products.
+
+        Args:
+            resume_text: Resume text or AnalysisContext
+            positions: Position keys (unknown ones use the software engineer template)
+
+        Returns:
+            Mapping of position -> ``{'similarity_score', 'matching_terms', 'match_grade'}``
+        """
+        ctx = as_context(resume_text)
+        positions = list(dict.fromkeys(positions))
         
         if not ML_AVAILABLE:
             # Fallback keyword matching
-            position_skills = self.skill_databases.get(position, self.skill_databases['software_engineer'])
-            all_required_skills = []
-            for skills in position_skills.values():
-                all_required_skills.extend(skills)
-            
-            found_skills = [skill for skill in all_required_skills if skill in resume_text.lower()]
-            similarity_score = (len(found_skills) / len(all_required_skills)) * 100 if all_required_skills else 50
-            
-            return {
-                'similarity_score': similarity_score,
-                'matching_terms': found_skills[:10],
-                'match_grade': self._get_match_grade(similarity_score)
-            }
-        
-        # Job requirement templates
-        job_templates = {
-            'software_engineer': """
-            Software Engineer with experience in programming languages like Python, Java, JavaScript.
-            Experience with frameworks like React, Django, Spring. Knowledge of databases, cloud platforms,
-            version control systems. Strong problem-solving skills and experience with agile methodologies.
-            """,
-            'data_scientist': """
-            Data Scientist with expertise in Python, R, machine learning, statistics, data analysis.
-            Experience with pandas, numpy, scikit-learn, TensorFlow. Knowledge of data visualization,
-            SQL databases, big data technologies. Strong analytical and mathematical skills.
-            """,
-            'product_manager': """
-            Product Manager with experience in product strategy, roadmap planning, stakeholder management.
-            Knowledge of agile methodologies, user research, analytics tools. Strong communication and
-            leadership skills. Experience with product launches and go-to-market strategies.
-            """,
-            'marketing_manager': """
-            Marketing Manager with expertise in digital marketing, SEO, content marketing, social media.
-            Experience with marketing automation tools, analytics platforms, campaign management.
-            Strong creative and analytical skills with focus on customer acquisition and retention.
-            """
-        }
-        
-        job_description = job_templates.get(position, job_templates['software_engineer'])
+            matches = {}
+            for position in positions:
+                position_skills = self.skill_databases.get(position, self.skill_databases['software_engineer'])
+                all_required_skills = []
+                for skills in position_skills.values():
+                    all_required_skills.extend(skills)
+                
+                found_skills = [skill for skill in all_required_skills if ctx.mentions(skill)]
+                similarity_score = (len(found_skills) / len(all_required_skills)) * 100 if all_required_skills else 50
+                matches[position] = {
+                    'similarity_score': similarity_score,
+                    'matching_terms': found_skills[:10],
+                    'match_grade': self._get_match_grade(similarity_score)
+                }
+            return matches
         
         try:
-            # Create TF-IDF vectors
-            vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
-            tfidf_matrix = vectorizer.fit_transform([resume_text, job_description])
-            
-            # Calculate cosine similarity
-            similarity_score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            
-            # Get top matching terms
-            feature_names = vectorizer.get_feature_names_out()
-            resume_vector = tfidf_matrix[0].toarray()[0]
-            job_vector = tfidf_matrix[1].toarray()[0]
-            
-            # Find common important terms
-            common_terms = []
-            for i, (resume_score, job_score) in enumerate(zip(resume_vector, job_vector)):
-                if resume_score > 0 and job_score > 0:
-                    common_terms.append((feature_names[i], resume_score * job_score))
-            
-            # Sort by relevance
-            common_terms.sort(key=lambda x: x[1], reverse=True)
-            top_matches = [term[0] for term in common_terms[:10]]
-            
+            scored = get_semantic_index().match(ctx.semantic_vector, positions)
         except Exception:
-            similarity_score = 0.5
-            top_matches = []
+            scored = [(0.5, [])] * len(positions)
         
         return {
-            'similarity_score': similarity_score * 100,
-            'matching_terms': top_matches,
-            'match_grade': self._get_match_grade(similarity_score * 100)
+            position: {
+                'similarity_score': similarity_score * 100,
+                'matching_terms': top_matches,
+                'match_grade': self._get_match_grade(similarity_score * 100)
+            }
+            for position, (similarity_score, top_matches) in zip(positions, scored)
         }
 
     def _get_match_grade(self, score: float) -> str:
@@ -263,20 +283,112 @@ class AdvancedResumeAnalyzer:
         elif score >= 50: return 'Fair Match'
         else: return 'Poor Match'
 
-    def comprehensive_analysis(self, resume_text: str, position: str) -> dict:
-        """Perform comprehensive resume analysis"""
+    def comprehensive_analysis(self, resume_text, position: str) -> dict:
+        """Perform comprehensive resume analysis (accepts text or an AnalysisContext)"""
+        ctx = as_context(resume_text)
+        return analysis_cache.get_or_compute(
+            'advanced_analysis', ctx.cache_key, position, lambda: self._comprehensive_analysis(ctx, position))
+
+    def best_fit_positions(self, resume_text, top: int = None) -> list:
+        """
+        Positions ranked by how well the resume matches their job template.
+
+        All positions are scored at once against the semantic index's
+        template matrix (see ``SemanticIndex.rank``); without scikit-learn
+        the keyword fallback of ``semantic_job_matches`` is ranked instead.
+
+        Args:
+            resume_text: Resume text or AnalysisContext
+            top: Number of positions to return (all when None)
+
+        Returns:
+            ``{'position', 'similarity_score', 'match_grade'}`` dicts, best fit first
+        """
+        ctx = as_context(resume_text)
+        ranked = analysis_cache.get_or_compute(
+            'best_fit_positions', ctx.cache_key, None, lambda: self._rank_positions(ctx))
+        return ranked if top is None else ranked[:top]
+
+    def _rank_positions(self, ctx) -> list:
+        """Uncached body of best_fit_positions"""
+        if ML_AVAILABLE:
+            try:
+                scored = get_semantic_index().rank(ctx.semantic_vector)
+            except Exception:
+                scored = None
+            if scored is not None:
+                return [
+                    {
+                        'position': position,
+                        'similarity_score': similarity_score * 100,
+                        'match_grade': self._get_match_grade(similarity_score * 100)
+                    }
+                    for position, similarity_score in scored
+                ]
+
+        matches = self.semantic_job_matches(ctx, JOB_TEMPLATES)
+        ranked = sorted(matches.items(), key=lambda item: -item[1]['similarity_score'])
+        return [
+            {
+                'position': position,
+                'similarity_score': match['similarity_score'],
+                'match_grade': match['match_grade']
+            }
+            for position, match in ranked
+        ]
+
+    def comprehensive_analyses(self, resume_text, positions) -> dict:
+        """
+        ``comprehensive_analysis`` for several positions, sharing the position-independent work.
+
+        The ATS score and experience quality are computed once, and the
+        semantic matches of all positions in one vectorized step, instead of
+        once per position. Each result is the same as (and cached as)
+        ``comprehensive_analysis(resume_text, position)``.
+
+        Args:
+            resume_text: Resume text or AnalysisContext
+            positions: Position keys to analyze
+
+        Returns:
+            Mapping of position -> analysis, in the order of ``positions``
+        """
+        ctx = as_context(resume_text)
+        positions = list(dict.fromkeys(positions))
+        analyses = {position: analysis_cache.get('advanced_analysis', ctx.cache_key, position)
+                    for position in positions}
+        missing = [position for position, analysis in analyses.items() if analysis is None]
+        if missing:
+            ats_analysis = self.calculate_ats_score(ctx)
+            experience_analysis = self._analyze_experience_quality(ctx)
+            semantic_analyses = self.semantic_job_matches(ctx, missing)
+            for position in missing:
+                # Copies, so that no two results share (mutable) parts
+                analyses[position] = analysis_cache.get_or_compute(
+                    'advanced_analysis', ctx.cache_key, position,
+                    lambda: self._comprehensive_analysis(
+                        ctx, position, copy.deepcopy(ats_analysis), semantic_analyses[position],
+                        copy.deepcopy(experience_analysis)))
+        return analyses
+
+    def _comprehensive_analysis(self, ctx, position: str, ats_analysis=None,
+                                semantic_analysis=None, experience_analysis=None) -> dict:
+        """Uncached body of comprehensive_analysis; precomputed parts are reused when given"""
         
         # 1. Advanced skill analysis
-        skill_analysis = self.advanced_skill_extraction(resume_text, position)
+        skill_analysis = self.advanced_skill_extraction(ctx, position)
         
         # 2. ATS compatibility
-        ats_analysis = self.calculate_ats_score(resume_text)
+        if ats_analysis is None:
+            ats_analysis = self.calculate_ats_score(ctx)
         
         # 3. Semantic job matching
-        semantic_analysis = self.semantic_job_matching(resume_text, position)
+        if semantic_analysis is None:
+            semantic_analysis = self.semantic_job_matching(ctx, position)
         
         # 4. Experience quality analysis
-        experience_analysis = self._analyze_experience_quality(resume_text)
+        if experience_analysis is None:
+            experience_analysis = self._analyze_experience_quality(ctx)
         
         # 5. Calculate weighted final score
         final_score = self._calculate_weighted_score(
@@ -294,16 +406,16 @@ class AdvancedResumeAnalyzer:
             )
         }
 
-    def _analyze_experience_quality(self, resume_text: str) -> dict:
+    def _analyze_experience_quality(self, resume_text) -> dict:
         """Analyze quality and relevance of experience descriptions"""
-        doc = self.nlp(resume_text)
+        ctx = as_context(resume_text)
         
         # Extract experience-related sentences
         experience_sentences = []
-        for sent in doc.sents:
-            if any(keyword in sent.text.lower() for keyword in 
+        for sent in ctx.sentences:
+            if any(keyword in sent.lower() for keyword in 
                   ['experience', 'worked', 'developed', 'managed', 'led', 'built']):
-                experience_sentences.append(sent.text)
+                experience_sentences.append(sent)
         
         # Quality metrics
         quality_score = 0
@@ -323,8 +435,8 @@ class AdvancedResumeAnalyzer:
         # 2. Quantified results
         quantified_results = 0
         for sent in experience_sentences:
-            for pattern in self.ats_keywords['quantifiers']:
-                if re.search(pattern, sent, re.IGNORECASE):
+            for pattern in patterns.QUANTIFIERS:
+                if pattern.search(sent):
                     quantified_results += 1
         
         quality_score += min(quantified_results * 5, 25)
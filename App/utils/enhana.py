@@ -9,55 +9,71 @@ try:
 except ImportError:
     CHARTS_AVAILABLE = False
 from .rating import *
+from . import chart_specs
+from .chart_cache import CachedChart
+from .chart_jobs import CLIENT, INLINE, PYPLOT_LOCK, chart_sources, resolve_chart_mode
+from .figure_templates import get_template
+from .result_cache import analysis_cache, register_rules
+
+JOB_REQUIREMENTS = {
+    'software_engineer': {
+        'required_skills': ['python', 'java', 'javascript', 'sql', 'git', 'algorithms', 'data structures'],
+        'preferred_skills': ['react', 'node.js', 'aws', 'docker', 'kubernetes', 'mongodb', 'postgresql'],
+        'experience_weight': 0.3,
+        'skills_weight': 0.4,
+        'education_weight': 0.2,
+        'projects_weight': 0.1
+    },
+    'data_scientist': {
+        'required_skills': ['python', 'r', 'sql', 'machine learning', 'statistics', 'pandas', 'numpy'],
+        'preferred_skills': ['tensorflow', 'pytorch', 'scikit-learn', 'tableau', 'power bi', 'spark', 'hadoop'],
+        'experience_weight': 0.25,
+        'skills_weight': 0.45,
+        'education_weight': 0.2,
+        'projects_weight': 0.1
+    },
+    'product_manager': {
+        'required_skills': ['product strategy', 'roadmap', 'stakeholder management', 'analytics', 'agile'],
+        'preferred_skills': ['jira', 'confluence', 'sql', 'a/b testing', 'user research', 'wireframing'],
+        'experience_weight': 0.4,
+        'skills_weight': 0.25,
+        'education_weight': 0.15,
+        'projects_weight': 0.2
+    },
+    'marketing_manager': {
+        'required_skills': ['digital marketing', 'seo', 'content marketing', 'analytics', 'campaign management'],
+        'preferred_skills': ['google ads', 'facebook ads', 'hubspot', 'salesforce', 'photoshop', 'canva'],
+        'experience_weight': 0.35,
+        'skills_weight': 0.3,
+        'education_weight': 0.15,
+        'projects_weight': 0.2
+    }
+}
+
+register_rules('enhana.job_requirements', JOB_REQUIREMENTS)
+
 
 class EnhancedResumeAnalyzer:
     def __init__(self):
-        self.job_requirements = {
-            'software_engineer': {
-                'required_skills': ['python', 'java', 'javascript', 'sql', 'git', 'algorithms', 'data structures'],
-                'preferred_skills': ['react', 'node.js', 'aws', 'docker', 'kubernetes', 'mongodb', 'postgresql'],
-                'experience_weight': 0.3,
-                'skills_weight': 0.4,
-                'education_weight': 0.2,
-                'projects_weight': 0.1
-            },
-            'data_scientist': {
-                'required_skills': ['python', 'r', 'sql', 'machine learning', 'statistics', 'pandas', 'numpy'],
-                'preferred_skills': ['tensorflow', 'pytorch', 'scikit-learn', 'tableau', 'power bi', 'spark', 'hadoop'],
-                'experience_weight': 0.25,
-                'skills_weight': 0.45,
-                'education_weight': 0.2,
-                'projects_weight': 0.1
-            },
-            'product_manager': {
-                'required_skills': ['product strategy', 'roadmap', 'stakeholder management', 'analytics', 'agile'],
-                'preferred_skills': ['jira', 'confluence', 'sql', 'a/b testing', 'user research', 'wireframing'],
-                'experience_weight': 0.4,
-                'skills_weight': 0.25,
-                'education_weight': 0.15,
-                'projects_weight': 0.2
-            },
-            'marketing_manager': {
-                'required_skills': ['digital marketing', 'seo', 'content marketing', 'analytics', 'campaign management'],
-                'preferred_skills': ['google ads', 'facebook ads', 'hubspot', 'salesforce', 'photoshop', 'canva'],
-                'experience_weight': 0.35,
-                'skills_weight': 0.3,
-                'education_weight': 0.15,
-                'projects_weight': 0.2
-            }
-        }
+        self.job_requirements = JOB_REQUIREMENTS
 
-    def analyze_for_position(self, resume_text: str, position: str = 'software_engineer') -> dict:
-        """Comprehensive position-based resume analysis"""
+    def analyze_for_position(self, resume_text, position: str = 'software_engineer') -> dict:
+        """Comprehensive position-based resume analysis (accepts text or an AnalysisContext)"""
+        ctx = as_context(resume_text)
+        return analysis_cache.get_or_compute(
+            'position_analysis', ctx.cache_key, position, lambda: self._analyze_for_position(ctx, position))
+
+    def _analyze_for_position(self, ctx, position: str) -> dict:
+        """Uncached body of analyze_for_position"""
         
         # Get base analysis
-        base_analysis = calculate_resume_score(resume_text)
+        base_analysis = calculate_resume_score(ctx)
         
         # Position-specific analysis
         job_req = self.job_requirements.get(position, self.job_requirements['software_engineer'])
         
         # Skills matching
-        skills_match = self._analyze_skills_match(resume_text, job_req)
+        skills_match = self._analyze_skills_match(ctx, job_req)
         
         # Calculate position-specific score
         position_score = self._calculate_position_score(base_analysis, skills_match, job_req)
@@ -77,9 +93,9 @@ class EnhancedResumeAnalyzer:
         
         return analysis
 
-    def _analyze_skills_match(self, resume_text: str, job_req: dict) -> dict:
+    def _analyze_skills_match(self, resume_text, job_req: dict) -> dict:
         """Analyze how well resume skills match job requirements"""
-        text_lower = resume_text.lower()
+        ctx = as_context(resume_text)
         
         required_found = []
         required_missing = []
@@ -87,13 +103,13 @@ class EnhancedResumeAnalyzer:
         preferred_missing = []
         
         for skill in job_req['required_skills']:
-            if skill.lower() in text_lower:
+            if ctx.mentions(skill):
                 required_found.append(skill)
             else:
                 required_missing.append(skill)
         
         for skill in job_req['preferred_skills']:
-            if skill.lower() in text_lower:
+            if ctx.mentions(skill):
                 preferred_found.append(skill)
             else:
                 preferred_missing.append(skill)
@@ -249,38 +265,77 @@ class EnhancedResumeAnalyzer:
             'overall_score': position_score['weighted_score']
         }
 
-    def generate_charts(self, charts_data: dict) -> dict:
-        """Generate all visualization charts"""
+    def generate_charts(self, charts_data: dict, mode: str = None) -> dict:
+        """Generate all visualization charts as image sources, or as Chart.js specs in client mode"""
+        
+        if resolve_chart_mode(mode) == CLIENT:
+            return self.chart_specs(charts_data)
         
         if not CHARTS_AVAILABLE:
             return {key: "" for key in ['gauge', 'pie', 'skills_bar', 'radar', 'sections_bar']}
         
-        try:
-            plt.style.use('seaborn-v0_8')
-        except:
-            pass
-        charts = {}
-        
-        # 1. Overall Score Gauge Chart
-        charts['gauge'] = self._create_gauge_chart(charts_data['overall_score'])
-        
-        # 2. Score Breakdown Pie Chart
-        charts['pie'] = self._create_pie_chart(charts_data['score_breakdown'])
-        
-        # 3. Skills Analysis Bar Chart
-        charts['skills_bar'] = self._create_skills_bar_chart(charts_data['skills_data'])
-        
-        # 4. Section Scores Radar Chart
-        charts['radar'] = self._create_radar_chart(charts_data['section_scores'])
+        with PYPLOT_LOCK:
+            try:
+                plt.style.use('seaborn-v0_8')
+            except:
+                pass
+        
+        # Charts are rendered now or in the background (settings.CHART_RENDERING).
+        # Each is cached under the data it is drawn from.
+        charts = {
+            # 1. Overall Score Gauge Chart
+            'gauge': CachedChart('analysis.gauge', charts_data['overall_score'],
+                                 lambda: self._create_gauge_chart(charts_data['overall_score'])),
+            # 2. Score Breakdown Pie Chart
+            'pie': CachedChart('analysis.pie', charts_data['score_breakdown'],
+                               lambda: self._create_pie_chart(charts_data['score_breakdown'])),
+            # 3. Skills Analysis Bar Chart
+            'skills_bar': CachedChart('analysis.skills_bar', charts_data['skills_data'],
+                                      lambda: self._create_skills_bar_chart(charts_data['skills_data'])),
+            # 4. Section Scores Radar Chart
+            'radar': CachedChart('analysis.radar', charts_data['section_scores'],
+                                 lambda: self._create_radar_chart(charts_data['section_scores'])),
+            # 5. Detailed Section Scores Bar Chart
+            'sections_bar': CachedChart('analysis.sections_bar', charts_data['section_scores'],
+                                        lambda: self._create_sections_bar_chart(charts_data['section_scores'])),
+        }
         
-        # 5. Detailed Section Scores Bar Chart
-        charts['sections_bar'] = self._create_sections_bar_chart(charts_data['section_scores'])
+        return chart_sources(charts, mode)
+
+    def chart_specs(self, charts_data: dict) -> dict:
+        """Chart.js specs for the analysis charts, drawn in the browser"""
+        section_scores = charts_data['section_scores']
+        max_section = max(section_scores.values()) if section_scores else 0
+        max_section = max_section if max_section > 0 else 1
+        skills_data = charts_data['skills_data']
         
-        return charts
+        return {
+            'gauge': chart_specs.gauge(charts_data['overall_score'], 'Resume Score', 'Overall Score'),
+            'pie': chart_specs.pie(
+                charts_data['score_breakdown'].keys(), charts_data['score_breakdown'].values(),
+                'Score Breakdown by Category', ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']),
+            'skills_bar': chart_specs.bar(
+                skills_data.keys(),
+                [chart_specs.dataset('Count', skills_data.values(), ['green', 'red', 'lightgreen', 'lightcoral'])],
+                'Skills Analysis', axis_label='Count'),
+            'radar': chart_specs.radar(
+                section_scores.keys(), [v / max_section * 10 for v in section_scores.values()],
+                'Resume Sections Analysis', color='#4ECDC4'),
+            'sections_bar': chart_specs.bar(
+                section_scores.keys(),
+                [chart_specs.dataset('Score', section_scores.values(),
+                                     ['red' if s < 3 else 'orange' if s < 6 else 'green' for s in section_scores.values()])],
+                'Detailed Section Scores', horizontal=True, axis_label='Score'),
+        }
 
-    def _create_gauge_chart(self, score: float) -> str:
+    def _create_gauge_chart(self, score: float) -> bytes:
         """Create gauge chart for overall score"""
-        fig, ax = plt.subplots(figsize=(8, 6))
+        template = get_template('analysis.gauge', self._build_gauge_chart, (8, 6), dpi=150)
+        return template.render(self._update_gauge_chart, score)
+
+    def _build_gauge_chart(self, fig) -> dict:
+        """Static gauge: background arc, caption and title"""
+        ax = fig.add_subplot()
         
         # Create gauge
         theta = np.linspace(0, np.pi, 100)
@@ -289,24 +344,26 @@ class EnhancedResumeAnalyzer:
         # Background arc
         ax.plot(r * np.cos(theta), r * np.sin(theta), 'lightgray', linewidth=20)
         
-        # Score arc
-        score_theta = np.linspace(0, np.pi * (score / 100), int(score))
-        color = 'red' if score < 50 else 'orange' if score < 75 else 'green'
-        ax.plot(r * np.cos(score_theta), r * np.sin(score_theta), color, linewidth=20)
-        
-        # Score text
-        ax.text(0, -0.3, f'{score:.1f}%', ha='center', va='center', fontsize=24, fontweight='bold')
+        # Score arc and text (updated per render)
+        score_arc, = ax.plot([], [], linewidth=20)
+        score_text = ax.text(0, -0.3, '100.0%', ha='center', va='center', fontsize=24, fontweight='bold')
         ax.text(0, -0.5, 'Overall Score', ha='center', va='center', fontsize=14)
         
         ax.set_xlim(-1.2, 1.2)
         ax.set_ylim(-0.7, 1.2)
         ax.set_aspect('equal')
         ax.axis('off')
-        plt.title('Resume Score', fontsize=16, fontweight='bold', pad=20)
+        ax.set_title('Resume Score', fontsize=16, fontweight='bold', pad=20)
         
-        return self._fig_to_base64(fig)
+        return {'score_arc': score_arc, 'score_text': score_text}
+
+    def _update_gauge_chart(self, artists: dict, score: float) -> None:
+        score_theta = np.linspace(0, np.pi * (score / 100), int(score))
+        artists['score_arc'].set_data(np.cos(score_theta), np.sin(score_theta))
+        artists['score_arc'].set_color('red' if score < 50 else 'orange' if score < 75 else 'green')
+        artists['score_text'].set_text(f'{score:.1f}%')
 
-    def _create_pie_chart(self, data: dict) -> str:
+    def _create_pie_chart(self, data: dict) -> bytes:
         """Create pie chart for score breakdown"""
         fig, ax = plt.subplots(figsize=(8, 6))
         
@@ -315,9 +372,9 @@ class EnhancedResumeAnalyzer:
                                          colors=colors, startangle=90)
         
         plt.title('Score Breakdown by Category', fontsize=14, fontweight='bold')
-        return self._fig_to_base64(fig)
+        return self._fig_to_png(fig)
 
-    def _create_skills_bar_chart(self, data: dict) -> str:
+    def _create_skills_bar_chart(self, data: dict) -> bytes:
         """Create bar chart for skills analysis"""
         fig, ax = plt.subplots(figsize=(10, 6))
         
@@ -337,13 +394,11 @@ class EnhancedResumeAnalyzer:
         
         plt.xticks(rotation=45, ha='right')
         plt.tight_layout()
-        return self._fig_to_base64(fig)
+        return self._fig_to_png(fig)
 
-    def _create_radar_chart(self, data: dict) -> str:
+    def _create_radar_chart(self, data: dict) -> bytes:
         """Create radar chart for section scores"""
-        fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(projection='polar'))
-        
-        categories = list(data.keys())
+        categories = tuple(data.keys())
         values = list(data.values())
         
         # Normalize values to 0-10 scale for better visualization
@@ -353,23 +408,35 @@ class EnhancedResumeAnalyzer:
         # Add first value at end to close the circle
         normalized_values += normalized_values[:1]
         
+        template = get_template(('analysis.radar', categories),
+                                lambda fig: self._build_radar_chart(fig, categories), (8, 8), dpi=150)
+        return template.render(self._update_radar_chart, normalized_values)
+
+    def _build_radar_chart(self, fig, categories: tuple) -> dict:
+        """Static radar: polar grid, category labels and title"""
+        ax = fig.add_subplot(projection='polar')
+        
         # Calculate angles
         angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
         angles += angles[:1]
         
-        # Plot
-        ax.plot(angles, normalized_values, 'o-', linewidth=2, color='#4ECDC4')
-        ax.fill(angles, normalized_values, alpha=0.25, color='#4ECDC4')
+        # Plot (updated per render)
+        line, = ax.plot(angles, [10] * len(angles), 'o-', linewidth=2, color='#4ECDC4')
+        fill, = ax.fill(angles, [10] * len(angles), alpha=0.25, color='#4ECDC4')
         
         # Add labels
         ax.set_xticks(angles[:-1])
         ax.set_xticklabels(categories)
         ax.set_ylim(0, 10)
         
-        plt.title('Resume Sections Analysis', size=14, fontweight='bold', pad=20)
-        return self._fig_to_base64(fig)
+        ax.set_title('Resume Sections Analysis', size=14, fontweight='bold', pad=20)
+        return {'angles': angles, 'line': line, 'fill': fill}
+
+    def _update_radar_chart(self, artists: dict, values: list) -> None:
+        artists['line'].set_data(artists['angles'], values)
+        artists['fill'].set_xy(np.column_stack([artists['angles'], values]))
 
-    def _create_sections_bar_chart(self, data: dict) -> str:
+    def _create_sections_bar_chart(self, data: dict) -> bytes:
         """Create horizontal bar chart for section scores"""
         fig, ax = plt.subplots(figsize=(10, 6))
         
@@ -390,25 +457,23 @@ class EnhancedResumeAnalyzer:
                    f'{scores[i]:.1f}', ha='left', va='center')
         
         plt.tight_layout()
-        return self._fig_to_base64(fig)
+        return self._fig_to_png(fig)
 
-    def _fig_to_base64(self, fig) -> str:
-        """Convert matplotlib figure to base64 string"""
+    def _fig_to_png(self, fig) -> bytes:
+        """Render matplotlib figure to PNG bytes"""
         if not CHARTS_AVAILABLE:
-            return ""
+            return b""
         import io
-        import base64
         buffer = io.BytesIO()
         fig.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
         plt.close(fig)
-        return image_base64
+        return buffer.getvalue()
 
     def generate_report(self, analysis: dict) -> str:
         """Generate comprehensive HTML report"""
         
-        charts = self.generate_charts(analysis['charts_data'])
+        # A standalone report embeds its images
+        charts = self.generate_charts(analysis['charts_data'], mode=INLINE)
         
         html_report = f"""
         <div class="resume-analysis-report">
@@ -427,10 +492,10 @@ class EnhancedResumeAnalyzer:
             
             <div class="charts-section">
                 <div class="chart-container">
-                    <img src="data:image/png;base64,{charts['gauge']}" alt="Overall Score Gauge">
+                    <img src="{charts['gauge']}" alt="Overall Score Gauge">
                 </div>
                 <div class="chart-container">
-                    <img src="data:image/png;base64,{charts['pie']}" alt="Score Breakdown">
+                    <img src="{charts['pie']}" alt="Score Breakdown">
                 </div>
             </div>
             
@@ -446,7 +511,7 @@ class EnhancedResumeAnalyzer:
                         <span class="stat-label">Required Skills Missing</span>
                     </div>
                 </div>
-                <img src="data:image/png;base64,{charts['skills_bar']}" alt="Skills Analysis">
+                <img src="{charts['skills_bar']}" alt="Skills Analysis">
             </div>
             
             <div class="suggestions-section">
@@ -455,8 +520,8 @@ class EnhancedResumeAnalyzer:
             </div>
             
             <div class="detailed-charts">
-                <img src="data:image/png;base64,{charts['radar']}" alt="Radar Chart">
-                <img src="data:image/png;base64,{charts['sections_bar']}" alt="Section Scores">
+                <img src="{charts['radar']}" alt="Radar Chart">
+                <img src="{charts['sections_bar']}" alt="Section Scores">
             </div>
         </div>
         """
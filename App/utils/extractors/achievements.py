@@ -1,24 +1,37 @@
 """Achievements section extraction from resumes."""
-import re
+from ..context import AnalysisContext, as_context
+from .. import patterns
+from ..layout import section_items
 
 
-def extract_achievements(resume_text: str) -> dict:
+def extract_achievements(resume_text: str | AnalysisContext) -> dict:
     """
     Extract achievements information from resume text.
 
+    Uses the detected "Achievements" section when the context has a layout,
+    otherwise "Achievements:" lines in the text.
+
     Args:
-        resume_text: The resume text to extract from
+        resume_text: The resume text (or AnalysisContext) to extract from
 
     Returns:
         Dictionary containing achievements list and count
     """
+    ctx = as_context(resume_text)
+    section = ctx.section("achievements")
+    if section is not None:
+        achievements = section_items(section)
+        return {
+            "achievements": list(set(achievements)),
+            "count": len(achievements)
+        }
+
     achievements = []
-    matches = re.findall(
-        r'(?:^|\n)[•\-\*]?\s*(Achievements|Awards)\s*:?(.+)?', resume_text, re.IGNORECASE)
+    matches = patterns.ACHIEVEMENTS_SECTION.findall(ctx.text)
     for m in matches:
         if m[1]:
             achievements += [a.strip()
-                             for a in re.split(r',|;|\n', m[1]) if len(a.strip()) > 3]
+                             for a in patterns.LIST_SEPARATOR.split(m[1]) if len(a.strip()) > 3]
 
     return {
         "achievements": list(set(achievements)),
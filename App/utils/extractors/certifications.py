@@ -1,24 +1,37 @@
 """Certifications section extraction from resumes."""
-import re
+from ..context import AnalysisContext, as_context
+from .. import patterns
+from ..layout import section_items
 
 
-def extract_certifications(resume_text: str) -> dict:
+def extract_certifications(resume_text: str | AnalysisContext) -> dict:
     """
     Extract certifications information from resume text.
 
+    Uses the detected "Certifications" section when the context has a layout,
+    otherwise "Certifications:" lines in the text.
+
     Args:
-        resume_text: The resume text to extract from
+        resume_text: The resume text (or AnalysisContext) to extract from
 
     Returns:
         Dictionary containing certifications list and count
     """
+    ctx = as_context(resume_text)
+    section = ctx.section("certifications")
+    if section is not None:
+        certs = section_items(section)
+        return {
+            "certifications": list(set(certs)),
+            "count": len(certs)
+        }
+
     certs = []
-    matches = re.findall(
-        r'(?:^|\n)[•\-\*]?\s*(Certifications|Courses)\s*:?(.+)?', resume_text, re.IGNORECASE)
+    matches = patterns.CERTIFICATIONS_SECTION.findall(ctx.text)
     for m in matches:
         if m[1]:
             certs += [c.strip()
-                      for c in re.split(r',|;|\n', m[1]) if len(c.strip()) > 3]
+                      for c in patterns.LIST_SEPARATOR.split(m[1]) if len(c.strip()) > 3]
 
     return {
         "certifications": list(set(certs)),
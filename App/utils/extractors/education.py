@@ -1,29 +1,33 @@
 """Education section extraction from resumes."""
-import re
+from ..context import AnalysisContext, as_context
+from .. import patterns
+from ..layout import section_items
 
 
-def extract_education_section(resume_text: str) -> dict:
+def extract_education_section(resume_text: str | AnalysisContext) -> dict:
     """
     Extract education information from resume text.
 
+    Entries come from the detected "Education" section when the context has a
+    layout, otherwise from "Education:" lines in the text.
+
     Args:
-        resume_text: The resume text to extract from
+        resume_text: The resume text (or AnalysisContext) to extract from
 
     Returns:
         Dictionary containing degrees, universities, years, and entries
     """
-    # Import here to allow test mocking of rating.nlp
-    from .. import rating
-
-    education_pattern = r"(?:^|\n)[•\-\*]?\s*Education\s*:\s*([^\n]+)"
-    matches = re.findall(education_pattern, resume_text, re.IGNORECASE)
+    ctx = as_context(resume_text)
 
-    education_entries = []
-    for match in matches:
-        education_entries += [item.strip()
-                              for item in re.split(r",|;", match) if item.strip()]
+    section = ctx.section("education")
+    if section is not None:
+        education_entries = section_items(section, patterns.ENTRY_SEPARATOR, min_length=1)
+    else:
+        education_entries = []
+        for match in patterns.EDUCATION_LINE.findall(ctx.text):
+            education_entries += [item.strip()
+                                  for item in patterns.ENTRY_SEPARATOR.split(match) if item.strip()]
 
-    doc = rating.nlp(resume_text)
     degrees, universities, years = [], [], []
 
     degree_keywords = [
@@ -31,10 +35,10 @@ def extract_education_section(resume_text: str) -> dict:
         "mba", "bachelors", "masters", "doctor", "ba", "ma", "bs", "ms"
     ]
 
-    for ent in doc.ents:
+    for ent in ctx.entities:
         if ent.label_ == "ORG":
             universities.append(ent.text)
-        if ent.label_ == "DATE" or re.search(r"\b(19|20)\d{2}\b", ent.text):
+        if ent.label_ == "DATE" or patterns.YEAR.search(ent.text):
             years.append(ent.text)
         if any(deg in ent.text.lower() for deg in degree_keywords):
             degrees.append(ent.text)
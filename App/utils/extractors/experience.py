@@ -1,26 +1,25 @@
 """Experience section extraction from resumes."""
-import re
+from ..context import AnalysisContext, as_context
 
 
-def extract_experience(resume_text: str) -> dict:
+def extract_experience(resume_text: str | AnalysisContext) -> dict:
     """
     Extract experience information from resume text.
 
     Args:
-        resume_text: The resume text to extract from
+        resume_text: The resume text (or AnalysisContext) to extract from
 
     Returns:
         Dictionary containing experience entries and years estimate
     """
     experience = []
-    lines = resume_text.split('\n')
-    for i, line in enumerate(lines):
-        if re.search(r'\bexperience\b', line, re.IGNORECASE):
-            for j in range(i + 1, min(i + 10, len(lines))):
-                if lines[j].strip() == "":
-                    break
-                experience.append(lines[j].strip())
-            break
+    scan = as_context(resume_text).scan
+    heading = scan.experience_heading
+    if heading is not None:
+        for line in scan.lines[heading + 1:heading + 10]:
+            if line.blank:
+                break
+            experience.append(line.text.strip())
 
     return {
         "experience_entries": experience,
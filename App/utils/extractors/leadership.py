@@ -1,25 +1,21 @@
 """Leadership roles extraction from resumes."""
+from ..context import AnalysisContext, as_context
 
+LEADERSHIP_KEYWORDS = ["lead", "president", "organizer",
+                       "head", "captain", "coordinator", "manager", "director"]
 
-def extract_leadership_roles(resume_text: str) -> dict:
+
+def extract_leadership_roles(resume_text: str | AnalysisContext) -> dict:
     """
     Extract leadership roles information from resume text.
 
     Args:
-        resume_text: The resume text to extract from
+        resume_text: The resume text (or AnalysisContext) to extract from
 
     Returns:
         Dictionary containing leadership roles list and count
     """
-    leadership_keywords = ["lead", "president", "organizer",
-                           "head", "captain", "coordinator", "manager", "director"]
-    found = []
-
-    for line in resume_text.split('\n'):
-        for word in leadership_keywords:
-            if word in line.lower():
-                found.append(line.strip())
-                break
+    found = [line.text.strip() for line in as_context(resume_text).scan.with_group("leadership")]
 
     return {
         "leadership_roles": list(set(found)),
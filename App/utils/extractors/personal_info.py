@@ -1,21 +1,20 @@
 """Personal information extraction from resumes."""
-import re
+from ..context import AnalysisContext, as_context
+from .. import patterns
 
 
-def get_personal_info(resume_text: str) -> dict:
+def get_personal_info(resume_text: str | AnalysisContext) -> dict:
     """
     Extract personal information from resume text.
 
     Args:
-        resume_text: The resume text to extract from
+        resume_text: The resume text (or AnalysisContext) to extract from
 
     Returns:
         Dictionary with score and personal information details
     """
-    # Import here to allow test mocking of rating.nlp
-    from .. import rating
-
-    doc = rating.nlp(resume_text)
+    ctx = as_context(resume_text)
+    resume_text = ctx.text
     personal_info = {
         "name": "",
         "email": "",
@@ -25,33 +24,29 @@ def get_personal_info(resume_text: str) -> dict:
     }
 
     # Enhanced email detection
-    emails = re.findall(
-        r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', resume_text)
+    emails = patterns.EMAIL.findall(resume_text)
     if emails:
         personal_info["email"] = emails[0]
 
     # Enhanced phone detection
-    phones = re.findall(
-        r'(?:\+?1[-\s]?)?\(?[0-9]{3}\)?[-\s]?[0-9]{3}[-\s]?[0-9]{4}', resume_text)
+    phones = patterns.PHONE.findall(resume_text)
     if phones:
         personal_info["phone"] = phones[0]
 
     # Enhanced links detection
-    links = re.findall(
-        r'(https?://[^\s]+|linkedin\.com/[^\s]+|github\.com/[^\s]+)', resume_text, re.IGNORECASE)
+    links = patterns.LINK.findall(resume_text)
     personal_info["links"] = links
 
     # Name extraction
-    for ent in doc.ents:
+    for ent in ctx.entities:
         if ent.label_ == "PERSON" and len(ent.text.split()) >= 2:
             personal_info["name"] = ent.text
             break
 
     if not personal_info["name"]:
-        lines = resume_text.split('\n')[:5]
+        lines = ctx.lines[:5]
         for line in lines:
-            name_match = re.search(
-                r'^([A-Z][a-z]+(?:\s[A-Z][a-z]+)+)', line.strip())
+            name_match = patterns.NAME_LINE.search(line.strip())
             if name_match:
                 personal_info["name"] = name_match.group(0)
                 break
@@ -1,24 +1,37 @@
 """Projects section extraction from resumes."""
-import re
+from ..context import AnalysisContext, as_context
+from .. import patterns
+from ..layout import section_items
 
 
-def extract_projects(resume_text: str) -> dict:
+def extract_projects(resume_text: str | AnalysisContext) -> dict:
     """
     Extract projects information from resume text.
 
+    Uses the detected "Projects" section when the context has a layout,
+    otherwise "Projects:" lines in the text.
+
     Args:
-        resume_text: The resume text to extract from
+        resume_text: The resume text (or AnalysisContext) to extract from
 
     Returns:
         Dictionary containing projects list and count
     """
-    matches = re.findall(
-        r'(?:^|\n)[•\-\*]?\s*(Projects|Project Experience)\s*:?(.+)?', resume_text, re.IGNORECASE)
+    ctx = as_context(resume_text)
+    section = ctx.section("projects")
+    if section is not None:
+        projects = section_items(section)
+        return {
+            "projects": list(set(projects)),
+            "project_count": len(projects)
+        }
+
+    matches = patterns.PROJECTS_SECTION.findall(ctx.text)
     projects = []
     for match in matches:
         text = match[1]
         if text:
-            items = re.split(r',|;|\n', text)
+            items = patterns.LIST_SEPARATOR.split(text)
             projects.extend([p.strip() for p in items if len(p.strip()) > 3])
 
     return {
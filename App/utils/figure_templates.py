@@ -0,0 +1,86 @@
+"""Reusable matplotlib figures for charts whose layout never changes.
+
+Building a figure (axes, gauge zones, polar grid, tick labels, titles) and
+laying it out costs more than drawing the few artists that carry a
+resume's numbers. A ``FigureTemplate`` builds its figure once per thread
+with the object-oriented API (no pyplot state), keeps handles to the data
+artists and re-renders by updating only those artists before each save.
+The tight bounding box is computed once, right after the build, so ``build``
+should leave every data artist at its widest extent (e.g. a "100.0%" label).
+"""
+import io
+import threading
+
+try:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    TEMPLATES_AVAILABLE = True
+except ImportError:
+    TEMPLATES_AVAILABLE = False
+
+_local = threading.local()
+
+
+class FigureTemplate:
+    """
+    A pre-built figure whose data artists are updated per render.
+
+    Args:
+        build: Callable ``build(fig)`` adding the static content to ``fig`` and
+            returning the artists ``update`` receives
+        figsize: Figure size in inches
+        savefig_kwargs: Extra ``savefig`` arguments (dpi, facecolor)
+    """
+
+    def __init__(self, build, figsize, **savefig_kwargs):
+        self.figure = Figure(figsize=figsize)
+        FigureCanvasAgg(self.figure)
+        self.artists = build(self.figure)
+        self.savefig_kwargs = savefig_kwargs
+
+        renderer = self.figure.canvas.get_renderer()
+        self.figure.draw(renderer)
+        self.bbox = self.figure.get_tightbbox(renderer).padded(0.1)
+
+    def render(self, update, *args) -> bytes:
+        """
+        Update the data artists and return the figure as PNG bytes.
+
+        Args:
+            update: Callable ``update(artists, *args)`` setting the new data
+            *args: Data passed to ``update``
+
+        Returns:
+            PNG bytes
+        """
+        update(self.artists, *args)
+        buffer = io.BytesIO()
+        self.figure.savefig(buffer, format='png', bbox_inches=self.bbox, **self.savefig_kwargs)
+        return buffer.getvalue()
+
+
+def get_template(key, build, figsize, **savefig_kwargs) -> FigureTemplate:
+    """
+    Return this thread's template for ``key``, building it on first use.
+
+    Args:
+        key: Hashable template identity (include anything that changes the layout)
+        build: See ``FigureTemplate``
+        figsize: Figure size in inches
+        **savefig_kwargs: Extra ``savefig`` arguments
+
+    Returns:
+        The thread-local FigureTemplate
+    """
+    templates = getattr(_local, 'templates', None)
+    if templates is None:
+        templates = _local.templates = {}
+    template = templates.get(key)
+    if template is None:
+        template = templates[key] = FigureTemplate(build, figsize, **savefig_kwargs)
+    return template
+
+
+def clear_templates() -> None:
+    """Drop this thread's templates (e.g. after a style change)."""
+    _local.templates = {}
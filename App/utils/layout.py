@@ -0,0 +1,195 @@
+"""Layout blocks of an uploaded resume and heading-based section detection.
+
+``App.models.recieve`` turns a PDF or DOCX upload into a compact list of
+``TextBlock``s. A block is a run of PDF lines in the same font size and
+weight, a DOCX paragraph, or a DOCX table. ``detect_sections`` walks that
+list once and groups the blocks under the headings it recognizes, using the
+paragraph style, font size, bold and heading vocabulary. Extractors read
+their section from ``AnalysisContext.sections`` instead of searching the
+flat text for "Projects:"-style lines.
+"""
+import re
+from collections import Counter
+from typing import NamedTuple
+
+from . import patterns
+
+
+class TextBlock(NamedTuple):
+    """
+    One layout block of a resume.
+
+    Attributes:
+        text: Block text; lines separated by newlines, table cells by " | "
+        page: 1-based PDF page number (None for DOCX)
+        bbox: ``(x0, y0, x1, y1)`` in PDF points (None for DOCX)
+        size: Font size in points, if known
+        bold: Whether every run of the block is bold
+        style: DOCX paragraph style name ("" for PDF)
+        cells: Table rows as tuples of cell texts (empty for text blocks)
+    """
+    text: str
+    page: int = None
+    bbox: tuple = None
+    size: float = None
+    bold: bool = False
+    style: str = ""
+    cells: tuple = ()
+
+
+def blocks_to_json(blocks: list) -> list:
+    """JSON-serializable form of ``blocks`` (one list per block)."""
+    return [list(block) for block in blocks]
+
+
+def blocks_from_json(rows: list) -> list:
+    """Rebuild ``TextBlock``s stored with ``blocks_to_json``."""
+    blocks = []
+    for row in rows:
+        block = TextBlock(*row)
+        blocks.append(block._replace(
+            bbox=tuple(block.bbox) if block.bbox else None,
+            cells=tuple(tuple(cells) for cells in block.cells),
+        ))
+    return blocks
+
+
+class Section(NamedTuple):
+    """A heading and the blocks that follow it up to the next heading."""
+    name: str
+    heading: str
+    inline: str
+    blocks: list
+
+    @property
+    def lines(self) -> list:
+        """Non-empty content lines, bullets stripped; inline heading content first."""
+        lines = [self.inline] if self.inline else []
+        for block in self.blocks:
+            if block.cells:
+                lines.extend(" | ".join(row) for row in block.cells)
+            else:
+                lines.extend(block.text.split("\n"))
+        return [line for line in (_strip_bullet(line) for line in lines) if line]
+
+
+# Canonical section name -> heading texts (lowercase) that introduce it
+SECTION_HEADINGS = {
+    'summary': ('summary', 'professional summary', 'profile', 'objective',
+                'career objective', 'about me'),
+    'experience': ('experience', 'work experience', 'professional experience',
+                   'employment', 'employment history', 'work history'),
+    'education': ('education', 'academic background', 'qualifications'),
+    'projects': ('projects', 'project experience', 'personal projects',
+                 'academic projects'),
+    'skills': ('skills', 'technical skills', 'core competencies', 'key skills'),
+    'achievements': ('achievements', 'awards', 'honors', 'honours',
+                     'accomplishments', 'awards and achievements'),
+    'certifications': ('certifications', 'certificates', 'courses', 'licenses',
+                       'licenses and certifications'),
+    'leadership': ('leadership', 'activities', 'extracurricular activities',
+                   'volunteering', 'volunteer experience'),
+}
+
+_HEADING_NAMES = {
+    heading: name for name, headings in SECTION_HEADINGS.items() for heading in headings
+}
+_HEADING_TEXT = re.compile(r'^[•\-\*\s]*(.*?)[\s:]*$')
+_BULLET = re.compile(r'^[•\-\*▪●◦·]+\s*')
+_MAX_HEADING_WORDS = 5
+
+
+def _strip_bullet(line: str) -> str:
+    return _BULLET.sub('', line.strip())
+
+
+def _heading_key(text: str) -> str:
+    return " ".join(_HEADING_TEXT.match(text).group(1).lower().replace('&', 'and').split())
+
+
+def body_font_size(blocks: list):
+    """Most common font size, weighted by characters, or None when sizes are unknown."""
+    sizes = Counter()
+    for block in blocks:
+        if block.size and not block.cells:
+            sizes[block.size] += len(block.text)
+    return sizes.most_common(1)[0][0] if sizes else None
+
+
+def _looks_like_heading(block: TextBlock, first_line: str, body_size) -> bool:
+    """Formatting says ``block`` is a heading even though its text is not a known one."""
+    if block.cells or len(first_line.split()) > _MAX_HEADING_WORDS or "\n" in block.text:
+        return False
+    if block.style.startswith(('Heading', 'Title')):
+        return True
+    return bool(block.size and body_size and block.size >= body_size * 1.15)
+
+
+def _split_heading(block: TextBlock, body_size):
+    """
+    Return ``(name, heading, inline, rest)`` if ``block`` starts with a heading.
+
+    ``name`` is the canonical section name (or the heading text itself for
+    formatted headings outside ``SECTION_HEADINGS``), ``inline`` any content
+    after "Heading:" on the same line and ``rest`` the block's remaining lines.
+    """
+    if block.cells:
+        return None
+    first_line, _, rest = block.text.partition("\n")
+    key = _heading_key(first_line)
+    name = _HEADING_NAMES.get(key)
+    if name is not None:
+        return name, first_line.strip(), "", rest
+
+    label, colon, inline = first_line.partition(":")
+    if colon and _HEADING_NAMES.get(_heading_key(label)):
+        return _HEADING_NAMES[_heading_key(label)], label.strip(), inline.strip(), rest
+
+    if key and _looks_like_heading(block, first_line, body_size):
+        return key, first_line.strip(), "", rest
+    return None
+
+
+def detect_sections(blocks: list) -> dict:
+    """
+    Group layout blocks into sections by their headings.
+
+    A block starts a section when its first line is a known heading
+    ("Work Experience", "PROJECTS", "Awards:"), optionally followed by
+    inline content ("Certifications: AWS, CKA"), or when it is a short
+    line set in a heading style or a larger font than the body text.
+    Blocks before the first heading are not assigned to any section.
+
+    Args:
+        blocks: ``TextBlock``s in reading order
+
+    Returns:
+        Mapping of section name -> ``Section``; repeated headings are merged
+    """
+    body_size = body_font_size(blocks)
+    sections = {}
+    current = None
+    for block in blocks:
+        heading = _split_heading(block, body_size)
+        if heading is None:
+            if current is not None:
+                current.blocks.append(block)
+            continue
+
+        name, text, inline, rest = heading
+        current = sections.get(name)
+        if current is None:
+            current = sections[name] = Section(name, text, inline, [])
+        elif inline:
+            current.blocks.append(block._replace(text=inline))
+        if rest.strip():
+            current.blocks.append(block._replace(text=rest))
+    return sections
+
+
+def section_items(section: Section, separator=patterns.LIST_SEPARATOR, min_length: int = 4) -> list:
+    """Split a section's lines into items on ``separator``, dropping short fragments."""
+    items = []
+    for line in section.lines:
+        items.extend(item.strip() for item in separator.split(line) if len(item.strip()) >= min_length)
+    return items
@@ -0,0 +1,221 @@
+"""Single-pass line scanner for section-oriented extractors and scorers.
+
+Experience extraction, leadership detection, skill context scoring, quality
+scoring and red-flag detection all look at the resume line by line for
+their own keywords. ``LineScanner`` walks the text once, finding every
+keyword with one Aho-Corasick pass and checking each line's quantifiers
+and headings once. It records the results in a ``LineScan`` that all of
+those consumers read from instead of re-splitting and rescanning the text.
+"""
+import bisect
+import threading
+from typing import NamedTuple
+
+from . import patterns
+from .matching import SkillMatcher, get_skill_matcher
+
+_NO_TERMS = frozenset()
+
+
+class LineInfo(NamedTuple):
+    """What the scanner found on one line of the resume."""
+    index: int
+    start: int
+    text: str
+    lower: str
+    word_count: int
+    terms: frozenset
+    groups: frozenset
+    quantified: bool
+    achievement: bool
+
+    @property
+    def blank(self) -> bool:
+        return not self.text.strip()
+
+
+class LineScan:
+    """
+    Per-line scan results and document totals for one resume.
+
+    Attributes:
+        lines: One ``LineInfo`` per newline-separated line
+        word_count: Whitespace-separated words in the whole text
+        blank_lines: Number of lines holding only whitespace
+        double_newlines: Non-overlapping ``'\\n\\n'`` occurrences in the text
+        experience_heading: Index of the first line mentioning "experience", or None
+    """
+
+    def __init__(self, lower: str, lines: list, starts: list, double_newlines: int,
+                 experience_heading):
+        self.lower = lower
+        self.lines = lines
+        self.double_newlines = double_newlines
+        self.experience_heading = experience_heading
+        self.word_count = sum(info.word_count for info in lines)
+        self.blank_lines = sum(1 for info in lines if info.blank)
+        self._starts = starts
+        self._term_lines = None
+
+    def __repr__(self):
+        return f"<LineScan {len(self.lines)} lines>"
+
+    def line_at(self, offset: int) -> LineInfo:
+        """Return the line containing ``offset`` of the lowercased text."""
+        return self.lines[bisect.bisect_right(self._starts, offset) - 1]
+
+    def with_group(self, group: str) -> list:
+        """Return the lines containing a keyword of ``group``, in order."""
+        return [info for info in self.lines if group in info.groups]
+
+    def has_group(self, group: str) -> bool:
+        """Return True if any line contains a keyword of ``group``."""
+        return any(group in info.groups for info in self.lines)
+
+    def group_terms(self, group: str) -> set:
+        """Return the distinct keywords of ``group`` found anywhere in the text."""
+        terms = get_line_scanner().groups.get(group, _NO_TERMS)
+        found = set()
+        for info in self.lines:
+            if group in info.groups:
+                found |= info.terms & terms
+        return found
+
+    @property
+    def has_achievement(self) -> bool:
+        """True if any line has a quantified achievement."""
+        return any(info.achievement for info in self.lines)
+
+    def lines_containing(self, term: str) -> list:
+        """
+        Return the lines whose lowercased text contains ``term`` as a substring.
+
+        Terms from the skill tables are answered from a single substring pass
+        of the shared skill matcher over the text; other terms are looked up
+        line by line.
+        """
+        matcher = get_skill_matcher()
+        if term and term == term.lower().strip() and term in matcher:
+            if self._term_lines is None:
+                term_lines = {}
+                for hit in matcher.finditer(self.lower, whole_words=False):
+                    term_lines.setdefault(hit.term, set()).add(self.line_at(hit.start).index)
+                self._term_lines = term_lines
+            return [self.lines[index] for index in sorted(self._term_lines.get(term, ()))]
+        return [info for info in self.lines if term in info.lower]
+
+
+class LineScanner:
+    """
+    Scans resume text once for groups of line keywords.
+
+    Args:
+        groups: Mapping of group name -> keywords; a line belongs to a group
+            when one of its keywords occurs in the lowercased line as a substring
+    """
+
+    def __init__(self, groups: dict):
+        self.groups = {
+            name: frozenset(term.lower().strip() for term in terms)
+            for name, terms in groups.items()
+        }
+        self._term_groups = {}
+        for name, terms in self.groups.items():
+            for term in terms:
+                self._term_groups.setdefault(term, set()).add(name)
+        self._matcher = SkillMatcher(self._term_groups, whole_words=False)
+
+    def scan(self, text: str, lower: str = None) -> LineScan:
+        """
+        Scan ``text`` line by line.
+
+        Args:
+            text: The resume text
+            lower: ``text.lower()`` if already computed
+
+        Returns:
+            LineScan with per-line results and document totals
+        """
+        if lower is None:
+            lower = text.lower()
+        lines = text.split('\n')
+        lower_lines = lower.split('\n')
+
+        starts = []
+        offset = 0
+        for lower_line in lower_lines:
+            starts.append(offset)
+            offset += len(lower_line) + 1
+
+        line_terms = {}
+        for hit in self._matcher.finditer(lower):
+            index = bisect.bisect_right(starts, hit.start) - 1
+            line_terms.setdefault(index, set()).add(hit.term)
+
+        infos = []
+        experience_heading = None
+        double_newlines = 0
+        newline_run = 0
+        for index, (line, lower_line) in enumerate(zip(lines, lower_lines)):
+            if index:
+                newline_run += 1
+            if line:
+                double_newlines += newline_run // 2
+                newline_run = 0
+
+            terms = line_terms.get(index)
+            if terms:
+                terms = frozenset(terms)
+                groups = frozenset(name for term in terms for name in self._term_groups[term])
+            else:
+                terms = groups = _NO_TERMS
+
+            has_text = bool(line.strip())
+            if experience_heading is None and has_text and patterns.EXPERIENCE_HEADING.search(line):
+                experience_heading = index
+
+            infos.append(LineInfo(
+                index=index,
+                start=starts[index],
+                text=line,
+                lower=lower_line,
+                word_count=len(line.split()) if has_text else 0,
+                terms=terms,
+                groups=groups,
+                quantified=has_text and patterns.ANY_QUANTIFIER.search(lower_line) is not None,
+                achievement=has_text and patterns.QUANTIFIED_ACHIEVEMENT.search(lower_line) is not None,
+            ))
+        double_newlines += newline_run // 2
+
+        return LineScan(lower, infos, starts, double_newlines, experience_heading)
+
+
+_line_scanner = None
+_line_scanner_lock = threading.Lock()
+
+
+def get_line_scanner() -> LineScanner:
+    """
+    Return the process-wide scanner for the analysis keyword groups.
+
+    Groups are ``leadership`` (leadership role keywords), ``context``
+    (experience/project section words), ``action_verbs`` (ATS action verbs)
+    and ``strong_verbs`` (the red-flag check's action verbs). Built once on
+    first use.
+    """
+    global _line_scanner
+    if _line_scanner is None:
+        with _line_scanner_lock:
+            if _line_scanner is None:
+                # Imported lazily: these modules import this one
+                from .extractors.leadership import LEADERSHIP_KEYWORDS
+                from .validators.red_flags import ACTION_VERBS
+                from .enchanced_paid import ATS_KEYWORDS, CONTEXT_KEYWORDS
+
+                _line_scanner = LineScanner({
+                    'leadership': LEADERSHIP_KEYWORDS,
+                    'context': CONTEXT_KEYWORDS,
+                    'action_verbs': ATS_KEYWORDS['action_verbs'],
+                    'strong_verbs': ACTION_VERBS,
+                })
+    return _line_scanner
@@ -0,0 +1,203 @@
+"""Single-pass multi-keyword matching for skill detection.
+
+``SkillMatcher`` compiles any number of keywords into an Aho-Corasick
+automaton and reports every occurrence (with offsets) in one scan over the
+text, so lookup cost depends on the resume length rather than on the number
+of skills in the tables. Whole-word matching keeps short skills such as
+``r`` or ``go`` from matching inside unrelated words.
+"""
+import re
+import threading
+from collections import deque
+from typing import Iterable, Iterator, NamedTuple
+
+
+class SkillHit(NamedTuple):
+    """One keyword occurrence in the scanned (lowercased) text."""
+    start: int
+    end: int
+    term: str
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of lowercase keywords.
+
+    Args:
+        terms: Keywords to match
+        aliases: Optional mapping of canonical skill -> alternative spellings;
+            every alias is matched as well and reported under its canonical skill
+        whole_words: Only report hits not embedded in a longer word
+    """
+
+    def __init__(self, terms: Iterable[str] = (), aliases: dict = None, whole_words: bool = True):
+        self.whole_words = whole_words
+        self.terms = []
+        self._term_ids = {}
+        self._canonical = []
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for term in terms:
+            self._add(term, term)
+        for skill, variations in (aliases or {}).items():
+            self._add(skill, skill)
+            for variation in variations:
+                self._add(variation, skill)
+        self._build()
+
+    def _add(self, term: str, skill: str) -> None:
+        term = term.lower().strip()
+        if not term:
+            return
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = self._term_ids[term] = len(self.terms)
+            self.terms.append(term)
+            self._canonical.append(set())
+
+            state = 0
+            for char in term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] = self._out[state] + (term_id,)
+        self._canonical[term_id].add(skill.lower().strip())
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fallback = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fallback if fallback != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+        # Whether each term starts/ends on a word character, for boundary checks
+        self._bounded = [(_is_word_char(term[0]), _is_word_char(term[-1])) for term in self.terms]
+
+    def __contains__(self, term: str) -> bool:
+        return term.lower().strip() in self._term_ids
+
+    def __len__(self):
+        return len(self.terms)
+
+    def canonical(self, term: str) -> set:
+        """Return the canonical skills reported for ``term``."""
+        term_id = self._term_ids.get(term.lower().strip())
+        return set(self._canonical[term_id]) if term_id is not None else set()
+
+    def finditer(self, text: str, whole_words: bool = None) -> Iterator[SkillHit]:
+        """
+        Yield every keyword occurrence in ``text`` in order of end offset.
+
+        Args:
+            text: Lowercased text to scan
+            whole_words: Override the matcher's ``whole_words`` setting for this scan
+
+        Yields:
+            SkillHit tuples; overlapping hits are all reported
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        terms, bounded = self.terms, self._bounded
+        if whole_words is None:
+            whole_words = self.whole_words
+        length = len(text)
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            end = index + 1
+            for term_id in out[state]:
+                start = end - len(terms[term_id])
+                if whole_words:
+                    starts_word, ends_word = bounded[term_id]
+                    if starts_word and start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if ends_word and end < length and _is_word_char(text[end]):
+                        continue
+                yield SkillHit(start, end, terms[term_id])
+
+    def find_terms(self, text: str) -> set:
+        """Return the set of distinct terms occurring in lowercased ``text``."""
+        return {hit.term for hit in self.finditer(text)}
+
+    def find_skills(self, text: str) -> set:
+        """Return the canonical skills of every term occurring in lowercased ``text``."""
+        skills = set()
+        for term in self.find_terms(text):
+            skills |= self._canonical[self._term_ids[term]]
+        return skills
+
+
+def contains_word(text: str, term: str) -> bool:
+    """Whole-word search for a single ``term`` not known to the shared matcher."""
+    term = term.lower().strip()
+    if not term:
+        return False
+    pattern = re.escape(term)
+    if _is_word_char(term[0]):
+        pattern = r'(?<!\w)' + pattern
+    if _is_word_char(term[-1]):
+        pattern += r'(?!\w)'
+    return re.search(pattern, text) is not None
+
+
+_skill_matcher = None
+_skill_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """
+    Return the process-wide matcher built from every skill table.
+
+    Covers the scorer's skill categories, the enhanced analyzer's job
+    requirements, the advanced analyzer's skill databases and its skill
+    variations (as aliases). Built once on first use.
+    """
+    global _skill_matcher
+    if _skill_matcher is None:
+        with _skill_matcher_lock:
+            if _skill_matcher is None:
+                # Imported lazily: these modules import this one
+                from .scorers.skills import SKILL_CATEGORIES
+                from .enhana import JOB_REQUIREMENTS
+                from .enchanced_paid import SKILL_DATABASES, SKILL_VARIATIONS
+
+                terms = []
+                for skills in SKILL_CATEGORIES.values():
+                    terms.extend(skills)
+                for requirements in JOB_REQUIREMENTS.values():
+                    terms.extend(requirements['required_skills'])
+                    terms.extend(requirements['preferred_skills'])
+                for categories in SKILL_DATABASES.values():
+                    for skills in categories.values():
+                        terms.extend(skills)
+                _skill_matcher = SkillMatcher(terms, aliases=SKILL_VARIATIONS)
+    return _skill_matcher
+
+
+def reset_skill_matcher() -> None:
+    """Discard the shared matcher so the next lookup rebuilds it from the tables."""
+    global _skill_matcher
+    with _skill_matcher_lock:
+        _skill_matcher = None
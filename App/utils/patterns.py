@@ -0,0 +1,49 @@
+"""Pre-compiled regular expressions shared by extractors, validators and scorers.
+
+Every pattern is compiled once at import. Call sites use the compiled
+objects directly instead of handing pattern strings to ``re`` functions,
+which skips the ``re`` module's cache lookup on every call. That lookup adds
+up inside the per-line and per-skill loops.
+"""
+import re
+
+# Contact information
+EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE = re.compile(r'(?:\+?1[-\s]?)?\(?[0-9]{3}\)?[-\s]?[0-9]{3}[-\s]?[0-9]{4}')
+ATS_PHONE = re.compile(r'\+?[\d\s\-\(\)]{10,}')
+LINK = re.compile(r'(https?://[^\s]+|linkedin\.com/[^\s]+|github\.com/[^\s]+)', re.IGNORECASE)
+NAME_LINE = re.compile(r'^([A-Z][a-z]+(?:\s[A-Z][a-z]+)+)')
+
+# Section headings with inline content ("Projects: a, b; c")
+ACHIEVEMENTS_SECTION = re.compile(
+    r'(?:^|\n)[•\-\*]?\s*(Achievements|Awards)\s*:?(.+)?', re.IGNORECASE)
+CERTIFICATIONS_SECTION = re.compile(
+    r'(?:^|\n)[•\-\*]?\s*(Certifications|Courses)\s*:?(.+)?', re.IGNORECASE)
+PROJECTS_SECTION = re.compile(
+    r'(?:^|\n)[•\-\*]?\s*(Projects|Project Experience)\s*:?(.+)?', re.IGNORECASE)
+EDUCATION_LINE = re.compile(
+    r"(?:^|\n)[•\-\*]?\s*Education\s*:\s*([^\n]+)", re.IGNORECASE)
+EXPERIENCE_HEADING = re.compile(r'\bexperience\b', re.IGNORECASE)
+
+# Separators for splitting inline section content into items
+LIST_SEPARATOR = re.compile(r',|;|\n')
+ENTRY_SEPARATOR = re.compile(r",|;")
+
+YEAR = re.compile(r"\b(19|20)\d{2}\b")
+
+# Quantified achievement used by quality scoring and red-flag detection
+QUANTIFIED_ACHIEVEMENT = re.compile(r'\b\d+%|\$\d+|\d+\s*(users|customers|projects|years)')
+
+# ATS quantifier patterns. The raw strings stay public because the ATS rule
+# table lists them; QUANTIFIERS holds them compiled for per-pattern counting
+# and ANY_QUANTIFIER merges them into one alternation for "any match" tests.
+QUANTIFIER_PATTERNS = [
+    r'\d+%', r'\$\d+', r'\d+\s*(million|thousand|k|m)', r'\d+\s*(users|customers|clients)',
+    r'\d+\s*(projects|teams|people)', r'\d+\s*(years|months)', r'\d+x\s*improvement',
+]
+QUANTIFIERS = [re.compile(pattern, re.IGNORECASE) for pattern in QUANTIFIER_PATTERNS]
+ANY_QUANTIFIER = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in QUANTIFIER_PATTERNS), re.IGNORECASE)
+
+# Keyword visualization tokens
+KEYWORD_TOKEN = re.compile(r'\b[a-zA-Z]{3,}\b')
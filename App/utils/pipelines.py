@@ -0,0 +1,109 @@
+"""Process-wide registry of loaded spaCy pipelines.
+
+Every analyzer in the app shares the pipelines held here, so each model is
+loaded at most once per process no matter how many analyzers or requests
+ask for it.
+"""
+import logging
+import os
+import threading
+import time
+
+import spacy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PIPELINE = "en_core_web_sm"
+
+_pipelines = {}
+_stats = {}
+_lock = threading.Lock()
+
+
+def _resident_memory() -> int:
+    """Return the current resident set size of this process in bytes (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # ru_maxrss is a peak value in kilobytes on Linux; good enough as a fallback.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def get_pipeline(name: str = DEFAULT_PIPELINE):
+    """
+    Return the shared spaCy pipeline for ``name``, loading it on first use.
+
+    Args:
+        name: spaCy package name or path of the pipeline
+
+    Returns:
+        The loaded ``spacy.Language`` instance
+    """
+    nlp = _pipelines.get(name)
+    if nlp is not None:
+        return nlp
+
+    with _lock:
+        nlp = _pipelines.get(name)
+        if nlp is None:
+            rss_before = _resident_memory()
+            started = time.perf_counter()
+            nlp = spacy.load(name)
+            load_seconds = time.perf_counter() - started
+            rss_after = _resident_memory()
+
+            _stats[name] = {
+                "load_seconds": round(load_seconds, 3),
+                "rss_bytes": rss_after,
+                "rss_delta_bytes": max(0, rss_after - rss_before),
+            }
+            _pipelines[name] = nlp
+            logger.info(
+                "Loaded spaCy pipeline %s in %.3fs (+%.1f MB resident)",
+                name, load_seconds, _stats[name]["rss_delta_bytes"] / (1024 * 1024),
+            )
+    return nlp
+
+
+def is_loaded(name: str = DEFAULT_PIPELINE) -> bool:
+    """Return True if ``name`` has already been loaded in this process."""
+    return name in _pipelines
+
+
+def pipeline_stats() -> dict:
+    """Return load time and memory figures for every pipeline loaded so far."""
+    return {name: dict(stats) for name, stats in _stats.items()}
+
+
+class LazyPipeline:
+    """
+    Callable stand-in for a spaCy pipeline that defers loading to first use.
+
+    Calling it or reading any attribute resolves the shared instance from
+    the registry, so importing modules that hold one stays cheap.
+    """
+
+    def __init__(self, name: str = DEFAULT_PIPELINE):
+        self.name = name
+
+    def resolve(self):
+        return get_pipeline(self.name)
+
+    def __call__(self, text, *args, **kwargs):
+        return self.resolve()(text, *args, **kwargs)
+
+    def __getattr__(self, attr):
+        # Keep introspection (copy, pickle, mock, inspect) from triggering a
+        # model load; only the pipeline's public API is forwarded.
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self):
+        return f"<LazyPipeline {self.name!r} loaded={is_loaded(self.name)}>"
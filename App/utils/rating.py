@@ -8,7 +8,7 @@ New code should prefer importing directly from submodules:
 - From extractors: get_personal_info, extract_education_section, etc.
 - From scorers: tech_skills_score, calculate_quality_score
 - From validators: detect_red_flags
-- From calculator: calculate_resume_score
+- From calculator: calculate_resume_score, calculate_resume_scores
 """
 
 # Import common components first
@@ -16,6 +16,7 @@ from . import common
 
 # Import all public functions for backward compatibility
 from .common import normalize_text, get_nlp, get_tool
+from .context import AnalysisContext, as_context
 
 from .extractors import (
     get_personal_info,
@@ -34,7 +35,7 @@ from .scorers import (
 
 from .validators import detect_red_flags
 
-from .calculator import calculate_resume_score
+from .calculator import calculate_resume_score, calculate_resume_scores
 
 # Expose module-level instances for patching in tests
 nlp = common.nlp
@@ -44,6 +45,8 @@ __all__ = [
     'normalize_text',
     'get_nlp',
     'get_tool',
+    'AnalysisContext',
+    'as_context',
     'get_personal_info',
     'extract_education_section',
     'extract_experience',
@@ -55,6 +58,7 @@ __all__ = [
     'calculate_quality_score',
     'detect_red_flags',
     'calculate_resume_score',
+    'calculate_resume_scores',
     'nlp',
     'tool',
 ]
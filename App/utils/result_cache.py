@@ -0,0 +1,322 @@
+"""Content-addressed cache for analysis results.
+
+Results are keyed by the SHA-256 of the resume text, the target position and
+the current scoring-rules version, so re-uploading the same resume (or the
+same resume for another position) never recomputes work that was already
+done. The cache has an in-process LRU tier and an optional persistent tier
+backed by any configured Django cache (e.g. a database cache on SQLite).
+"""
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever scoring logic changes in a way the rule tables don't capture.
+SCORING_RULES_VERSION = "1"
+# Persistent-tier key holding the cache generation shared by every process
+GENERATION_KEY = "analysis:generation"
+# How long a process trusts its copy of the shared generation
+GENERATION_CHECK_SECONDS = 5
+
+_rule_fingerprints = {}
+_rules_lock = threading.Lock()
+_rules_version = None
+
+
+def _fingerprint(value) -> str:
+    payload = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def register_rules(name: str, table) -> None:
+    """
+    Register a rule table whose contents feed into the scoring-rules version.
+
+    Editing a registered table (skill lists, weights, keywords) changes the
+    version and therefore invalidates every cached result computed with the
+    old table. Tables are registered once, when their module is imported.
+
+    Args:
+        name: Unique name of the table
+        table: JSON-serializable rule table
+    """
+    global _rules_version
+    fingerprint = _fingerprint(table)
+    if _rule_fingerprints.get(name) == fingerprint:
+        return
+    with _rules_lock:
+        _rule_fingerprints[name] = fingerprint
+        _rules_version = None
+
+
+def rules_version() -> str:
+    """Return the current scoring-rules version used in cache keys."""
+    global _rules_version
+    version = _rules_version
+    if version is None:
+        with _rules_lock:
+            parts = {
+                "code": SCORING_RULES_VERSION,
+                "settings": getattr(settings, "SCORING_RULES_VERSION", ""),
+                "tables": _rule_fingerprints,
+            }
+            version = _rules_version = _fingerprint(parts)[:16]
+    return version
+
+
+def text_digest(text: str) -> str:
+    """Return the SHA-256 hex digest of ``text``."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used mapping.
+
+    Args:
+        maxsize: Maximum number of entries
+        max_bytes: Optional limit on the summed ``sizeof`` of the values
+        sizeof: Size of a value in bytes (``len`` by default); used with ``max_bytes``
+    """
+
+    def __init__(self, maxsize: int = 128, max_bytes: int = None, sizeof=len):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key, value) -> None:
+        if self.maxsize <= 0:
+            return
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._discard(key)
+            self._data[key] = value
+            self.bytes += size
+            while len(self._data) > self.maxsize or (
+                    self.max_bytes is not None and self.bytes > self.max_bytes):
+                self._discard(next(iter(self._data)))
+
+    def _discard(self, key) -> None:
+        value = self._data.pop(key)
+        if self.max_bytes is not None:
+            self.bytes -= self.sizeof(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+class AnalysisCache:
+    """
+    Two-tier cache for analysis results keyed by resume content.
+
+    The first tier is a per-process LRU sized by ``ANALYSIS_CACHE_SIZE``. When
+    ``ANALYSIS_CACHE_ALIAS`` names a Django cache, results are also written
+    there so they survive restarts and are shared between workers.
+
+    Keys include a generation that ``invalidate`` changes. With a persistent
+    tier the generation is a token stored there, so an invalidation reaches
+    every process using it (within ``GENERATION_CHECK_SECONDS``) and
+    survives restarts; a process that sees a new token drops its own LRU.
+    """
+
+    def __init__(self):
+        self._memory = None
+        self._generation = 0
+        self._shared_generation = None
+        self._generation_checked = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.persistent_hits = 0
+
+    @property
+    def memory(self) -> LRUCache:
+        if self._memory is None:
+            self._memory = LRUCache(getattr(settings, "ANALYSIS_CACHE_SIZE", 256))
+        return self._memory
+
+    @property
+    def persistent(self):
+        alias = getattr(settings, "ANALYSIS_CACHE_ALIAS", "")
+        if not alias:
+            return None
+        from django.core.cache import caches
+        return caches[alias]
+
+    def make_key(self, kind: str, text: str, position: str = None) -> str:
+        """Build the cache key for ``kind`` of analysis on ``text`` and ``position``."""
+        return "analysis:{}:{}:{}:{}:{}".format(
+            kind, rules_version(), self.generation(), position or "-", text_digest(text)
+        )
+
+    def generation(self) -> str:
+        """Current key generation: the shared token of the persistent tier, else a local counter."""
+        persistent = self.persistent
+        if persistent is None:
+            return str(self._generation)
+        now = time.monotonic()
+        token = self._shared_generation
+        if token is not None and now - self._generation_checked < GENERATION_CHECK_SECONDS:
+            return token
+        try:
+            current = persistent.get(GENERATION_KEY)
+            if current is None:
+                # First use, or the token was evicted: start a generation no entry has
+                persistent.add(GENERATION_KEY, uuid.uuid4().hex, None)
+                current = persistent.get(GENERATION_KEY)
+        except Exception:
+            logger.exception("Persistent analysis cache generation lookup failed")
+            current = None
+        if current is None:
+            # Unreachable tier: stay on the last token (or a local one) for now
+            return token or f"local-{self._generation}"
+        with self._lock:
+            if token is not None and current != token:
+                self.memory.clear()
+            self._shared_generation = current
+            self._generation_checked = now
+        return current
+
+    def get_or_compute(self, kind: str, text: str, position, compute):
+        """
+        Return the cached result for ``(kind, text, position)`` or compute it.
+
+        Args:
+            kind: Name of the analysis being cached
+            text: Resume text the result was computed from
+            position: Target position, or None for position-independent results
+            compute: Zero-argument callable producing the result on a miss
+
+        Returns:
+            A private copy of the result, safe for the caller to mutate
+        """
+        key = self.make_key(kind, text, position)
+        result = self._lookup(key)
+        if result is not None:
+            return result
+
+        self._count("misses")
+        result = compute()
+        stored = copy.deepcopy(result)
+        self.memory.set(key, stored)
+        persistent = self.persistent
+        if persistent is not None:
+            try:
+                persistent.set(key, stored, getattr(settings, "ANALYSIS_CACHE_TIMEOUT", None))
+            except Exception:
+                logger.exception("Persistent analysis cache write failed")
+        return result
+
+    def get(self, kind: str, text: str, position=None):
+        """
+        Return a copy of the cached result for ``(kind, text, position)``, or None.
+
+        Misses are not counted; callers that go on to compute the result
+        should do so through ``get_or_compute``.
+        """
+        return self._lookup(self.make_key(kind, text, position))
+
+    def _lookup(self, key: str):
+        result = self.memory.get(key)
+        if result is not None:
+            self._count("hits")
+            return copy.deepcopy(result)
+
+        persistent = self.persistent
+        if persistent is None:
+            return None
+        try:
+            result = persistent.get(key)
+        except Exception:
+            logger.exception("Persistent analysis cache lookup failed")
+            return None
+        if result is None:
+            return None
+        self._count("hits")
+        self._count("persistent_hits")
+        self.memory.set(key, result)
+        return copy.deepcopy(result)
+
+    def invalidate(self, clear_persistent: bool = False) -> None:
+        """
+        Drop every cached result, in every process.
+
+        The in-process tier is cleared and the key generation changes. With a
+        persistent tier the new generation is stored there, so entries already
+        written are never read again, by any process, even after a restart.
+        Without one, the analysis worker pool (which has its own in-memory
+        tiers) is restarted. Pass ``clear_persistent`` to also wipe the
+        persistent cache (only do this when its alias is dedicated to
+        analysis results).
+        """
+        with self._lock:
+            self._generation += 1
+            self._shared_generation = None
+        self.memory.clear()
+        persistent = self.persistent
+        if persistent is None:
+            from .analysis_pool import analysis_executor
+
+            if analysis_executor.enabled:
+                analysis_executor.shutdown()
+            return
+        try:
+            if clear_persistent:
+                persistent.clear()
+            persistent.set(GENERATION_KEY, uuid.uuid4().hex, None)
+        except Exception:
+            logger.exception("Persistent analysis cache invalidation failed")
+
+    def clear(self) -> None:
+        """Clear the in-process tier and reset the counters."""
+        self.memory.clear()
+        with self._lock:
+            self.hits = self.misses = self.persistent_hits = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and sizing information."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "persistent_hits": self.persistent_hits,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "size": len(self.memory),
+            "maxsize": self.memory.maxsize,
+            "rules_version": rules_version(),
+            "generation": self.generation(),
+        }
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+analysis_cache = AnalysisCache()
@@ -1,18 +1,19 @@
 """Content quality scoring."""
-import re
+from ..context import AnalysisContext, as_context
 
 
-def calculate_quality_score(resume_text: str) -> int:
+def calculate_quality_score(resume_text: str | AnalysisContext) -> int:
     """
     Calculate content quality score based on various content metrics.
 
     Args:
-        resume_text: The resume text to analyze
+        resume_text: The resume text (or AnalysisContext) to analyze
 
     Returns:
         Quality score (0-8 points)
     """
-    word_count = len(resume_text.split())
+    scan = as_context(resume_text).scan
+    word_count = scan.word_count
     quality_score = 0
 
     # Word count check
@@ -20,11 +21,11 @@ def calculate_quality_score(resume_text: str) -> int:
         quality_score += 3
 
     # Quantifiable achievements check
-    if re.search(r'\b\d+%|\$\d+|\d+\s*(users|customers|projects|years)', resume_text):
+    if scan.has_achievement:
         quality_score += 3
 
     # Structure check (multiple sections)
-    if len(resume_text.split('\n')) > 15:
+    if len(scan.lines) > 15:
         quality_score += 2
 
     return quality_score
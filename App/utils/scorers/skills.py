@@ -1,35 +1,38 @@
 """Technical skills extraction and scoring."""
-
-
-def tech_skills_score(resume_text: str) -> dict:
+from ..context import AnalysisContext, as_context
+from ..result_cache import register_rules
+
+# Comprehensive skill categories
+SKILL_CATEGORIES = {
+    "programming": ["python", "java", "javascript", "c++", "c#", "go", "rust", "swift", "kotlin", "php", "ruby", "scala", "r", "matlab"],
+    "web": ["html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring", "laravel"],
+    "database": ["sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "oracle", "sqlite"],
+    "cloud": ["aws", "azure", "gcp", "docker", "kubernetes", "terraform", "jenkins", "gitlab", "github actions"],
+    "data_science": ["pandas", "numpy", "scikit-learn", "tensorflow", "pytorch", "keras", "matplotlib", "seaborn", "tableau", "power bi"],
+    "tools": ["git", "jira", "confluence", "slack", "trello", "figma", "photoshop", "excel", "powerpoint"]
+}
+register_rules("scorers.skill_categories", SKILL_CATEGORIES)
+
+
+def tech_skills_score(resume_text: str | AnalysisContext) -> dict:
     """
     Score technical skills found in resume text.
 
     Args:
-        resume_text: The resume text to analyze
+        resume_text: The resume text (or AnalysisContext) to analyze
 
     Returns:
         Dictionary with score, skills by category, and total count
     """
-    text_lower = resume_text.lower()
-
-    # Comprehensive skill categories
-    skill_categories = {
-        "programming": ["python", "java", "javascript", "c++", "c#", "go", "rust", "swift", "kotlin", "php", "ruby", "scala", "r", "matlab"],
-        "web": ["html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring", "laravel"],
-        "database": ["sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "oracle", "sqlite"],
-        "cloud": ["aws", "azure", "gcp", "docker", "kubernetes", "terraform", "jenkins", "gitlab", "github actions"],
-        "data_science": ["pandas", "numpy", "scikit-learn", "tensorflow", "pytorch", "keras", "matplotlib", "seaborn", "tableau", "power bi"],
-        "tools": ["git", "jira", "confluence", "slack", "trello", "figma", "photoshop", "excel", "powerpoint"]
-    }
+    ctx = as_context(resume_text)
 
     found_skills = {}
     total_score = 0
 
-    for category, skills in skill_categories.items():
+    for category, skills in SKILL_CATEGORIES.items():
         found_skills[category] = []
         for skill in skills:
-            if skill in text_lower:
+            if ctx.mentions(skill):
                 found_skills[category].append(skill)
                 total_score += 2 if category in [
                     "programming", "database"] else 1
@@ -0,0 +1,165 @@
+"""Pre-fitted TF-IDF model for semantic job matching.
+
+Fitting a ``TfidfVectorizer`` on ``[resume, job_template]`` for every
+request costs a fit per comparison, and gives IDF weights from just two
+documents, so scores of different resumes are not comparable. Instead one
+vectorizer is fitted per process on a reference corpus
+(``data/semantic_corpus.txt``, or ``SEMANTIC_CORPUS_PATH``) plus every job
+template, and the template vectors are kept as L2-normalized sparse rows.
+A request only analyzes the resume once and takes sparse dot products.
+
+Resume terms missing from the vocabulary still count towards the resume's
+norm, weighted like a term no reference document contains, so a resume is
+not scored as if its unknown words were not there.
+"""
+import hashlib
+import math
+import threading
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from django.conf import settings
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "data" / "semantic_corpus.txt"
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def read_corpus(path) -> list:
+    """Documents of a corpus file: blank-line separated, ``#`` lines are comments."""
+    documents, lines = [], []
+    for line in Path(path).read_text(encoding="utf-8").splitlines() + [""]:
+        if line.startswith("#"):
+            continue
+        if line.strip():
+            lines.append(line.strip())
+        elif lines:
+            documents.append(" ".join(lines))
+            lines = []
+    return documents
+
+
+class SemanticIndex:
+    """
+    TF-IDF vectorizer fitted once, with every job template's vector precomputed.
+
+    Args:
+        templates: Mapping of position -> job description text
+        corpus: Reference documents fitted together with the templates
+        default_position: Template used for positions missing from ``templates``
+    """
+
+    def __init__(self, templates: dict, corpus: list, default_position: str = None):
+        self.positions = list(templates)
+        self.default_position = default_position or self.positions[0]
+        self.vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
+        self.vectorizer.fit(list(corpus) + list(templates.values()))
+        self.analyzer = self.vectorizer.build_analyzer()
+        self.vocabulary = self.vectorizer.vocabulary_
+        self.idf = self.vectorizer.idf_
+        self.feature_names = self.vectorizer.get_feature_names_out()
+        # Smoothed IDF of a term no fitted document contains
+        self.unseen_idf = math.log((1 + len(corpus) + len(templates)) / 1) + 1
+        # (positions x vocabulary), rows L2-normalized
+        self.templates = sparse.csr_matrix(self.vectorizer.transform(list(templates.values())))
+        self._rows = {position: row for row, position in enumerate(self.positions)}
+
+    def row(self, position: str) -> int:
+        """Row of ``templates`` holding ``position``'s vector."""
+        return self._rows.get(position, self._rows[self.default_position])
+
+    def transform(self, text: str) -> sparse.csr_matrix:
+        """L2-normalized ``1 x vocabulary`` TF-IDF row of ``text``."""
+        counts = Counter(self.analyzer(text))
+        indices, weights = [], []
+        unseen = 0.0
+        for term, count in counts.items():
+            index = self.vocabulary.get(term)
+            if index is None:
+                unseen += (count * self.unseen_idf) ** 2
+            else:
+                indices.append(index)
+                weights.append(count * self.idf[index])
+        weights = np.asarray(weights, dtype=float)
+        norm = math.sqrt(float(weights @ weights) + unseen)
+        if norm:
+            weights /= norm
+        order = np.argsort(indices)
+        return sparse.csr_matrix(
+            (weights[order], np.asarray(indices, dtype=np.int32)[order], [0, len(indices)]),
+            shape=(1, len(self.vocabulary)),
+        )
+
+    def match(self, vector, positions, top: int = 10) -> list:
+        """
+        Similarity of a resume vector with each position's template, and the shared terms.
+
+        Args:
+            vector: Resume row from ``transform``
+            positions: Positions to compare with
+            top: Number of shared terms to return per position
+
+        Returns:
+            ``(similarity, top_terms)`` per position; terms are ranked by the
+            product of the two weights (ties in vocabulary order)
+        """
+        products = sparse.csr_matrix(self.templates[[self.row(p) for p in positions]].multiply(vector))
+        similarities = np.asarray(products.sum(axis=1)).ravel()
+        matches = []
+        for number, similarity in enumerate(similarities):
+            start, stop = products.indptr[number], products.indptr[number + 1]
+            data, indices = products.data[start:stop], products.indices[start:stop]
+            keep = data > 0
+            data, indices = data[keep], indices[keep]
+            ranked = indices[np.lexsort((indices, -data))][:top]
+            matches.append((float(similarity), [str(self.feature_names[index]) for index in ranked]))
+        return matches
+
+    def rank(self, vector) -> list:
+        """
+        Every position's similarity with a resume vector, best fit first.
+
+        All template rows are scored in one sparse matrix-vector product, so
+        ranking every position costs about as much as a single ``match``.
+
+        Returns:
+            ``(position, similarity)`` pairs, ties in template order
+        """
+        similarities = (self.templates @ vector.T).toarray().ravel()
+        order = np.lexsort((np.arange(len(similarities)), -similarities))
+        return [(self.positions[row], float(similarities[row])) for row in order]
+
+
+def corpus_path() -> Path:
+    """The reference corpus file: ``SEMANTIC_CORPUS_PATH`` or the bundled one."""
+    return Path(getattr(settings, "SEMANTIC_CORPUS_PATH", "") or DEFAULT_CORPUS)
+
+
+@lru_cache(maxsize=None)
+def _fingerprint(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def corpus_fingerprint() -> str:
+    """SHA-256 of the reference corpus, registered as a scoring rule by the analyzer."""
+    return _fingerprint(corpus_path())
+
+
+def get_semantic_index() -> SemanticIndex:
+    """Return the process-wide index over the job templates, fitting it on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                # Imported lazily: enchanced_paid imports this module
+                from .enchanced_paid import JOB_TEMPLATES
+
+                _index = SemanticIndex(JOB_TEMPLATES, read_corpus(corpus_path()),
+                                       default_position='software_engineer')
+    return _index
@@ -1,14 +1,17 @@
 """Resume validation - Detect red flags."""
-import re
-from ..common import normalize_text
+from ..context import AnalysisContext, as_context
+from .. import patterns
 
+ACTION_VERBS = ["managed", "developed", "built", "led", "created", "analyzed", "designed",
+                "initiated", "collaborated", "implemented", "achieved", "improved", "optimized"]
 
-def detect_red_flags(resume_text: str) -> list:
+
+def detect_red_flags(resume_text: str | AnalysisContext) -> list:
     """
     Detect red flags and issues in resume text.
 
     Args:
-        resume_text: The resume text to analyze
+        resume_text: The resume text (or AnalysisContext) to analyze
 
     Returns:
         List of red flag messages
@@ -16,9 +19,11 @@ def detect_red_flags(resume_text: str) -> list:
     # Import here to allow test mocking of rating.tool
     from .. import rating
 
+    ctx = as_context(resume_text)
+    resume_text = ctx.text
     red_flags = []
-    text = normalize_text(resume_text)
-    word_count = len(resume_text.split())
+    scan = ctx.scan
+    word_count = scan.word_count
 
     # Length issues
     if word_count < 150:
@@ -27,17 +32,15 @@ def detect_red_flags(resume_text: str) -> list:
         red_flags.append("Resume too long (> 800 words)")
 
     # Action verbs
-    action_verbs = ["managed", "developed", "built", "led", "created", "analyzed", "designed",
-                    "initiated", "collaborated", "implemented", "achieved", "improved", "optimized"]
-    if not any(verb in text for verb in action_verbs):
+    if not scan.has_group("strong_verbs"):
         red_flags.append("Lacks strong action verbs")
 
     # Quantifiable achievements
-    if not re.search(r'\b\d+%|\$\d+|\d+\s*(users|customers|projects|years)', text):
+    if not scan.has_achievement:
         red_flags.append("Missing quantified achievements")
 
     # Contact information
-    if not re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', resume_text):
+    if not patterns.EMAIL.search(resume_text):
         red_flags.append("Missing email address")
 
     # Grammar issues (basic)
@@ -48,7 +51,7 @@ def detect_red_flags(resume_text: str) -> list:
             f"Multiple grammar issues detected ({len(grammar_issues)})")
 
     # Formatting issues
-    if resume_text.count('\n\n') < 2:
+    if scan.double_newlines < 2:
         red_flags.append("Poor formatting - lacks proper spacing")
 
     return red_flags
@@ -1,6 +1,6 @@
 from django.shortcuts import render
 from django.http import JsonResponse
-from .utils.rating import calculate_resume_score
+from .utils.analysis_pool import resume_score_job, run_analysis
 
 def Home(request):
     """Legacy home view"""
@@ -21,6 +21,6 @@ def rating_result(request):
     if request.method == 'POST':
         resume_text = request.POST.get('resume_text', '')
         if resume_text:
-            analysis = calculate_resume_score(resume_text)
+            analysis = run_analysis(resume_score_job, resume_text)
             return JsonResponse(analysis)
     return JsonResponse({'error': 'No resume text provided'})
\ No newline at end of file
@@ -0,0 +1,22 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_POST
+
+from .batch_scoring import NDJSON_CONTENT_TYPE, ndjson_lines, score_files
+
+
+@staff_member_required
+@require_POST
+def score_batch(request):
+    """Score every uploaded resume (PDF, DOCX or zip of them), streamed as NDJSON; staff only.
+
+    Scripted bulk jobs should run ``manage.py score_resumes`` on the server instead.
+    """
+    files = request.FILES.getlist("resumes")
+    if not files:
+        return JsonResponse({"error": "Upload one or more files as 'resumes'."}, status=400)
+
+    response = StreamingHttpResponse(ndjson_lines(score_files(files)), content_type=NDJSON_CONTENT_TYPE)
+    # Let proxies pass each line through as soon as it is scored
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,36 @@
+import logging
+from concurrent.futures import CancelledError, TimeoutError
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+
+from .utils.chart_jobs import chart_jobs
+
+logger = logging.getLogger(__name__)
+
+
+def chart_image(request, analysis_id, chart_name):
+    """Serve one chart rendered in the background; 503 + Retry-After while it is still rendering"""
+    future = chart_jobs.get(analysis_id, chart_name)
+    if future is None:
+        raise Http404("Unknown chart")
+
+    try:
+        # Only a short wait: a blocked request thread would stall every other request
+        png = future.result(timeout=getattr(settings, "CHART_WAIT_SECONDS", 0.25))
+    except TimeoutError:
+        response = HttpResponse("Chart is still rendering", status=503, content_type="text/plain")
+        response["Retry-After"] = "1"
+        return response
+    except CancelledError:
+        raise Http404("Chart expired")
+    except Exception:
+        logger.exception("Failed to render chart %s", chart_name)
+        raise Http404("Chart could not be rendered")
+
+    if not png:
+        raise Http404("Chart unavailable")
+
+    response = HttpResponse(png, content_type="image/png")
+    response["Cache-Control"] = "private, max-age=3600"
+    return response
@@ -1,12 +1,16 @@
 import logging
-import os
 
 from django.http import JsonResponse
 from django.shortcuts import render
 
-from .models.recieve import extract_text_from_docx, extract_text_from_pdf
-from .models.resume import Resume
+from .models.analysis import store_analysis
+from .models.recieve import DocumentTooLarge, UnsupportedDocument, ingest_upload
+from .utils.analysis_pool import AnalysisTimeout, position_analysis_job, run_analysis
+from .utils.chart_jobs import chart_mode
 from .utils.dashgen import ResumeDashboard
+from .views_resumes import (
+    DEFAULT_POSITION, current_analysis, remember_resume, requested_position, unknown_position,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,34 +25,24 @@ def comprehensive_analysis(request):
 
     try:
         resume_file = request.FILES.get("resume")
-        position = request.POST.get("position", "software_engineer")
+        position = requested_position(request.POST) or DEFAULT_POSITION
         
         if resume_file:
-            # Extract text
-            ext = os.path.splitext(resume_file.name)[1].lower()
-            if ext == ".pdf":
-                text = extract_text_from_pdf(resume_file)
-            elif ext == ".docx":
-                text = extract_text_from_docx(resume_file)
-            else:
-                return render(request, "dashboard_home.html", {
-                    "error": "Unsupported file format. Please upload a PDF or DOCX file."
-                })
-            
-            # Save resume
-            resume = Resume.objects.create(
-                filename=resume_file.name,
-                text=text,
-                uploaded_file=resume_file
-            )
-            
-            # Generate comprehensive dashboard
-            dashboard = ResumeDashboard()
-            dashboard_data = dashboard.generate_comprehensive_dashboard(text, position)
-            
+            resume, ctx = ingest_upload(resume_file)
+            remember_resume(request, resume)
+
+            # Analyze with the layout-detected sections (on the worker pool
+            # when ANALYSIS_WORKERS is set), then chart it
+            analysis = run_analysis(position_analysis_job, ctx, ctx.blocks, position)
+            dashboard = ResumeDashboard(chart_mode=chart_mode(request))
+            dashboard_data = dashboard.generate_comprehensive_dashboard(ctx.text, position, analysis=analysis)
+            # Stored for the JSON API, which serves it without recomputing
+            store_analysis(resume, position, dashboard_data["analysis"])
+
             context = {
                 "resume": resume,
                 "dashboard_data": dashboard_data,
+                "chart_specs": dashboard_data.get("chart_specs"),
                 "position": position.replace('_', ' ').title()
             }
             
@@ -57,6 +51,17 @@ def comprehensive_analysis(request):
             return render(request, "dashboard_home.html", {
                 "error": "No file uploaded."
             })
+    except UnsupportedDocument as exc:
+        return render(request, "dashboard_home.html", {"error": str(exc)})
+    except DocumentTooLarge as exc:
+        return render(request, "dashboard_home.html", {
+            "error": f"{exc} Please upload a shorter resume."
+        })
+    except AnalysisTimeout:
+        logger.warning("Dashboard analysis timed out")
+        return render(request, "dashboard_home.html", {
+            "error": "The analysis is taking longer than usual. Please try again in a minute."
+        })
     except Exception:
         logger.exception("Failed to generate comprehensive dashboard")
         return render(request, "dashboard_home.html", {
@@ -65,27 +70,27 @@ def comprehensive_analysis(request):
 
 def get_dashboard_api(request):
     """API endpoint for dashboard data"""
-    resume = Resume.objects.order_by('-uploaded_at').first()
-    position = request.GET.get('position', 'software_engineer')
-    
-    if resume:
-        dashboard = ResumeDashboard()
-        dashboard_data = dashboard.generate_comprehensive_dashboard(resume.text, position)
-        
-        # Convert to JSON-serializable format
-        api_data = {
-            'overall_score': dashboard_data['analysis']['position_score']['weighted_score'],
-            'grade': dashboard_data['analysis']['position_score']['grade'],
-            'position': position,
-            'skills_analysis': dashboard_data['analysis']['skills_analysis'],
-            'suggestions_count': {
-                'critical': len(dashboard_data['analysis']['suggestions']['critical']),
-                'important': len(dashboard_data['analysis']['suggestions']['important']),
-                'nice_to_have': len(dashboard_data['analysis']['suggestions']['nice_to_have'])
-            },
-            'section_scores': dashboard_data['analysis']['base_analysis']
-        }
-        
-        return JsonResponse(api_data)
-    
-    return JsonResponse({'error': 'No resume found'})
+    position = requested_position(request.GET)
+    if position is None:
+        return unknown_position()
+
+    # Served from the analysis stored on upload; computed only if missing or stale
+    analysis = current_analysis(request, position)
+    if analysis is None:
+        return JsonResponse({'error': 'No resume found'})
+
+    # Convert to JSON-serializable format
+    api_data = {
+        'overall_score': analysis['position_score']['weighted_score'],
+        'grade': analysis['position_score']['grade'],
+        'position': position,
+        'skills_analysis': analysis['skills_analysis'],
+        'suggestions_count': {
+            'critical': len(analysis['suggestions']['critical']),
+            'important': len(analysis['suggestions']['important']),
+            'nice_to_have': len(analysis['suggestions']['nice_to_have'])
+        },
+        'section_scores': analysis['base_analysis']
+    }
+
+    return JsonResponse(api_data)
@@ -1,13 +1,25 @@
 import logging
-import os
 
+from django.contrib.admin.views.decorators import staff_member_required
 from django.http import JsonResponse
 from django.shortcuts import render
 
-from .models.recieve import extract_text_from_docx, extract_text_from_pdf
-from .models.resume import Resume
+from .models.analysis import store_analysis
+from .resume_search import get_search_index
+from .models.recieve import DocumentTooLarge, UnsupportedDocument, ingest_upload
 from .utils.enhana import EnhancedResumeAnalyzer
 from .utils.enchanced_paid import AdvancedResumeAnalyzer
+from .utils.analysis_pool import (
+    AnalysisTimeout, analysis_executor, best_fit_positions_job, enhanced_analysis_job, position_comparison_job,
+    run_analysis,
+)
+from .utils.chart_jobs import CLIENT, chart_mode
+from .utils.pipelines import pipeline_stats
+from .utils.result_cache import analysis_cache
+from .views_resumes import (
+    DEFAULT_POSITION, analysis_payload, current_analysis, current_resume, remember_resume, requested_position,
+    unknown_position,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,45 +33,31 @@ def enhanced_analysis(request):
     if request.method == "POST":
         try:
             resume_file = request.FILES.get("resume")
-            position = request.POST.get("position", "software_engineer")
+            position = requested_position(request.POST) or DEFAULT_POSITION
 
             if resume_file:
-                # Extract text
-                ext = os.path.splitext(resume_file.name)[1].lower()
-                if ext == ".pdf":
-                    text = extract_text_from_pdf(resume_file)
-                elif ext == ".docx":
-                    text = extract_text_from_docx(resume_file)
-                else:
-                    return render(request, "enhanced.html", {
-                        "error": "Unsupported file format. Please upload a PDF or DOCX file."
-                    })
-
-                # Save resume
-                resume = Resume.objects.create(
-                    filename=resume_file.name,
-                    text=text,
-                    uploaded_file=resume_file
-                )
-
-                # Analyze with advanced analyzer for precision
-                advanced_analyzer = AdvancedResumeAnalyzer()
-                advanced_analysis = advanced_analyzer.comprehensive_analysis(text, position)
+                resume, ctx = ingest_upload(resume_file)
+                remember_resume(request, resume)
 
-                # Also get enhanced analysis for charts
-                analyzer = EnhancedResumeAnalyzer()
-                analysis = analyzer.analyze_for_position(text, position)
+                # Advanced and position analysis, sharing one parse (on the
+                # analysis worker pool when ANALYSIS_WORKERS is set)
+                analysis, advanced_analysis = run_analysis(
+                    enhanced_analysis_job, ctx, ctx.blocks, position)
+                # Stored for the JSON APIs, which serve it without recomputing
+                store_analysis(resume, position, analysis)
 
                 # Merge analyses
                 analysis["advanced"] = advanced_analysis
 
-                # Generate charts
-                charts = analyzer.generate_charts(analysis["charts_data"])
+                # Generate charts (images, or specs the browser draws in client mode)
+                mode = chart_mode(request)
+                charts = EnhancedResumeAnalyzer().generate_charts(analysis["charts_data"], mode)
 
                 context = {
                     "resume": resume,
                     "analysis": analysis,
-                    "charts": charts,
+                    "charts": {} if mode == CLIENT else charts,
+                    "chart_specs": charts if mode == CLIENT else None,
                     "position": position.replace("_", " ").title(),
                 }
 
@@ -68,6 +66,17 @@ def enhanced_analysis(request):
             return render(request, "enhanced.html", {
                 "error": "No file uploaded."
             })
+        except UnsupportedDocument as exc:
+            return render(request, "enhanced.html", {"error": str(exc)})
+        except DocumentTooLarge as exc:
+            return render(request, "enhanced.html", {
+                "error": f"{exc} Please upload a shorter resume."
+            })
+        except AnalysisTimeout:
+            logger.warning("Enhanced analysis timed out")
+            return render(request, "enhanced.html", {
+                "error": "The analysis is taking longer than usual. Please try again in a minute."
+            })
         except Exception:
             logger.exception("Failed to generate enhanced analysis")
             return render(request, "enhanced.html", {
@@ -79,30 +88,21 @@ def enhanced_analysis(request):
 
 def get_analysis_data(request):
     """API endpoint for getting analysis data as JSON"""
-    resume = Resume.objects.order_by("-uploaded_at").first()
-    position = request.GET.get("position", "software_engineer")
+    position = requested_position(request.GET)
+    if position is None:
+        return unknown_position()
 
-    if resume:
-        analyzer = EnhancedResumeAnalyzer()
-        analysis = analyzer.analyze_for_position(resume.text, position)
+    # Served from the analysis stored on upload; computed only if missing or stale
+    analysis = current_analysis(request, position)
+    if analysis is None:
+        return JsonResponse({"error": "No resume found"})
 
-        # Convert to JSON-serializable format
-        json_data = {
-            "overall_score": analysis["position_score"]["weighted_score"],
-            "grade": analysis["position_score"]["grade"],
-            "skills_match": analysis["skills_analysis"],
-            "suggestions": analysis["suggestions"],
-            "charts_data": analysis["charts_data"],
-        }
-
-        return JsonResponse(json_data)
-
-    return JsonResponse({"error": "No resume found"})
+    return JsonResponse(analysis_payload(analysis))
 
 
 def compare_positions(request):
     """Compare resume against multiple positions"""
-    resume = Resume.objects.order_by("-uploaded_at").first()
+    resume = current_resume(request, with_text=True)
 
     if resume:
         try:
@@ -114,9 +114,10 @@ def compare_positions(request):
                 "marketing_manager",
             ]
 
+            # Position-independent work is done once for all positions
+            analyses = run_analysis(position_comparison_job, resume.text, None, positions)
             comparisons = {}
-            for position in positions:
-                analysis = advanced_analyzer.comprehensive_analysis(resume.text, position)
+            for position, analysis in analyses.items():
                 skill_analysis = analysis["skill_analysis"]
                 position_skills = advanced_analyzer.skill_databases.get(
                     position, advanced_analyzer.skill_databases["software_engineer"]
@@ -144,8 +145,14 @@ def compare_positions(request):
                     "skill_count": skill_analysis["total_skills"],
                 }
 
+            # One sparse product against every position's template
+            best_positions = run_analysis(best_fit_positions_job, resume.text, None, 3)
+            for best in best_positions:
+                best["label"] = best["position"].replace("_", " ").title()
+
             return render(request, "poscom.html", {
                 "comparisons": comparisons,
+                "best_positions": best_positions,
                 "resume": resume,
             })
         except Exception:
@@ -157,3 +164,14 @@ def compare_positions(request):
     return render(request, "enhanced.html", {
         "error": "No resume found for comparison"
     })
+
+
+@staff_member_required
+def analysis_stats(request):
+    """Analysis worker pool, result cache, spaCy pipeline and search index statistics"""
+    return JsonResponse({
+        "executor": analysis_executor.stats(),
+        "cache": analysis_cache.stats(),
+        "pipelines": pipeline_stats(),
+        "search": get_search_index().stats(),
+    })
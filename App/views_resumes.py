@@ -0,0 +1,143 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import require_http_methods
+
+from .models.analysis import latest_resume_pk, position_analysis, stored_analysis_result
+from .models.resume import Resume
+from .resume_search import search_resumes
+from .utils.analysis_pool import AnalysisTimeout, best_fit_positions_job, run_analysis
+from .utils.enhana import JOB_REQUIREMENTS
+
+# Session key holding the id of the resume this visitor uploaded last
+SESSION_RESUME_KEY = "resume_id"
+DEFAULT_POSITION = "software_engineer"
+
+
+def requested_position(params):
+    """The ``position`` parameter (default software_engineer), or None if it is not a known position"""
+    position = params.get("position", DEFAULT_POSITION)
+    return position if position in JOB_REQUIREMENTS else None
+
+
+def unknown_position():
+    """400 response for a ``position`` outside JOB_REQUIREMENTS"""
+    return JsonResponse({"error": f"Unknown position; choose one of: {', '.join(JOB_REQUIREMENTS)}"},
+                        status=400)
+
+def remember_resume(request, resume):
+    """Make ``resume`` the one this visitor's follow-up requests refer to"""
+    request.session[SESSION_RESUME_KEY] = resume.pk
+
+
+def current_resume_ref(request):
+    """This visitor's resume id; staff without one get a subquery for the latest upload, others None"""
+    resume_id = request.session.get(SESSION_RESUME_KEY)
+    if resume_id is not None:
+        return resume_id
+    return latest_resume_pk() if request.user.is_staff else None
+
+
+def current_resume(request, with_text=False):
+    """This visitor's resume (staff: else the latest upload); text and layout load lazily unless ``with_text``"""
+    resumes = Resume.objects.with_text() if with_text else Resume.objects.all()
+    resume_id = request.session.get(SESSION_RESUME_KEY)
+    if resume_id is not None:
+        resume = resumes.filter(pk=resume_id).first()
+        if resume is not None:
+            return resume
+    # Anyone else's upload is only shown to staff, as with owns_resume
+    return resumes.order_by("-uploaded_at").first() if request.user.is_staff else None
+
+
+def owns_resume(request, resume_id):
+    """Whether this visitor may read ``resume_id``: their own upload, or any resume for staff"""
+    return request.session.get(SESSION_RESUME_KEY) == resume_id or request.user.is_staff
+
+
+def current_analysis(request, position):
+    """Stored (or, if missing, freshly computed) analysis of this visitor's resume, or None"""
+    resume_ref = current_resume_ref(request)
+    if resume_ref is None:
+        return None
+    result = stored_analysis_result(resume_ref, position)
+    if result is None:
+        resume = current_resume(request)
+        if resume is None:
+            return None
+        result = position_analysis(resume, position)
+    return result
+
+
+def analysis_payload(analysis):
+    """JSON body of the analysis APIs"""
+    return {
+        "overall_score": analysis["position_score"]["weighted_score"],
+        "grade": analysis["position_score"]["grade"],
+        "skills_match": analysis["skills_analysis"],
+        "suggestions": analysis["suggestions"],
+        "charts_data": analysis["charts_data"],
+    }
+
+
+def resume_analysis(request, resume_id):
+    """Position analysis of one resume, served from the stored result when there is one"""
+    if not owns_resume(request, resume_id):
+        raise Http404("No such resume.")
+    position = requested_position(request.GET)
+    if position is None:
+        return unknown_position()
+
+    analysis = stored_analysis_result(resume_id, position)
+    if analysis is None:
+        resume = get_object_or_404(Resume, pk=resume_id)
+        analysis = position_analysis(resume, position)
+
+    return JsonResponse({"resume_id": resume_id, "position": position, **analysis_payload(analysis)})
+
+
+def resume_best_positions(request, resume_id):
+    """Positions ranked by how well one resume fits them (``?top=`` limits the list)"""
+    if not owns_resume(request, resume_id):
+        raise Http404("No such resume.")
+    try:
+        top = int(request.GET["top"]) if "top" in request.GET else None
+    except ValueError:
+        return JsonResponse({"error": "top must be an integer"}, status=400)
+    if top is not None and top < 1:
+        return JsonResponse({"error": "top must be at least 1"}, status=400)
+
+    resume = get_object_or_404(Resume.objects.with_text(), pk=resume_id)
+    try:
+        positions = run_analysis(best_fit_positions_job, resume.text, None, top)
+    except AnalysisTimeout:
+        return JsonResponse({"error": "Analysis took too long; please try again."}, status=503)
+
+    return JsonResponse({
+        "resume_id": resume_id,
+        "best_position": positions[0]["position"] if positions else None,
+        "positions": positions,
+    })
+
+
+# Most hits one search returns
+SEARCH_MAX_RESULTS = 100
+
+
+@staff_member_required
+@require_http_methods(["GET", "POST"])
+def resume_search(request):
+    """Stored resumes ranked against a job description (``q``; ``top``; comma-separated ``skills``)"""
+    params = request.POST if request.method == "POST" else request.GET
+    query = params.get("q", "").strip()
+    if not query:
+        return JsonResponse({"error": "Provide a job description as q"}, status=400)
+    try:
+        top = int(params.get("top", 10))
+    except ValueError:
+        return JsonResponse({"error": "top must be an integer"}, status=400)
+    if not 1 <= top <= SEARCH_MAX_RESULTS:
+        return JsonResponse({"error": f"top must be between 1 and {SEARCH_MAX_RESULTS}"}, status=400)
+    skills = [skill.strip() for skill in params.get("skills", "").split(",") if skill.strip()]
+
+    return JsonResponse({"top": top, "skills": skills, "results": search_resumes(query, top, skills)})
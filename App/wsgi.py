@@ -14,3 +14,20 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "App.settings")
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.PRELOAD_NLP:
+    # Load the shared spaCy pipeline and fit the semantic matcher while the
+    # worker boots instead of on the first upload it serves.
+    from App.utils.pipelines import get_pipeline  # noqa: E402
+    from App.utils.semantic import get_semantic_index  # noqa: E402
+
+    get_pipeline()
+    get_semantic_index()
+
+if settings.ANALYSIS_WORKERS:
+    # Start the analysis worker processes (each loads spaCy) before serving.
+    from App.utils.analysis_pool import analysis_executor  # noqa: E402
+
+    analysis_executor.start()
@@ -0,0 +1,93 @@
+"""Benchmark: scoring resumes one by one vs in spaCy batches.
+
+"loop" calls calculate_resume_score once per resume, so spaCy parses each
+text with its own ``nlp(text)`` call. "pipe" is calculate_resume_scores,
+which parses them with ``nlp.pipe``. The result cache is cleared before
+every run so each resume is really scored. Resumes are varied so that no
+two texts are identical.
+
+    python benchmarks/batch_scoring.py [--resumes 200] [--batch-size 32] [--n-process 1]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "App.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from App.utils import rating  # noqa: E402
+from App.utils.result_cache import analysis_cache  # noqa: E402
+
+RESUME = """Jane Doe {number}
+jane.doe{number}@example.com | +1 555 010 {number:04d} | linkedin.com/in/janedoe{number}
+
+Summary
+Backend engineer with {years} years of experience building Python services.
+
+Experience
+Senior Software Engineer, Acme Corp (2019 - 2023)
+- Led migration of {number} services to Kubernetes, cutting deploy time by 35%
+- Built a Django API serving 2M requests per day with PostgreSQL and Redis
+Software Engineer, Initech (2016 - 2019)
+- Improved test coverage from 40% to 85% across 12 repositories
+
+Projects
+Resume Rater: NLP scoring with spaCy and scikit-learn
+Chat Service: WebSocket server in Go handling 50k concurrent users
+
+Education
+B.Sc. Computer Science, State University, 2016
+
+Skills
+Python, Django, Flask, AWS, Docker, Kubernetes, SQL, Git, React
+
+Certifications
+AWS Certified Solutions Architect
+"""
+
+
+def make_resumes(count):
+    return [RESUME.format(number=number, years=3 + number % 10) for number in range(count)]
+
+
+def loop(texts, args):
+    for text in texts:
+        rating.calculate_resume_score(text)
+
+
+def pipe(texts, args):
+    for _ in rating.calculate_resume_scores(texts, batch_size=args.batch_size,
+                                            n_process=args.n_process):
+        pass
+
+
+def timed(func, texts, args):
+    analysis_cache.clear()
+    start = time.perf_counter()
+    func(texts, args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    texts = make_resumes(args.resumes)
+    # Load the pipeline and build the matchers outside the timings
+    rating.calculate_resume_score("warm up")
+
+    slow, fast = timed(loop, texts, args), timed(pipe, texts, args)
+    print(f"{'resumes':>8} {'loop s':>8} {'pipe s':>8} {'resumes/s (pipe)':>17} {'speedup':>8}")
+    print(f"{args.resumes:>8} {slow:8.2f} {fast:8.2f} {args.resumes / fast:17.1f} {slow / fast:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
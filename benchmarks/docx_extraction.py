@@ -0,0 +1,85 @@
+"""Benchmark: DOCX extraction with python-docx vs the streaming XML reader.
+
+"python-docx" is the previous extraction: load the package into the
+python-docx object model and walk paragraphs and tables, reading style,
+bold and size for each paragraph. "streaming" is App.utils.docx_xml, which
+iterparses word/document.xml directly. Documents mix headings, bullet
+paragraphs with bold runs, and a table every 50 paragraphs.
+
+    python benchmarks/docx_extraction.py [--paragraphs 100 1000 5000]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import docx  # noqa: E402
+from docx.table import Table  # noqa: E402
+
+from App.utils import docx_xml  # noqa: E402
+
+BULLET = "Led migration of 40 services to Kubernetes, cutting deploy time by 35%"
+
+
+def make_docx(paragraphs):
+    doc = docx.Document()
+    doc.add_heading("Jane Doe", 0)
+    for number in range(paragraphs):
+        if number % 50 == 0:
+            doc.add_heading(f"Section {number // 50}", 1)
+            table = doc.add_table(rows=3, cols=3)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = "Python"
+        paragraph = doc.add_paragraph(style="List Bullet")
+        paragraph.add_run("Acme Corp: ").bold = True
+        paragraph.add_run(f"{BULLET} ({number}).")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def python_docx(data):
+    doc = docx.Document(io.BytesIO(data))
+    lines = []
+    for item in doc.iter_inner_content():
+        if isinstance(item, Table):
+            lines.extend(" | ".join(cell.text for cell in row.cells) for row in item.rows)
+            continue
+        style = item.style
+        runs = [run for run in item.runs if run.text.strip()]
+        [(run.bold, run.font.size or style.font.size) for run in runs]
+        lines.append(item.text)
+    return "".join(line + "\n" for line in lines)
+
+
+def streaming(data):
+    return docx_xml.read_docx(io.BytesIO(data))[0]
+
+
+def best_of(func, data, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+
+    print(f"{'paragraphs':>10} {'KB':>6} {'python-docx ms':>15} {'streaming ms':>13} {'speedup':>8}")
+    for paragraphs in args.paragraphs:
+        data = make_docx(paragraphs)
+        slow, fast = best_of(python_docx, data), best_of(streaming, data)
+        print(f"{paragraphs:>10} {len(data) // 1024:>6} {slow:15.1f} {fast:13.1f} {slow / fast:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
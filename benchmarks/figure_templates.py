@@ -0,0 +1,79 @@
+"""Benchmark: ms per chart with a fresh figure vs a reused figure template.
+
+"Fresh" builds the figure for every render (what each chart did before
+App.utils.figure_templates): construct axes and static artists, lay out,
+compute the tight bounding box and save. "Template" reuses one
+thread-local figure and only updates the data artists before saving.
+
+    python benchmarks/figure_templates.py [--renders 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "App.settings")
+os.environ.setdefault("MPLCONFIGDIR", "/tmp")
+
+import django  # noqa: E402
+
+django.setup()
+
+from App.utils import figure_templates  # noqa: E402
+from App.utils.dashgen import ResumeDashboard  # noqa: E402
+
+SCORES = [12.5, 48.0, 63.2, 77.7, 91.0]
+BASE = {'tech_skills_score': 8, 'experience_score': 7, 'education_score': 3, 'project_score': 9,
+        'certifications_score': 1, 'leadership_score': 4, 'red_flags': ['x']}
+SECTIONS = {'Personal Info': 5, 'Experience': 7, 'Projects': 9, 'Education': 3,
+            'Skills': 12, 'Achievements': 2, 'Certifications': 1}
+
+
+def charts(dashboard):
+    analyzer = dashboard.analyzer
+    return {
+        'dashboard gauge': (dashboard._build_advanced_gauge, (10, 6), dashboard._update_advanced_gauge,
+                            lambda score: score),
+        'dashboard radar': (dashboard._build_skills_radar, (10, 10), dashboard._update_radar,
+                            lambda score: [score / 10] + [5] * 6 + [score / 10]),
+        'progress bars': (dashboard._build_progress_bars, (10, 6), dashboard._update_progress_bars,
+                          lambda score: [score, 100 - score, 50, score / 2]),
+        'analysis gauge': (analyzer._build_gauge_chart, (8, 6), analyzer._update_gauge_chart,
+                           lambda score: score),
+        'analysis radar': (lambda fig: analyzer._build_radar_chart(fig, tuple(SECTIONS)), (8, 8),
+                           analyzer._update_radar_chart, lambda score: [score / 10] + [5] * 6 + [score / 10]),
+    }
+
+
+def per_chart_ms(render, renders):
+    start = time.perf_counter()
+    for i in range(renders):
+        render(SCORES[i % len(SCORES)])
+    return (time.perf_counter() - start) / renders * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=20)
+    args = parser.parse_args()
+
+    dashboard = ResumeDashboard()
+    print(f"{'chart':>16} {'fresh ms':>10} {'template ms':>12} {'speedup':>8}")
+    for name, (build, figsize, update, data) in charts(dashboard).items():
+        def fresh(score):
+            template = figure_templates.FigureTemplate(build, figsize, dpi=150, facecolor='white')
+            return template.render(update, data(score))
+
+        template = figure_templates.FigureTemplate(build, figsize, dpi=150, facecolor='white')
+
+        def reused(score):
+            return template.render(update, data(score))
+
+        fresh_ms = per_chart_ms(fresh, args.renders)
+        reused_ms = per_chart_ms(reused, args.renders)
+        print(f"{name:>16} {fresh_ms:10.1f} {reused_ms:12.1f} {fresh_ms / reused_ms:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
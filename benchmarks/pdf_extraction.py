@@ -0,0 +1,105 @@
+"""Benchmark: serial vs process-pool PDF text extraction by page count.
+
+Generates text-dense PDFs of increasing length with PyMuPDF and times the
+serial page walk that ``App.models.recieve`` uses against extraction of
+contiguous page ranges on 2 and 4 spawned workers, each reopening the file
+by path. Pools are started and warmed before timing, as a server's shared
+pool would be; the one-off start-up time is printed separately.
+
+This is the evidence for keeping extraction serial. Two runs on the
+single-core deployment host (best of 3, ms; serial / 2 workers / 4 workers):
+
+    pages  serial    2w    4w        pages  serial    2w    4w
+        5      13    17     -            5       7    15    16
+       40      61    74     -           20      24    30    33
+      160     339   361     -           40      48    61    59
+                                        60      74    81    79
+                                        80     143   121   122
+                                       160     259   209   228
+
+Starting the pools took 0.4-0.6 s (about a second per worker in the first
+run). The pool loses below about 80 pages, and the crossover moves from run
+to run. Past it, the gain is at most about 50 ms per document. That is less
+than the run-to-run noise, and a busy host would lose it to contention. The
+pool was dropped. Rerun this on a multi-core host before reconsidering it.
+
+    python benchmarks/pdf_extraction.py [--pages 5 10 20 40 80 160]
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import fitz
+
+LINE = "Led migration of 40 services to Kubernetes, cutting deploy time by 35% for 2M users. "
+
+
+def make_pdf(path, pages):
+    with fitz.open() as pdf:
+        for number in range(pages):
+            page = pdf.new_page()
+            body = "\n".join(f"{number}.{row} {LINE}" for row in range(45))
+            page.insert_textbox(page.rect + (36, 36, -36, -36), body, fontsize=8)
+        pdf.save(path)
+
+
+def serial(path):
+    with fitz.open(path, filetype="pdf") as pdf:
+        return "".join(page.get_text() for page in pdf)
+
+
+def page_range(path, start, stop):
+    with fitz.open(path, filetype="pdf") as pdf:
+        return "".join(pdf[number].get_text() for number in range(start, stop))
+
+
+def parallel(path, pages, pool, workers):
+    size = -(-pages // workers)
+    starts = range(0, pages, size)
+    ranges = pool.map(page_range, [path] * len(starts), starts, [min(start + size, pages) for start in starts])
+    return "".join(ranges)
+
+
+def best_of(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[5, 10, 20, 40, 80, 160])
+    args = parser.parse_args()
+
+    pools = {}
+    for workers in (2, 4):
+        start = time.perf_counter()
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+        list(pool.map(int, range(workers * 4)))
+        pools[workers] = pool
+        print(f"pool of {workers} started in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    print(f"{'pages':>6} {'serial ms':>10} {'2 workers':>10} {'4 workers':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.pages:
+            path = os.path.join(tmp, f"cv_{pages}.pdf")
+            make_pdf(path, pages)
+            expected = serial(path)
+            row = [best_of(lambda: serial(path))]
+            for workers, pool in pools.items():
+                assert parallel(path, pages, pool, workers) == expected
+                row.append(best_of(lambda pool=pool, workers=workers: parallel(path, pages, pool, workers)))
+            print(f"{pages:>6} {row[0]:10.1f} {row[1]:10.1f} {row[2]:10.1f}")
+
+    for pool in pools.values():
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
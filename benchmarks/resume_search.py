@@ -0,0 +1,93 @@
+"""Benchmark: job description search over many stored resumes.
+
+Synthetic resumes (sentences drawn from the semantic reference corpus) are
+vectorized in the shared TF-IDF model and loaded straight into a
+ResumeSearchIndex, as ``refresh`` would load their postings. Queries then
+go through ``ResumeSearchIndex.search`` (including its refresh query
+against an empty in-memory database). "rescore" is the alternative the
+index replaces: a semantic match of every resume against the description.
+
+    python benchmarks/resume_search.py [--resumes 20000] [--queries 20] [--top 10]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "App.settings")
+os.environ["DATABASE_URL"] = "sqlite://:memory:"
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+
+from App.resume_search import ResumeSearchIndex  # noqa: E402
+from App.utils.context import AnalysisContext  # noqa: E402
+from App.utils.semantic import corpus_path, get_semantic_index, read_corpus  # noqa: E402
+
+QUERIES = [
+    "Senior backend engineer: Python, Django, PostgreSQL, Docker and Kubernetes on AWS",
+    "Data scientist with machine learning, statistics, pandas and SQL experience",
+    "Product manager to own the roadmap, run user research and work with engineering",
+    "Digital marketing manager for SEO, content marketing and social media campaigns",
+]
+
+
+def make_resumes(count, seed=0):
+    rng = random.Random(seed)
+    sentences = [sentence.strip() + "." for document in read_corpus(corpus_path())
+                 for sentence in document.split(".") if sentence.strip()]
+    return [" ".join(rng.sample(sentences, 12)) for _ in range(count)]
+
+
+def entries(texts):
+    index = get_semantic_index()
+    for resume_id, text in enumerate(texts, start=1):
+        ctx = AnalysisContext(text)
+        vector = ctx.semantic_vector
+        terms = [(str(index.feature_names[column]), weight) for column, weight in zip(vector.indices, vector.data)]
+        yield resume_id, None, terms, [(skill, 1.0) for skill in ctx.skills]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--rescore", type=int, default=1000,
+                        help="Resumes to time the rescoring baseline on (extrapolated)")
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    texts = make_resumes(args.resumes)
+    started = time.perf_counter()
+    search_index = ResumeSearchIndex()
+    search_index.load(entries(texts))
+    search_index.search("warm up", top=1)
+    build = time.perf_counter() - started
+
+    queries = [QUERIES[number % len(QUERIES)] for number in range(args.queries)]
+    started = time.perf_counter()
+    for query in queries:
+        search_index.search(query, top=args.top)
+    per_query = (time.perf_counter() - started) / len(queries)
+
+    index = get_semantic_index()
+    sample = texts[:args.rescore]
+    started = time.perf_counter()
+    query = index.transform(QUERIES[0])
+    for text in sample:
+        index.transform(text).multiply(query).sum()
+    rescore = (time.perf_counter() - started) / len(sample) * args.resumes
+
+    print(f"{'resumes':>8} {'postings':>9} {'load s':>7} {'query ms':>9} {'rescore ms':>11} {'speedup':>8}")
+    print(f"{args.resumes:>8} {search_index.stats()['term_postings']:>9} {build:7.1f} {per_query * 1000:9.1f} "
+          f"{rescore * 1000:11.0f} {rescore / per_query:7.0f}x")
+
+
+if __name__ == "__main__":
+    main()